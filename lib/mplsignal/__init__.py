@@ -8,14 +8,44 @@ at creating signal processing-related plots.
 
 # Must import __version__ first to avoid errors importing this file during the build
 # process. See https://github.com/pypa/setuptools/issues/1724#issuecomment-627241822
-from ._version import __version__
-from .freq_plots import freqz, freqz_fir, freqz_tf, freqz_zpk
+try:
+    from ._version import __version__
+except ImportError:  # Source checkout without a build, which generates _version.py
+    __version__ = "0.0+UNKNOWN"
+from .freq_plots import (
+    FrequencyResponse,
+    ResponseCache,
+    freqs,
+    freqs_tf,
+    freqs_zpk,
+    freqz,
+    freqz_cic,
+    freqz_comb,
+    freqz_fir,
+    freqz_moving_average,
+    freqz_sos,
+    freqz_ss,
+    freqz_tf,
+    freqz_zpk,
+)
 from .plane_plots import zplane, zplane_tf
+from .system import DiscreteSystem
 
 __all__ = [
     '__version__',
+    'DiscreteSystem',
+    'FrequencyResponse',
+    'ResponseCache',
+    'freqs',
+    'freqs_tf',
+    'freqs_zpk',
     'freqz',
+    'freqz_cic',
+    'freqz_comb',
     'freqz_fir',
+    'freqz_moving_average',
+    'freqz_sos',
+    'freqz_ss',
     'freqz_tf',
     'freqz_zpk',
     'zplane',
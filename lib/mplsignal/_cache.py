@@ -0,0 +1,155 @@
+# Copyright (c) Oscar Gustafsson.
+# Distributed under the terms of the Modified BSD License.
+"""
+Cache of evaluated frequency responses.
+"""
+
+__all__ = [
+    "ResponseCache",
+]
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+
+class ResponseCache:
+    """
+    Bounded least-recently-used cache of evaluated frequency responses.
+
+    Pass an instance as the *cache* argument of the ``freq*``-functions to reuse
+    responses when the same filter is plotted repeatedly, e.g., in different
+    styles. Entries are keyed on the filter coefficients and the frequency grid.
+
+    Parameters
+    ----------
+    maxsize : int, default: 128
+        Maximum number of cached filters.
+    maxbytes : int, default: 268435456
+        Maximum total size in bytes of the cached arrays. Arrays larger than this
+        are not cached.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups that were served from the cache.
+    misses : int
+        Number of lookups that required evaluation.
+
+    Examples
+    --------
+    >>> from mplsignal.freq_plots import ResponseCache, freqz
+    >>> cache = ResponseCache(maxsize=16)
+    >>> fig = freqz([1, 2, 1], [1, -1.2, 0.5], cache=cache)
+    >>> fig = freqz([1, 2, 1], [1, -1.2, 0.5], style='phase', cache=cache)
+    >>> cache.hits, cache.misses
+    (1, 1)
+    """
+
+    def __init__(self, maxsize=128, maxbytes=256 * 2**20):
+        if maxsize < 0:
+            raise ValueError("'maxsize' must be non-negative.")
+        if maxbytes < 0:
+            raise ValueError("'maxbytes' must be non-negative.")
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._nbytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(maxsize={self.maxsize}, "
+            f"maxbytes={self.maxbytes}, currsize={len(self)}, "
+            f"nbytes={self._nbytes}, hits={self.hits}, misses={self.misses})"
+        )
+
+    @property
+    def nbytes(self):
+        """Total size in bytes of the cached arrays."""
+        return self._nbytes
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        self._entries.clear()
+        self._nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, name, compute):
+        """
+        Return a cached quantity, evaluating and storing it if missing.
+
+        Parameters
+        ----------
+        key : str
+            Key of the filter and frequency grid, see :func:`response_key`.
+        name : str
+            Name of the quantity, e.g., 'h' or 'gd'.
+        compute : callable
+            Function without arguments returning the quantity as an array.
+
+        Returns
+        -------
+        ndarray
+            The quantity. The array is read-only.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and name in entry:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[name]
+        self.misses += 1
+        value = np.asarray(compute())
+        if self.maxsize == 0 or value.nbytes > self.maxbytes:
+            return value
+        value.flags.writeable = False
+        if entry is None:
+            entry = self._entries[key] = {}
+        entry[name] = value
+        self._entries.move_to_end(key)
+        self._nbytes += value.nbytes
+        self._evict()
+        return value
+
+    def _evict(self):
+        """Remove least recently used entries until within the limits."""
+        while len(self._entries) > self.maxsize or self._nbytes > self.maxbytes:
+            _, entry = self._entries.popitem(last=False)
+            self._nbytes -= sum(value.nbytes for value in entry.values())
+
+
+def response_key(kind, arrays, grid):
+    """
+    Return a key identifying a filter evaluated on a frequency grid.
+
+    Parameters
+    ----------
+    kind : str
+        Representation of the filter, e.g., 'tf' or 'zpk'.
+    arrays : iterable of array-like
+        Coefficients of the filter. The buffers, dtypes, and shapes are hashed.
+    grid : tuple
+        Parameters defining the frequency grid. Arrays are hashed as for *arrays*.
+
+    Returns
+    -------
+    str
+    """
+    digest = hashlib.blake2b(kind.encode(), digest_size=16)
+    for item in (*arrays, *grid):
+        if np.ndim(item) == 0 and not isinstance(item, np.ndarray):
+            digest.update(f"{type(item).__name__}:{item!r};".encode())
+            continue
+        item = np.ascontiguousarray(item)
+        digest.update(f"{item.dtype.str}{item.shape}".encode())
+        digest.update(item.data)
+    return digest.hexdigest()
+
+
+default_cache = ResponseCache()
@@ -0,0 +1,387 @@
+# Copyright (c) Oscar Gustafsson.
+# Distributed under the terms of the Modified BSD License.
+"""
+Roots of polynomials for pole-zero plots.
+"""
+
+__all__ = [
+    "roots",
+]
+
+import math
+from functools import partial
+
+import numpy as np
+from mplsignal import _api, _utils
+
+# Smallest degree of polynomials without structure solved using the Aberth-Ehrlich
+# iteration by method 'auto'
+_ABERTH_MIN_DEGREE = 256
+
+# Number of points per root of the amplitude response when searching for sign
+# changes on the unit circle
+_SIGN_CHANGE_OVERSAMPLING = 8
+
+# Maximum number of iterations of the Aberth-Ehrlich iteration and of refining
+# unit-circle roots
+_MAX_ITERATIONS = 100
+
+
+def roots(coeffs, method='auto'):
+    """
+    Return the roots of a polynomial.
+
+    Parameters
+    ----------
+    coeffs : array-like
+        1-D array of coefficients, highest power first, as for
+        :func:`numpy.roots`.
+    method : {'auto', 'eig', 'linear_phase', 'aberth'}, default: 'auto'
+        Root-finding method.
+
+        - 'eig': eigenvalues of the companion matrix, :func:`numpy.roots`, which
+          requires :math:`O(n^3)` operations for degree :math:`n`.
+        - 'linear_phase': for real symmetric or antisymmetric coefficients, e.g.,
+          linear-phase FIR filters, where the roots come in reciprocal pairs
+          :math:`z, 1/z`. The roots at :math:`\\pm 1` are divided out and the
+          substitution :math:`y = (z + 1/z)/2` halves the degree. Roots on the unit
+          circle are found from sign changes of the real amplitude response and
+          refined, and the remaining roots are found using the Aberth-Ehrlich
+          iteration with the unit-circle roots held fixed.
+        - 'aberth': the Aberth-Ehrlich iteration, which requires :math:`O(n^2)`
+          operations per iteration and suits general high-degree polynomials.
+        - 'auto': 'linear_phase' for symmetric and antisymmetric coefficients,
+          otherwise 'aberth' for degrees of at least 256 and 'eig' for lower
+          degrees.
+
+    Returns
+    -------
+    ndarray
+        The roots.
+    """
+    _api.check_in_iterable(('auto', 'eig', 'linear_phase', 'aberth'), method=method)
+    coeffs = np.atleast_1d(np.asarray(coeffs))
+    if coeffs.ndim != 1:
+        raise ValueError("'coeffs' must be 1-D.")
+    nonzero = np.flatnonzero(coeffs)
+    if nonzero.size == 0:
+        return np.zeros(0)
+    # Leading zeros do not change the polynomial and trailing zeros are roots at
+    # zero
+    n_zero_roots = coeffs.size - 1 - nonzero[-1]
+    coeffs = coeffs[nonzero[0] : nonzero[-1] + 1]
+    if method == 'auto':
+        if _utils.fir_linear_phase_type(coeffs) is not None:
+            method = 'linear_phase'
+        elif coeffs.size - 1 >= _ABERTH_MIN_DEGREE:
+            method = 'aberth'
+        else:
+            method = 'eig'
+    if coeffs.size == 1:
+        found = np.zeros(0)
+    elif method == 'eig':
+        found = np.roots(coeffs)
+    elif method == 'linear_phase':
+        found = _linear_phase_roots(coeffs)
+    else:
+        found = _aberth(coeffs)
+    return np.concatenate((found, np.zeros(n_zero_roots)))
+
+
+def _linear_phase_roots(coeffs):
+    """Return the roots of a polynomial with symmetric or antisymmetric coeffs."""
+    kind = _utils.fir_linear_phase_type(coeffs)
+    if kind is None:
+        raise ValueError(
+            "Method 'linear_phase' requires real symmetric or antisymmetric "
+            "coefficients."
+        )
+    coeffs = coeffs.astype(float)
+    trivial = []
+    # Antisymmetric polynomials have a root at 1, and symmetric polynomials of odd
+    # degree a root at -1. The quotients are symmetric.
+    if kind in (3, 4):
+        trivial.append(1.0)
+    if kind in (2, 3):
+        trivial.append(-1.0)
+    for root in trivial:
+        coeffs = np.polydiv(coeffs, [1.0, -root])[0]
+        # Remove the round-off of the division
+        coeffs = (coeffs + coeffs[::-1]) / 2
+    half = (coeffs.size - 1) // 2
+    if half == 0:
+        return np.array(trivial, dtype=complex)
+    # z^-m p(z) = a_m + sum_k a_(m-k) (z^k + z^-k) = Q(y) with z^k + z^-k = 2 T_k(y)
+    series = 2 * coeffs[half::-1]
+    series[0] /= 2
+    angles = _unit_circle_roots(series)
+    fixed = np.cos(angles)
+    remaining = _aberth_iteration(
+        partial(_chebyshev_newton_ratio, coeffs),
+        _remaining_initial(coeffs, angles),
+        fixed,
+    )
+    # Map y to the root pair z, 1/z, taking the branch outside the unit circle
+    outside = _outside_branch(remaining)
+    circle = np.exp(1j * angles)
+    return np.concatenate(
+        (trivial, circle, circle.conj(), outside, 1 / outside)
+    ).astype(complex)
+
+
+def _unit_circle_roots(series):
+    """
+    Return the angles in :math:`[0, \\pi]` of the simple roots on the unit circle
+    of the cosine series :math:`A(\\theta) = \\sum_k c_k\\cos(k\\theta)`.
+
+    The series is evaluated on a dense grid using an FFT and each sign change is
+    refined using the Illinois variant of regula falsi.
+    """
+    n = _SIGN_CHANGE_OVERSAMPLING * series.size
+    theta = np.linspace(0, np.pi, n + 1)
+    values = np.fft.rfft(series, 2 * n).real
+    exact = theta[values == 0]
+    brackets = np.flatnonzero(values[:-1] * values[1:] < 0)
+    left = theta[brackets]
+    right = theta[brackets + 1]
+    f_left = values[brackets]
+    f_right = values[brackets + 1]
+    # Endpoint replaced in the previous step, 1 for left and -1 for right
+    side = np.zeros(brackets.size)
+    tol = 4 * np.finfo(float).eps
+    for _ in range(_MAX_ITERATIONS):
+        active = (right - left > tol) & (f_left != 0) & (f_right != 0)
+        if not active.any():
+            break
+        with np.errstate(divide='ignore', invalid='ignore'):
+            middle = (left * f_right - right * f_left) / (f_right - f_left)
+        middle = np.clip(np.nan_to_num(middle), left, right)
+        f_middle = np.polynomial.chebyshev.chebval(np.cos(middle), series)
+        replace_left = active & (np.sign(f_middle) == np.sign(f_left))
+        replace_right = active & ~replace_left
+        # Halve the value at an endpoint that is retained twice in a row
+        f_right = np.where(replace_left & (side == 1), f_right / 2, f_right)
+        f_left = np.where(replace_right & (side == -1), f_left / 2, f_left)
+        left = np.where(replace_left, middle, left)
+        f_left = np.where(replace_left, f_middle, f_left)
+        right = np.where(replace_right, middle, right)
+        f_right = np.where(replace_right, f_middle, f_right)
+        side = np.where(replace_left, 1, np.where(replace_right, -1, 0))
+    refined = np.where(
+        f_left == 0, left, np.where(f_right == 0, right, (left + right) / 2)
+    )
+    return np.sort(np.concatenate((exact, refined)))
+
+
+def _remaining_initial(coeffs, angles):
+    """
+    Return initial approximations of the roots off the unit circle of the
+    Chebyshev series of the symmetric polynomial *coeffs*, given the *angles* of
+    the roots on the unit circle.
+
+    The roots of a cosine series of degree *m* are roughly spread over
+    :math:`m` equal slots of :math:`[0, \\pi]`, and those on the unit circle are
+    assigned to the slots in order. The remaining roots are placed in the free
+    slots, off the unit circle at the radii of the Newton polygon.
+    """
+    half = (coeffs.size - 1) // 2
+    count = half - angles.size
+    if count == 0:
+        return np.zeros(0, dtype=complex)
+    free = np.ones(half, dtype=bool)
+    slot = -1
+    for i, angle in enumerate(angles):
+        # Closest slot after the previous, leaving slots for the following angles
+        slot = min(max(slot + 1, int(angle * half / np.pi)), half - angles.size + i)
+        free[slot] = False
+    theta = np.pi * (np.flatnonzero(free) + 0.5) / half
+    radii, counts = _newton_polygon(coeffs)
+    radii = np.sort(np.repeat(radii, counts))[::-1][:count]
+    z = radii * np.exp(1j * theta)
+    return (z + 1 / z) / 2
+
+
+def _outside_branch(y):
+    """Return the solution of :math:`y = (z + 1/z)/2` with :math:`|z| \\geq 1`."""
+    root = np.sqrt(y.astype(complex) - 1) * np.sqrt(y + 1)
+    return np.where(np.abs(y + root) >= np.abs(y - root), y + root, y - root)
+
+
+def _chebyshev_newton_ratio(coeffs, y):
+    """
+    Return :math:`Q(y)/Q'(y)` where :math:`Q((z + 1/z)/2) = z^{-m}p(z)` for the
+    symmetric polynomial *p* of degree :math:`2m`.
+
+    The ratio is evaluated through :math:`p` at :math:`|z| \\geq 1`, which does not
+    overflow as the Chebyshev series may for large :math:`|y|`.
+    """
+    z = _outside_branch(y)
+    ratio = _newton_ratio(coeffs, z)
+    half = (coeffs.size - 1) // 2
+    # dQ/dz = z^-m (p' - m p/z) and dy/dz = (1 - z^-2)/2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return ratio * (1 - z**-2) / (2 * (1 - half * ratio / z))
+
+
+def _aberth(coeffs):
+    """
+    Return the roots of a polynomial using the Aberth-Ehrlich iteration.
+
+    The initial approximations are equally spaced on the circles given by the
+    Newton polygon, where the polynomial and its derivative are evaluated using
+    FFTs. Approximations are then updated simultaneously until the corrections
+    are at the level of round-off, using Horner's method, of the reversed
+    polynomial outside the unit circle to avoid overflow.
+    """
+    coeffs = coeffs / coeffs[0]
+    degree = coeffs.size - 1
+    if degree == 1:
+        return np.array([-coeffs[1]], dtype=complex)
+    z = []
+    ratio = []
+    start = 0
+    for radius, count in zip(*_newton_polygon(coeffs)):
+        # Rotate the circles relative to each other so that no approximation is
+        # real
+        angle = 2 * np.pi * (start + 0.4) / degree
+        z.append(radius * np.exp(1j * (2 * np.pi * np.arange(count) / count + angle)))
+        ratio.append(_initial_newton_ratio(coeffs, radius, count, angle))
+        start += count
+    return _aberth_iteration(
+        partial(_newton_ratio, coeffs), np.concatenate(z), ratio=np.concatenate(ratio)
+    )
+
+
+def _newton_polygon(coeffs):
+    """
+    Return the radii and numbers of roots of the circles given by the upper convex
+    hull of :math:`(k, \\log|a_k|)` for the coefficients :math:`a_k` of
+    :math:`z^k`.
+
+    The radii estimate the magnitudes of the roots, also when they span many
+    orders of magnitude.
+    """
+    magnitudes = np.abs(coeffs[::-1])
+    powers = np.flatnonzero(magnitudes)
+    logs = np.log(magnitudes[powers])
+    hull = [0]
+    for i in range(1, powers.size):
+        while len(hull) > 1:
+            o, a = hull[-2], hull[-1]
+            cross = (powers[a] - powers[o]) * (logs[i] - logs[o]) - (
+                logs[a] - logs[o]
+            ) * (powers[i] - powers[o])
+            if cross < 0:
+                break
+            hull.pop()
+        hull.append(i)
+    hull = np.array(hull)
+    counts = np.diff(powers[hull])
+    radii = np.exp(-np.diff(logs[hull]) / counts)
+    return radii, counts
+
+
+def _aberth_iteration(newton_ratio, z, fixed=None, ratio=None):
+    """
+    Refine the approximations *z* of roots using the Aberth-Ehrlich iteration.
+
+    Parameters
+    ----------
+    newton_ratio : callable
+        Function returning :math:`p(z)/p'(z)` for an array of points.
+    z : ndarray
+        Initial approximations.
+    fixed : ndarray, optional
+        Roots that are already known. They repel the approximations, which
+        deflates them implicitly.
+    ratio : ndarray, optional
+        Newton ratio at the initial approximations, if already evaluated.
+    """
+    fixed = np.zeros(0) if fixed is None else fixed
+    z = z.astype(complex)
+    active = np.arange(z.size)
+    eps = np.finfo(float).eps
+    for iteration in range(_MAX_ITERATIONS):
+        if active.size == 0:
+            break
+        if iteration > 0 or ratio is None:
+            ratio = newton_ratio(z[active])
+        points = np.concatenate((z, fixed))
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            correction = ratio / (1 - ratio * _aberth_sum(points, active))
+        # Stop at failed evaluations, e.g., 0/0 at a multiple root, rather than
+        # iterating on NaN
+        correction[~np.isfinite(correction)] = 0
+        z[active] -= correction
+        converged = np.abs(correction) <= 4 * eps * np.abs(z[active])
+        active = active[~converged]
+    return z
+
+
+def _initial_newton_ratio(coeffs, radius, count, angle):
+    """
+    Return :math:`p(z)/p'(z)` at :math:`z_k = r e^{j(2\\pi k/K + angle)}`, k < K,
+    using an FFT of length *K*.
+    """
+    degree = coeffs.size - 1
+    powers = np.arange(degree + 1)
+    low = coeffs[::-1]
+    # Scale b_i = a_i (r e^{j angle})^i in logarithmic form to avoid overflow, the
+    # scale cancels in the ratio
+    with np.errstate(divide='ignore'):
+        logs = np.log(np.abs(low)) + powers * math.log(radius)
+    scaled = np.where(
+        low != 0,
+        np.exp(logs - logs.max()) * np.exp(1j * (np.angle(low) + powers * angle)),
+        0,
+    )
+    # p(z_k) = sum_i b_i e^{j 2 pi k i / K} and z_k p'(z_k) = sum_i i b_i
+    # e^{j 2 pi k i / K}, folding i modulo K
+    folded = _fold(scaled, powers % count, count)
+    folded_derivative = _fold(powers * scaled, powers % count, count)
+    values = np.fft.ifft(folded)
+    derivative_values = np.fft.ifft(folded_derivative)
+    z = radius * np.exp(1j * (2 * np.pi * np.arange(count) / count + angle))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return z * values / derivative_values
+
+
+def _fold(values, indices, length):
+    """Return the sums of complex *values* with equal *indices*."""
+    return np.bincount(indices, values.real, length) + 1j * np.bincount(
+        indices, values.imag, length
+    )
+
+
+def _newton_ratio(coeffs, z):
+    """
+    Return :math:`p(z)/p'(z)` of a monic polynomial with coefficients *coeffs*,
+    highest power first.
+    """
+    degree = coeffs.size - 1
+    inside = np.abs(z) <= 1
+    # Outside the unit circle, p(z) = z^n q(1/z) with the reversed polynomial q,
+    # so that p/p' = z q(y)/(n q(y) - y q'(y)) with y = 1/z
+    x = np.where(inside, z, 1 / z)
+    values = np.where(inside, coeffs[0], coeffs[-1]).astype(complex)
+    derivative = np.zeros_like(values)
+    for k in range(1, degree + 1):
+        derivative = derivative * x + values
+        values = values * x + np.where(inside, coeffs[k], coeffs[degree - k])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(
+            inside, values / derivative, z * values / (degree * values - x * derivative)
+        )
+
+
+def _aberth_sum(z, active):
+    """Return :math:`\\sum_{j \\ne i} 1/(z_i - z_j)` for the indices *active*."""
+    sums = np.empty(active.size, dtype=complex)
+    block = max(1, _utils._BLOCK_ELEMENTS // z.size)
+    for start in range(0, active.size, block):
+        rows = active[start : start + block]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            inverse = 1 / (z[rows, np.newaxis] - z)
+        inverse[np.arange(rows.size), rows] = 0
+        sums[start : start + block] = inverse.sum(axis=1)
+    return sums
@@ -6,125 +6,2418 @@
 __all__ = [
     "freqz_tf",
     "freqz_zpk",
+    "freqz_zpk_db",
+    "freqz_zpk_phase",
+    "freqz_sos",
+    "freqz_ss",
+    "freqz_tf_power",
+    "freqs_tf",
+    "freqs_zpk",
+    "freqs_zpk_db",
 ]
 
+import functools
+import math
+from concurrent.futures import ThreadPoolExecutor
+
 try:
     import scipy.signal as signal
 except ImportError:
     signal = None
 import numpy as np
 
+# Unit round-off of single precision and the largest accepted estimated relative
+# error of single precision results
+_SINGLE_EPS = float(np.finfo(np.float32).eps)
+_SINGLE_RTOL = 1e-3
+
+# Largest accepted estimated relative error of power responses computed from
+# autocorrelations
+_POWER_RTOL = 1e-3
+
+# Largest accepted condition number of the eigenvectors of the state matrix for
+# evaluating state-space systems in modal form
+_MODAL_MAX_CONDITION = 1e8
+
+# Approximate number of matrix elements per block when solving state-space
+# systems for each frequency-point or summing sparse taps
+_BLOCK_ELEMENTS = 2**20
+
+# Approximate cost of one term of a sparse sum, which evaluates an exponential or
+# trigonometric function, relative to one step of Horner's method or Clenshaw's
+# recurrence
+_SPARSE_TERM_COST = 16
+
+# Largest fraction of nonzero taps of FIR filters evaluated as sparse taps
+_SPARSE_FRACTION = 0.25
+
+# Minimum number of frequency-points per thread
+_MIN_CHUNK_SIZE = 4096
+
+# Approximate peak number of bytes per frequency-point and filter when evaluating
+# and reducing a block, and number of min/max bins of streamed evaluations
+_BLOCK_BYTES_PER_POINT = 256
+_REDUCED_BINS = 4096
 
-def freqz_tf(num, den, w):
+# Number of columns per pixel of the Axes width when decimating plotted curves
+_COLUMNS_PER_PIXEL = 2
+
+
+def freqz_tf(num, den, w, dtype=None, workers=None):
     """
     Evaluate transfer function to determine frequency response.
 
     Parameters
     ----------
     num : array-like
-        Numerator.
+        Numerator. If 2-D, each row is the numerator of a separate filter.
     den : array-like
-        Denominator.
+        Denominator. If 2-D, each row is the denominator of a separate filter.
     w : array-like
         Frequency-points.
+    dtype : {None, numpy.complex128, numpy.complex64}, optional
+        Precision of the computation. If complex64, the response is computed in
+        single precision. Frequency-points where the estimated relative error,
+        based on the round-off growth of the evaluation method, exceeds 1e-3 are
+        recomputed in double precision.
+    workers : int, optional
+        Number of threads to evaluate with. Frequency-points evaluated pointwise,
+        and filters evaluated using FFTs, are split among the threads. The result
+        is bit-identical to evaluating with a single thread.
 
     Returns
     -------
     h : ndarray
-        The frequency response.
+        The frequency response. If *num* or *den* is 2-D, one row per filter.
+
+    Notes
+    -----
+    If *w* is a uniform grid starting at zero, i.e., :math:`w_k = 2\\pi k/L` for
+    some integer :math:`L`, as created by :func:`numpy.linspace` over
+    :math:`[0, \\pi)`, :math:`[0, \\pi]`, or :math:`[0, 2\\pi)`, the numerator
+    and denominator are evaluated using zero-padded FFTs of length :math:`L`.
+
+    If *w* is any other uniform grid, e.g., a narrow frequency band, long
+    numerators and denominators are evaluated using the chirp-z transform.
 
     """
-    if signal:
-        return signal.freqz(num, den, worN=w)[1]
-    else:
-        wexp = np.exp(-1j * w)
-        h = np.polynomial.polynomial.polyval(
-            wexp, num, tensor=False
-        ) / np.polynomial.polynomial.polyval(wexp, den, tensor=False)
-        return h
+    w = np.asarray(w)
+    return _polyval_grid(num, w, dtype, workers) / _polyval_grid(den, w, dtype, workers)
+
+
+def freqz_tf_power(num, den, w, workers=None):
+    """
+    Evaluate transfer function with real coefficients to determine power response.
+
+    The squared magnitude of a polynomial :math:`B(e^{j\\omega})` with real
+    coefficients is the cosine series :math:`r_0 + 2\\sum_k r_k\\cos(k\\omega)`
+    of the autocorrelation :math:`r` of the coefficients. The series is evaluated
+    in real arithmetic, as :func:`fir_amplitude`, without forming the complex
+    response. Polynomials that :func:`freqz_tf` evaluates at *w* using FFTs or the
+    chirp-z transform, e.g., on uniform grids starting at zero, are instead
+    evaluated as the squared magnitude of the transform.
+
+    Parameters
+    ----------
+    num : array-like
+        Real numerator. If 2-D, each row is the numerator of a separate filter.
+    den : array-like
+        Real denominator. If 2-D, each row is the denominator of a separate filter.
+    w : array-like
+        Frequency-points.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
+
+    Returns
+    -------
+    ndarray
+        The power response :math:`|H(e^{j\\omega})|^2`. Frequency-points where the
+        estimated relative error exceeds 1e-3, e.g., deep in the stopband, are
+        recomputed from the complex response.
+    """
+    w = np.asarray(w, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return _polynomial_power(num, w, workers) / _polynomial_power(den, w, workers)
 
 
-def freqz_zpk(zeros, poles, gain, w):
+def freqz_zpk(zeros, poles, gain, w, dtype=None, workers=None):
     """
     Evaluate transfer function to determine frequency response.
 
     Parameters
     ----------
     zeros : array-like
-        Zeros.
+        Zeros. If 2-D, each row is the zeros of a separate filter.
     poles : array-like
-        Poles.
-    gain : float
-        Gain.
+        Poles. If 2-D, each row is the poles of a separate filter.
+    gain : float or array-like
+        Gain. If 1-D, the gain of each filter.
     w : array-like
         Frequency-points.
+    dtype : {None, numpy.complex128, numpy.complex64}, optional
+        Precision of the computation, see :func:`freqz_tf`.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
 
     Returns
     -------
     h : ndarray
-        The frequency response.
+        The frequency response. If *zeros*, *poles*, or *gain* have more dimensions,
+        one row per filter.
 
     """
-    if signal:
+    if workers:
+        # The response is evaluated pointwise
+        return _map_chunks(
+            functools.partial(freqz_zpk, zeros, poles, gain, dtype=dtype),
+            np.asarray(w),
+            workers,
+        )
+    w = np.asarray(w)
+    zeros = np.asarray(zeros)
+    poles = np.asarray(poles)
+    gain = np.asarray(gain)
+    if _is_single(dtype):
+        x = np.exp(1j * w).astype(np.complex64)
+        zeros_single = zeros.astype(np.complex64)
+        poles_single = poles.astype(np.complex64)
+        h = (
+            _to_single(gain)[..., np.newaxis]
+            * _polyvalfromroots(x, zeros_single)
+            / _polyvalfromroots(x, poles_single)
+        )
+        # The relative error of each factor e^{jw} - r is proportional to
+        # (1 + |r|)/|e^{jw} - r|
+        error = _SINGLE_EPS * (
+            zeros.shape[-1]
+            + poles.shape[-1]
+            + _root_distance_sum(x, zeros_single, 1)
+            + _root_distance_sum(x, poles_single, 1)
+        )
+        return _guard_single(
+            h, error, functools.partial(freqz_zpk, zeros, poles, gain), w
+        )
+    if signal and zeros.ndim <= 1 and poles.ndim <= 1 and gain.ndim == 0:
         return signal.freqz_zpk(zeros, poles, gain, worN=w)[1]
-    else:
-        wexp = np.exp(1j * w)
-        h = np.polynomial.polynomial.polyvalfromroots(
-            wexp, zeros
-        ) / np.polynomial.polynomial.polyvalfromroots(wexp, poles)
-        return h
+    wexp = np.exp(1j * w)
+    return (
+        gain[..., np.newaxis]
+        * _polyvalfromroots(wexp, zeros)
+        / _polyvalfromroots(wexp, poles)
+    )
+
+
+def freqz_zpk_db(zeros, poles, gain, w, dtype=None, workers=None):
+    """
+    Evaluate zeros, poles, and gain to determine magnitude response in dB.
+
+    The magnitude is computed as the sum of the logarithms of the distances to the
+    zeros minus those to the poles, so the result does not over- or underflow for
+    high-order filters.
+
+    Parameters
+    ----------
+    zeros : array-like
+        Zeros. If 2-D, each row is the zeros of a separate filter.
+    poles : array-like
+        Poles. If 2-D, each row is the poles of a separate filter.
+    gain : float or array-like
+        Gain. If 1-D, the gain of each filter.
+    w : array-like
+        Frequency-points.
+    dtype : {None, numpy.complex128, numpy.complex64}, optional
+        Precision of the computation, see :func:`freqz_tf`.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
+
+    Returns
+    -------
+    ndarray
+        The magnitude response in dB.
+    """
+    if workers:
+        # The response is evaluated pointwise
+        return _map_chunks(
+            functools.partial(freqz_zpk_db, zeros, poles, gain, dtype=dtype),
+            np.asarray(w),
+            workers,
+        )
+    w = np.asarray(w)
+    zeros = np.asarray(zeros)
+    poles = np.asarray(poles)
+    gain = np.abs(np.asarray(gain))
+    if _is_single(dtype):
+        x = np.exp(1j * w).astype(np.complex64)
+        zeros_single = zeros.astype(np.complex64)
+        poles_single = poles.astype(np.complex64)
+        with np.errstate(divide='ignore'):
+            magnitude = 20 * (
+                np.log10(gain.astype(np.float32))[..., np.newaxis]
+                + _root_log_magnitude(x, zeros_single)
+                - _root_log_magnitude(x, poles_single)
+            )
+        # Same relative error of the magnitude as for freqz_zpk
+        error = _SINGLE_EPS * (
+            zeros.shape[-1]
+            + poles.shape[-1]
+            + _root_distance_sum(x, zeros_single, 1)
+            + _root_distance_sum(x, poles_single, 1)
+        )
+        return _guard_single(
+            magnitude, error, functools.partial(freqz_zpk_db, zeros, poles, gain), w
+        )
+    x = np.exp(1j * w)
+    with np.errstate(divide='ignore'):
+        return 20 * (
+            np.log10(gain)[..., np.newaxis]
+            + _root_log_magnitude(x, zeros)
+            - _root_log_magnitude(x, poles)
+        )
+
+
+def freqz_zpk_phase(zeros, poles, gain, w, workers=None):
+    """
+    Evaluate zeros, poles, and gain to determine phase response.
+
+    The phase is computed as the sum of the angles of :math:`e^{j\\omega} - z_k`
+    minus those of :math:`e^{j\\omega} - p_k`, so, as for :func:`freqz_zpk_db`, the
+    result does not over- or underflow for high-order filters. Each angle is
+    continuous in :math:`\\omega`, so the phase is unwrapped pointwise, also where
+    it changes by more than :math:`\\pi` between frequency-points.
+
+    Parameters
+    ----------
+    zeros : array-like
+        Zeros. If 2-D, each row is the zeros of a separate filter.
+    poles : array-like
+        Poles. If 2-D, each row is the poles of a separate filter.
+    gain : float or array-like
+        Gain. If 1-D, the gain of each filter.
+    w : array-like
+        Frequency-points.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
+
+    Returns
+    -------
+    ndarray
+        The unwrapped phase response in radians, up to a multiple of
+        :math:`2\\pi`. It jumps by :math:`\\pi` at zeros and poles on the unit
+        circle.
+    """
+    if workers:
+        # The response is evaluated pointwise
+        return _map_chunks(
+            functools.partial(freqz_zpk_phase, zeros, poles, gain),
+            np.asarray(w),
+            workers,
+        )
+    w = np.asarray(w)
+    return (
+        np.angle(np.asarray(gain))[..., np.newaxis]
+        + _root_angle(w, zeros)
+        - _root_angle(w, poles)
+    )
+
+
+def freqz_sos(sos, w, dtype=None, workers=None):
+    """
+    Evaluate second-order sections to determine frequency response.
+
+    Parameters
+    ----------
+    sos : array-like
+        Second-order sections of shape ``(n_sections, 6)``, where each row is
+        ``[b0, b1, b2, a0, a1, a2]``. Additional leading dimensions correspond to
+        separate filters.
+    w : array-like
+        Frequency-points.
+    dtype : {None, numpy.complex128, numpy.complex64}, optional
+        Precision of the computation, see :func:`freqz_tf`.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
+
+    Returns
+    -------
+    h : ndarray
+        The frequency response.
+
+    """
+    return np.prod(_freqz_sections(sos, w, dtype, workers), axis=-2)
+
+
+def freqz_sos_db(sos, w, dtype=None, workers=None):
+    """
+    Evaluate second-order sections to determine magnitude response in dB.
+
+    The magnitude is computed as the sum of the magnitudes in dB of the
+    sections, so the result does not over- or underflow for high-order filters.
+
+    Parameters
+    ----------
+    sos : array-like
+        Second-order sections of shape ``(n_sections, 6)``, where each row is
+        ``[b0, b1, b2, a0, a1, a2]``. Additional leading dimensions correspond to
+        separate filters.
+    w : array-like
+        Frequency-points.
+    dtype : {None, numpy.complex128, numpy.complex64}, optional
+        Precision of the computation, see :func:`freqz_tf`.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
+
+    Returns
+    -------
+    ndarray
+        The magnitude response in dB.
+
+    """
+    with np.errstate(divide='ignore'):
+        sections = _freqz_sections(sos, w, dtype, workers)
+        return 20 * np.log10(np.abs(sections)).sum(axis=-2)
+
+
+def group_delay_sos(sos, w, dtype=None, workers=None):
+    """
+    Evaluate second-order sections to determine group delay.
+
+    Parameters
+    ----------
+    sos : array-like
+        Second-order sections of shape ``(n_sections, 6)``, where each row is
+        ``[b0, b1, b2, a0, a1, a2]``. Additional leading dimensions correspond to
+        separate filters.
+    w : array-like
+        Frequency-points.
+    dtype : {None, numpy.complex128, numpy.complex64}, optional
+        Precision of the computation, see :func:`freqz_tf`.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
+
+    Returns
+    -------
+    gd : ndarray
+        The group delay. NaN where a section has a zero or pole on the unit circle.
+
+    """
+    sos = _check_sos(sos)
+    return group_delay(sos[..., :3], sos[..., 3:], w, dtype, workers).sum(axis=-2)
 
 
-def group_delay(num, den, w):
+def group_delay(num, den, w, dtype=None, workers=None):
     """
     Evaluate transfer function to determine group delay.
 
     Parameters
     ----------
     num : array-like
-        Numerator.
+        Numerator. If 2-D, each row is the numerator of a separate filter.
     den : array-like
-        Denominator.
+        Denominator. If 2-D, each row is the denominator of a separate filter.
     w : array-like
         Frequency-points.
+    dtype : {None, numpy.complex128, numpy.complex64}, optional
+        Precision of the computation, see :func:`freqz_tf`.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
 
     Returns
     -------
     gd : ndarray
-        The group delay.
+        The group delay. NaN where the numerator or denominator is zero.
+
+    Notes
+    -----
+    The group delay of a polynomial :math:`B(e^{j\\omega}) = \\sum_n b_n
+    e^{-j\\omega n}` is :math:`\\mathrm{Re}\\{\\sum_n n b_n e^{-j\\omega n}/
+    B(e^{j\\omega})\\}`. Both polynomials are evaluated as in :func:`freqz_tf`.
 
     """
-    if signal:
-        return signal.group_delay((num, den), w=w)[1]
-    else:
-        # TODO: compute actual group delay
-        gd, _ = group_delay_from_h(w, freqz_tf(num, den, w))
-        gd.append(0)
-        return gd
+    w = np.asarray(w)
+    return _polynomial_group_delay(num, w, dtype, workers) - _polynomial_group_delay(
+        den, w, dtype, workers
+    )
 
 
-def group_delay_from_h(w, h):
+def group_delay_zpk(zeros, poles, w, dtype=None, workers=None):
     """
-    Estimate group delay from frequency response.
+    Evaluate zeros and poles to determine group delay.
 
     Parameters
     ----------
+    zeros : array-like
+        Zeros. If 2-D, each row is the zeros of a separate filter.
+    poles : array-like
+        Poles. If 2-D, each row is the poles of a separate filter.
     w : array-like
         Frequency-points.
-    h : array-like
-        Frequency response.
+    dtype : {None, numpy.complex128, numpy.complex64}, optional
+        Precision of the computation, see :func:`freqz_tf`.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
 
     Returns
     -------
     gd : ndarray
-        The estimated group delay.
-    w : ndarray
-        The frequency points where the group delay is estimated.
-    """
-    angle = np.unwrap(np.angle(h))
-    angle_diff = np.diff(angle)
-    angle_diff[np.abs(angle_diff) > 3] = np.nan
-    w_diff = np.diff(w)
-    w_new = w[0:-1] + w_diff / 2
-    gd = -angle_diff / w_diff
-    return gd, w_new
+        The group delay. NaN at zeros and poles on the unit circle.
+
+    Notes
+    -----
+    Each root :math:`r` contributes :math:`\\mathrm{Re}\\{e^{j\\omega}/
+    (e^{j\\omega} - r)\\}` with positive sign for poles and negative sign for
+    zeros.
+
+    """
+    if workers:
+        # The response is evaluated pointwise
+        return _map_chunks(
+            functools.partial(group_delay_zpk, zeros, poles, dtype=dtype),
+            np.asarray(w),
+            workers,
+        )
+    w = np.asarray(w)
+    if _is_single(dtype):
+        x = np.exp(1j * w).astype(np.complex64)
+        zeros_single = np.asarray(zeros).astype(np.complex64)
+        poles_single = np.asarray(poles).astype(np.complex64)
+        gd = _root_group_delay(x, poles_single) - _root_group_delay(x, zeros_single)
+        # The absolute error of each term is proportional to (1 + |r|)/|e^{jw} - r|^2
+        error = _SINGLE_EPS * (
+            _root_distance_sum(x, zeros_single, 2)
+            + _root_distance_sum(x, poles_single, 2)
+        )
+        return _guard_single(
+            gd,
+            error / np.maximum(1, np.abs(gd)),
+            functools.partial(group_delay_zpk, zeros, poles),
+            w,
+        )
+    wexp = np.exp(1j * w)
+    return _root_group_delay(wexp, poles) - _root_group_delay(wexp, zeros)
+
+
+def freqs_tf(num, den, w, workers=None):
+    """
+    Evaluate continuous-time transfer function to determine frequency response.
+
+    Parameters
+    ----------
+    num : array-like
+        Numerator, highest power of *s* first. If 2-D, each row is the numerator
+        of a separate filter.
+    den : array-like
+        Denominator, highest power of *s* first. If 2-D, each row is the
+        denominator of a separate filter.
+    w : array-like
+        Angular frequency-points in rad/s.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
+
+    Returns
+    -------
+    h : ndarray
+        The frequency response at :math:`s = j\\omega`. If *num* or *den* is 2-D,
+        one row per filter.
+
+    """
+    if workers:
+        # The response is evaluated pointwise
+        return _map_chunks(
+            functools.partial(freqs_tf, num, den), np.asarray(w), workers
+        )
+    s = 1j * np.asarray(w, dtype=float)
+    num = np.atleast_1d(np.asarray(num))
+    den = np.atleast_1d(np.asarray(den))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return _polyval(s, num[..., ::-1]) / _polyval(s, den[..., ::-1])
+
+
+def freqs_zpk(zeros, poles, gain, w, workers=None):
+    """
+    Evaluate continuous-time zeros, poles, and gain to determine frequency response.
+
+    Parameters
+    ----------
+    zeros : array-like
+        Zeros. If 2-D, each row is the zeros of a separate filter.
+    poles : array-like
+        Poles. If 2-D, each row is the poles of a separate filter.
+    gain : float or array-like
+        Gain. If 1-D, the gain of each filter.
+    w : array-like
+        Angular frequency-points in rad/s.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
+
+    Returns
+    -------
+    h : ndarray
+        The frequency response at :math:`s = j\\omega`.
+
+    """
+    if workers:
+        # The response is evaluated pointwise
+        return _map_chunks(
+            functools.partial(freqs_zpk, zeros, poles, gain), np.asarray(w), workers
+        )
+    s = 1j * np.asarray(w, dtype=float)
+    gain = np.asarray(gain)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (
+            gain[..., np.newaxis]
+            * _polyvalfromroots(s, zeros)
+            / _polyvalfromroots(s, poles)
+        )
+
+
+def freqs_zpk_db(zeros, poles, gain, w, workers=None):
+    """
+    Evaluate continuous-time zeros, poles, and gain to determine magnitude response
+    in dB.
+
+    As for :func:`freqz_zpk_db`, the magnitude is computed as a sum of logarithms
+    of distances, so it does not over- or underflow for high-order filters or
+    frequencies far from the zeros and poles.
+
+    Parameters
+    ----------
+    zeros : array-like
+        Zeros. If 2-D, each row is the zeros of a separate filter.
+    poles : array-like
+        Poles. If 2-D, each row is the poles of a separate filter.
+    gain : float or array-like
+        Gain. If 1-D, the gain of each filter.
+    w : array-like
+        Angular frequency-points in rad/s.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
+
+    Returns
+    -------
+    ndarray
+        The magnitude response in dB.
+    """
+    if workers:
+        # The response is evaluated pointwise
+        return _map_chunks(
+            functools.partial(freqs_zpk_db, zeros, poles, gain), np.asarray(w), workers
+        )
+    s = 1j * np.asarray(w, dtype=float)
+    gain = np.abs(np.asarray(gain))
+    with np.errstate(divide='ignore'):
+        return 20 * (
+            np.log10(gain)[..., np.newaxis]
+            + _root_log_magnitude(s, zeros)
+            - _root_log_magnitude(s, poles)
+        )
+
+
+def group_delay_s(num, den, w, workers=None):
+    """
+    Evaluate continuous-time transfer function to determine group delay.
+
+    Parameters
+    ----------
+    num : array-like
+        Numerator, highest power of *s* first. If 2-D, each row is the numerator
+        of a separate filter.
+    den : array-like
+        Denominator, highest power of *s* first. If 2-D, each row is the
+        denominator of a separate filter.
+    w : array-like
+        Angular frequency-points in rad/s.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
+
+    Returns
+    -------
+    gd : ndarray
+        The group delay in seconds. NaN where the numerator or denominator is zero.
+
+    Notes
+    -----
+    The group delay of :math:`H(s) = B(s)/A(s)` at :math:`s = j\\omega` is
+    :math:`\\mathrm{Re}\\{A'(s)/A(s)\\} - \\mathrm{Re}\\{B'(s)/B(s)\\}`.
+
+    """
+    if workers:
+        # The response is evaluated pointwise
+        return _map_chunks(
+            functools.partial(group_delay_s, num, den), np.asarray(w), workers
+        )
+    s = 1j * np.asarray(w, dtype=float)
+    return _polynomial_group_delay_s(den, s) - _polynomial_group_delay_s(num, s)
+
+
+def group_delay_zpk_s(zeros, poles, w, workers=None):
+    """
+    Evaluate continuous-time zeros and poles to determine group delay.
+
+    Parameters
+    ----------
+    zeros : array-like
+        Zeros. If 2-D, each row is the zeros of a separate filter.
+    poles : array-like
+        Poles. If 2-D, each row is the poles of a separate filter.
+    w : array-like
+        Angular frequency-points in rad/s.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
+
+    Returns
+    -------
+    gd : ndarray
+        The group delay in seconds. NaN at zeros and poles on the imaginary axis.
+
+    Notes
+    -----
+    Each root :math:`r` contributes :math:`\\mathrm{Re}\\{1/(j\\omega - r)\\}`
+    with positive sign for poles and negative sign for zeros.
+
+    """
+    if workers:
+        # The response is evaluated pointwise
+        return _map_chunks(
+            functools.partial(group_delay_zpk_s, zeros, poles), np.asarray(w), workers
+        )
+    s = 1j * np.asarray(w, dtype=float)
+    return _root_group_delay_s(s, poles) - _root_group_delay_s(s, zeros)
+
+
+def freqz_ss(A, B, C, D, w, workers=None):
+    """
+    Evaluate state-space system to determine frequency response.
+
+    Parameters
+    ----------
+    A : array-like
+        State matrix of shape ``(n, n)``.
+    B : array-like
+        Input matrix of shape ``(n, m)``, or ``(n,)`` for a single input.
+    C : array-like
+        Output matrix of shape ``(p, n)``, or ``(n,)`` for a single output.
+    D : array-like
+        Feedthrough matrix of shape ``(p, m)``, or a scalar.
+    w : array-like
+        Frequency-points.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
+
+    Returns
+    -------
+    h : ndarray
+        The frequency response :math:`C(zI - A)^{-1}B + D` at
+        :math:`z = e^{j\\omega}`, of shape ``(p, m) + w.shape``.
+
+    Notes
+    -----
+    If *A* is diagonalizable with well-conditioned eigenvectors, :math:`A = V\\Lambda
+    V^{-1}`, the response is evaluated as :math:`\\sum_i (CV)_i (V^{-1}B)_i/(z -
+    \\lambda_i) + D` with one eigendecomposition for all frequency-points.
+    Otherwise, :math:`(zI - A)X = B` is solved for each frequency-point.
+
+    """
+    if workers:
+        # The response is evaluated pointwise
+        return _map_chunks(
+            functools.partial(freqz_ss, A, B, C, D), np.asarray(w), workers
+        )
+    A, B, C, D = _check_ss(A, B, C, D)
+    z = np.exp(1j * np.asarray(w, dtype=float))
+    return _ss_response(A, B, C, z)[0] + D[..., np.newaxis]
+
+
+def group_delay_ss(A, B, C, D, w, workers=None):
+    """
+    Evaluate state-space system to determine group delay.
+
+    Parameters
+    ----------
+    A, B, C, D : array-like
+        State-space matrices, see :func:`freqz_ss`.
+    w : array-like
+        Frequency-points.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
+
+    Returns
+    -------
+    gd : ndarray
+        The group delay of each input-output pair, of shape ``(p, m) + w.shape``.
+        NaN where the response is zero.
+
+    Notes
+    -----
+    The group delay is :math:`-\\mathrm{Re}\\{zH'(z)/H(z)\\}`, where
+    :math:`H'(z) = -C(zI - A)^{-2}B`, evaluated as in :func:`freqz_ss`.
+
+    """
+    if workers:
+        # The response is evaluated pointwise
+        return _map_chunks(
+            functools.partial(group_delay_ss, A, B, C, D), np.asarray(w), workers
+        )
+    A, B, C, D = _check_ss(A, B, C, D)
+    z = np.exp(1j * np.asarray(w, dtype=float))
+    h, derivative = _ss_response(A, B, C, z, derivative=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gd = -np.real(z * derivative / (h + D[..., np.newaxis]))
+    gd[~np.isfinite(gd)] = np.nan
+    return gd
+
+
+def freqz_taps(indices, values, w, workers=None):
+    """
+    Evaluate sparse FIR filters to determine frequency response.
+
+    Parameters
+    ----------
+    indices : array-like
+        1-D array of the non-negative indices of the nonzero taps.
+    values : array-like
+        Values of the taps at *indices* along the last axis. If 2-D, each row is
+        a separate filter with the same nonzero taps.
+    w : array-like
+        Frequency-points.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
+
+    Returns
+    -------
+    h : ndarray
+        The frequency response :math:`\\sum_k v_k e^{-j\\omega n_k}`. If *values*
+        is 2-D, one row per filter.
+
+    Notes
+    -----
+    Only the given taps are evaluated, in :math:`O(\\mathrm{nnz} \\cdot
+    \\mathrm{len}(w))` operations, independently of the length of the filter.
+    If *w* is a uniform grid starting at zero, see :func:`freqz_tf`, the taps are
+    instead summed modulo the FFT length and evaluated using an FFT. If evaluating
+    the filter with all its zero taps using the chirp-z transform or Horner's
+    method requires fewer operations, that is used.
+
+    """
+    indices, values = _check_taps(indices, values)
+    w = np.asarray(w, dtype=float)
+    length = int(indices.max(initial=-1)) + 1
+    period = _uniform_grid_period(w)
+    if period is not None and period <= 2 * w.size:
+        # e^{-j 2 pi k m / L} is periodic in m, so fold the taps directly
+        folded = _scatter_taps(indices % period, values, period)
+        return _polyval_grid(folded, w, workers=workers)
+    dense_cost = length * w.size
+    if _uniform_grid(w) is not None:
+        fft_length = _next_fast_len(length + w.size - 1)
+        dense_cost = min(dense_cost, 4 * fft_length * math.log2(fft_length))
+    if dense_cost < _SPARSE_TERM_COST * indices.size * w.size:
+        coeffs = _scatter_taps(indices, values, length)
+        return _polyval_grid(coeffs, w, workers=workers)
+    return _map_chunks(
+        functools.partial(_sparse_sum, values, indices, lambda x: np.exp(-1j * x)),
+        w,
+        workers,
+    )
+
+
+def group_delay_taps(indices, values, w, workers=None):
+    """
+    Evaluate sparse FIR filters to determine group delay.
+
+    Parameters
+    ----------
+    indices, values : array-like
+        Indices and values of the nonzero taps, see :func:`freqz_taps`.
+    w : array-like
+        Frequency-points.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
+
+    Returns
+    -------
+    gd : ndarray
+        The group delay :math:`\\mathrm{Re}\\{\\sum_k n_k v_k e^{-j\\omega n_k} /
+        \\sum_k v_k e^{-j\\omega n_k}\\}`, evaluated as in :func:`freqz_taps`. NaN
+        where the response is zero.
+    """
+    indices, values = _check_taps(indices, values)
+    # Both sums are evaluated at once, sharing the exponentials
+    h, ramped = freqz_taps(indices, np.stack([values, values * indices]), w, workers)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gd = np.real(ramped / h)
+    gd[~np.isfinite(gd)] = np.nan
+    return gd
+
+
+def fir_linear_phase_type(num, kind=None):
+    """
+    Determine the linear-phase type of FIR filters.
+
+    Parameters
+    ----------
+    num : array-like
+        Impulse responses along the last axis.
+    kind : {None, True, 1, 2, 3, 4}, optional
+        If 1 to 4, the declared type, which is checked against the length of
+        *num* only. If None or True, the type is detected from the symmetry of
+        *num*.
+
+    Returns
+    -------
+    int or None
+        The type: 1 and 2 for symmetric *num* of odd and even length, 3 and 4 for
+        antisymmetric *num* of odd and even length. None if *kind* is None and
+        *num* is neither symmetric nor antisymmetric.
+    """
+    num = np.atleast_1d(np.asarray(num))
+    odd = num.shape[-1] % 2 == 1
+    if kind is not None and kind is not True:
+        if kind not in (1, 2, 3, 4):
+            raise ValueError(
+                f"Unknown linear-phase type {kind!r}; supported values are 1, 2, 3, "
+                "and 4."
+            )
+        if (kind in (1, 3)) != odd:
+            raise ValueError(
+                f"A linear-phase FIR filter of type {kind} must have "
+                f"{'an odd' if kind in (1, 3) else 'an even'} number of taps, got "
+                f"{num.shape[-1]}."
+            )
+        return kind
+    if np.iscomplexobj(num):
+        detected = None
+    else:
+        # Allow for round-off in designed coefficients
+        atol = 8 * np.finfo(float).eps * np.abs(num).max(initial=0)
+        reversed_num = num[..., ::-1]
+        if np.allclose(num, reversed_num, rtol=0, atol=atol):
+            detected = 1 if odd else 2
+        elif np.allclose(num, -reversed_num, rtol=0, atol=atol):
+            detected = 3 if odd else 4
+        else:
+            detected = None
+    if detected is None and kind is True:
+        raise ValueError("'num' is neither symmetric nor antisymmetric.")
+    return detected
+
+
+def fir_amplitude(num, kind, w, workers=None):
+    """
+    Evaluate the real amplitude response of linear-phase FIR filters.
+
+    The frequency response is :math:`H(\\omega) = A(\\omega)e^{j\\theta(\\omega)}`,
+    where :math:`\\theta(\\omega)` is given by :func:`fir_phase` without the jumps
+    where :math:`A(\\omega)` is negative.
+
+    Parameters
+    ----------
+    num : array-like
+        Impulse responses along the last axis.
+    kind : {1, 2, 3, 4}
+        Linear-phase type, see :func:`fir_linear_phase_type`.
+    w : array-like
+        Frequency-points.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
+
+    Returns
+    -------
+    ndarray
+        The real amplitude response.
+
+    Notes
+    -----
+    The amplitude is a cosine series, for types 1 and 2, or sine series, for types
+    3 and 4, with half as many terms as *num*, which is evaluated in real
+    arithmetic using Clenshaw's recurrence. If *w* is a grid evaluated using FFTs
+    or the chirp-z transform by :func:`freqz_tf`, the amplitude is instead the
+    real or imaginary part of the response with the linear phase removed.
+    """
+    num = np.atleast_1d(np.asarray(num, dtype=float))
+    w = np.asarray(w, dtype=float)
+    length = num.shape[-1]
+    if _uses_transform(length, w):
+        rotated = _polyval_grid(num, w, workers=workers) * np.exp(
+            0.5j * (length - 1) * w
+        )
+        return rotated.real if kind in (1, 2) else rotated.imag
+    return _map_chunks(functools.partial(_fir_amplitude_series, num, kind), w, workers)
+
+
+def fir_phase(num, kind, w, amplitude=None):
+    """
+    Return the phase response of linear-phase FIR filters.
+
+    Parameters
+    ----------
+    num : array-like
+        Impulse responses along the last axis.
+    kind : {1, 2, 3, 4}
+        Linear-phase type, see :func:`fir_linear_phase_type`.
+    w : array-like
+        Frequency-points.
+    amplitude : ndarray, optional
+        The amplitude response from :func:`fir_amplitude`. If given, the phase
+        jumps by :math:`\\pi` where the amplitude is negative, so that it is the
+        phase of the frequency response.
+
+    Returns
+    -------
+    ndarray
+        :math:`-\\omega(N - 1)/2`, plus :math:`\\pi/2` for types 3 and 4, where
+        :math:`N` is the number of taps.
+    """
+    w = np.asarray(w, dtype=float)
+    phase = delay_phase(
+        w, 0.5 * (np.shape(num)[-1] - 1), amplitude, quadrature=kind in (3, 4)
+    )
+    return np.array(np.broadcast_to(phase, np.shape(num)[:-1] + w.shape))
+
+
+def delay_phase(w, delay, amplitude=None, quadrature=False):
+    """
+    Return the phase response of linear-phase systems with real amplitude.
+
+    Parameters
+    ----------
+    w : array-like
+        Frequency-points.
+    delay : float
+        Group delay in samples.
+    amplitude : ndarray, optional
+        The real amplitude response. If given, the phase jumps by :math:`\\pi`
+        where the amplitude is negative.
+    quadrature : bool, default: False
+        Whether the amplitude multiplies :math:`j`, as for antisymmetric impulse
+        responses.
+
+    Returns
+    -------
+    ndarray
+        :math:`-\\omega \\cdot delay`, plus :math:`\\pi/2` if *quadrature*.
+    """
+    phase = -delay * np.asarray(w, dtype=float)
+    if quadrature:
+        phase = phase + np.pi / 2
+    if amplitude is not None:
+        phase = phase + np.where(amplitude < 0, np.pi, 0)
+    return phase
+
+
+def dirichlet(w, length):
+    """
+    Evaluate the Dirichlet kernel.
+
+    Parameters
+    ----------
+    w : array-like
+        Frequency-points.
+    length : int
+        Number of terms :math:`L`.
+
+    Returns
+    -------
+    ndarray
+        :math:`\\sin(L\\omega/2)/\\sin(\\omega/2)`, which is :math:`\\pm L` at
+        multiples of :math:`2\\pi`. This is the amplitude response of
+        :math:`\\sum_{n=0}^{L-1} z^{-n}` with the delay :math:`(L - 1)/2` removed.
+    """
+    w = np.asarray(w, dtype=float)
+    # Reduce to [-pi, pi], where sin(w/2) only vanishes at zero, using
+    # D(w + 2 pi k) = (-1)^(k (L - 1)) D(w)
+    periods = np.round(w / (2 * np.pi))
+    half = (w - 2 * np.pi * periods) / 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        kernel = np.where(half == 0, length, np.sin(length * half) / np.sin(half))
+    if length % 2 == 0:
+        kernel = np.where(periods % 2 == 0, kernel, -kernel)
+    return kernel
+
+
+def cic_amplitude(length, order, w, normalize=True):
+    """
+    Evaluate the real amplitude response of cascaded moving sums.
+
+    Parameters
+    ----------
+    length : int
+        Length :math:`L` of each moving sum, e.g., :math:`RM` for a CIC filter with
+        rate change :math:`R` and differential delay :math:`M`.
+    order : int
+        Number of cascaded moving sums :math:`N`.
+    w : array-like
+        Frequency-points.
+    normalize : bool, default: True
+        Whether to divide by the DC gain :math:`L^N`.
+
+    Returns
+    -------
+    ndarray
+        The amplitude :math:`D_L(\\omega)^N`, see :func:`dirichlet`, of the response
+        :math:`(\\sum_{n=0}^{L-1} z^{-n})^N`, which has the linear phase of a delay
+        of :math:`N(L - 1)/2`.
+    """
+    kernel = dirichlet(w, length)
+    if normalize:
+        kernel = kernel / length
+    return kernel**order
+
+
+def cic_magnitude_db(length, order, w, normalize=True):
+    """
+    Evaluate the magnitude in dB of cascaded moving sums.
+
+    Parameters
+    ----------
+    length, order : int
+        Length and number of the moving sums, see :func:`cic_amplitude`.
+    w : array-like
+        Frequency-points.
+    normalize : bool, default: True
+        Whether to divide by the DC gain :math:`L^N`.
+
+    Returns
+    -------
+    ndarray
+        :math:`20N\\log_{10}|D_L(\\omega)|`, which does not overflow or underflow
+        for high orders.
+    """
+    kernel = np.abs(dirichlet(w, length))
+    if normalize:
+        kernel = kernel / length
+    with np.errstate(divide='ignore'):
+        return 20 * order * np.log10(kernel)
+
+
+def freqz_comb(delay, gain, w, feedback=False):
+    """
+    Evaluate comb filter to determine frequency response.
+
+    Parameters
+    ----------
+    delay : int
+        Delay :math:`D` in samples.
+    gain : float
+        Gain :math:`g` of the delayed signal.
+    w : array-like
+        Frequency-points.
+    feedback : bool, default: False
+        Whether the comb filter is feedforward, :math:`1 + gz^{-D}`, or feedback,
+        :math:`1/(1 - gz^{-D})`.
+
+    Returns
+    -------
+    h : ndarray
+        The frequency response.
+    """
+    delayed = gain * np.exp(-1j * delay * np.asarray(w, dtype=float))
+    if feedback:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return 1 / (1 - delayed)
+    return 1 + delayed
+
+
+def group_delay_comb(delay, gain, w, feedback=False):
+    """
+    Evaluate comb filter to determine group delay.
+
+    Parameters
+    ----------
+    delay : int
+        Delay :math:`D` in samples.
+    gain : float
+        Gain :math:`g` of the delayed signal.
+    w : array-like
+        Frequency-points.
+    feedback : bool, default: False
+        Whether the comb filter is feedback, see :func:`freqz_comb`.
+
+    Returns
+    -------
+    gd : ndarray
+        The group delay. NaN where the response is zero or infinite.
+    """
+    delayed = gain * np.exp(-1j * delay * np.asarray(w, dtype=float))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if feedback:
+            gd = np.real(delay * delayed / (1 - delayed))
+        else:
+            gd = np.real(delay * delayed / (1 + delayed))
+    gd[~np.isfinite(gd)] = np.nan
+    return gd
+
+
+def adaptive_grid(response, w0, w1, n, tol=1e-2, roots=None, n_initial=33, log=False):
+    """
+    Determine frequency-points by refining where the response is not smooth.
+
+    Starting from a coarse uniform grid, intervals are bisected while the
+    logarithm of the response at the midpoint deviates more than *tol* from the
+    linear interpolation of the end points. This measures the curvature of the
+    magnitude in dB, :math:`20/\\ln 10` times the real part, and of the phase in
+    radians, the imaginary part.
+
+    Parameters
+    ----------
+    response : callable
+        Function returning the frequency response, possibly with leading
+        dimensions for multiple filters, for an array of frequency-points.
+    w0, w1 : float
+        Frequency range.
+    n : int
+        Maximum number of frequency-points.
+    tol : float, default: 0.01
+        Tolerance of the deviation of the logarithm of the response.
+    roots : array-like, optional
+        Zeros and poles. Points are added around roots close to the unit circle,
+        so that narrow notches and resonances are not missed. If there are more
+        such points than *n* allows, those nearest the roots are used.
+    n_initial : int, default: 33
+        Number of points in the initial grid.
+    log : bool, default: False
+        Whether to start from a logarithmically spaced grid and bisect intervals
+        in :math:`\\log_{10}\\omega`, for a logarithmic frequency axis. Requires
+        :math:`0 < w_0`.
+
+    Returns
+    -------
+    w : ndarray
+        The frequency-points.
+    h : ndarray
+        The frequency response at *w*.
+    """
+    seeds = None if roots is None else _root_seeds(roots, w0, w1)
+    if log:
+        if not 0 < w0 < w1:
+            raise ValueError(
+                f"The frequency range must satisfy 0 < w0 < w1, got ({w0}, {w1})."
+            )
+        # Bisect the exponents of the frequency-points
+        w0, w1 = math.log10(w0), math.log10(w1)
+        if seeds is not None:
+            seeds = np.log10(seeds[seeds > 0])
+        frequency_response = response
+
+        def response(exponents):
+            return frequency_response(10**exponents)
+
+    w = np.linspace(w0, w1, max(min(n, n_initial), 2))
+    if seeds is not None:
+        # Seeds nearest the roots first, as many as the number of points allows
+        seeds = seeds[~np.isin(seeds, w)]
+        first = np.sort(np.unique(seeds, return_index=True)[1])
+        w = np.union1d(w, seeds[first][: max(n - w.size, 0)])
+    h = response(w)
+    refine = np.ones(w.size - 1, dtype=bool)
+    # Stop at notches, where the logarithm is singular
+    min_width = 1e-6 * (w1 - w0)
+    while w.size < n:
+        refine &= np.diff(w) > min_width
+        left = np.flatnonzero(refine)
+        if not left.size:
+            break
+        w_mid = (w[left] + w[left + 1]) / 2
+        h_mid = response(w_mid)
+        error = _log_interpolation_error(h[..., left], h_mid, h[..., left + 1])
+        if left.size > n - w.size:
+            # Only add the midpoints of the worst intervals
+            selected = np.sort(np.argsort(error)[::-1][: n - w.size])
+            left, w_mid, error = left[selected], w_mid[selected], error[selected]
+            h_mid = h_mid[..., selected]
+        positions = left + 1
+        w = np.insert(w, positions, w_mid)
+        h = np.insert(h, positions, h_mid, axis=-1)
+        # Both halves of an interval that did not meet the tolerance are refined
+        split = np.zeros(refine.size, dtype=bool)
+        split[left] = ~(error <= tol)
+        counts = np.ones(refine.size, dtype=int)
+        counts[left] = 2
+        refine = np.repeat(split, counts)
+    if log:
+        w = 10**w
+    return w, h
+
+
+def linear_grid(w0, w1, n, endpoint, start, stop):
+    """
+    Return a block of uniformly spaced frequency-points.
+
+    The result is equal to ``np.linspace(w0, w1, n, endpoint=endpoint)[start:stop]``
+    without computing the full grid.
+
+    Parameters
+    ----------
+    w0, w1 : float
+        Frequency range.
+    n : int
+        Number of frequency-points of the full grid.
+    endpoint : bool
+        Whether *w1* is the last frequency-point.
+    start, stop : int
+        Indices of the block.
+
+    Returns
+    -------
+    ndarray
+    """
+    div = n - 1 if endpoint else n
+    w = np.arange(start, stop, dtype=float)
+    if div > 0:
+        w *= (w1 - w0) / div
+    w += w0
+    if endpoint and n > 1 and stop == n:
+        w[-1] = w1
+    return w
+
+
+def log_grid(w0, w1, points_per_decade):
+    """
+    Return logarithmically spaced frequency-points.
+
+    The number of points is proportional to the number of decades covered, so wide
+    frequency ranges are evaluated at a constant resolution on a logarithmic axis.
+
+    Parameters
+    ----------
+    w0, w1 : float
+        Positive frequency range. Both end points are included.
+    points_per_decade : int
+        Number of points per decade.
+
+    Returns
+    -------
+    ndarray
+    """
+    if not 0 < w0 < w1:
+        raise ValueError(
+            f"The frequency range must satisfy 0 < w0 < w1, got ({w0}, {w1})."
+        )
+    if points_per_decade < 1:
+        raise ValueError("'points_per_decade' must be a positive integer.")
+    decades = math.log10(w1 / w0)
+    n = max(2, math.ceil(decades * points_per_decade) + 1)
+    w = np.logspace(math.log10(w0), math.log10(w1), n)
+    w[0] = w0
+    w[-1] = w1
+    return w
+
+
+def decade_range(roots, margin=1):
+    """
+    Return a frequency range covering the magnitudes of zeros and poles.
+
+    Parameters
+    ----------
+    roots : array-like
+        Zeros and poles.
+    margin : int, default: 1
+        Number of decades to add below the smallest and above the largest nonzero
+        magnitude.
+
+    Returns
+    -------
+    (float, float)
+        Powers of ten. (0.1, 10) if there are no nonzero roots.
+    """
+    magnitudes = np.abs(np.ravel(np.asarray(roots, dtype=complex)))
+    magnitudes = magnitudes[np.isfinite(magnitudes) & (magnitudes > 0)]
+    if not magnitudes.size:
+        return 10.0**-margin, 10.0**margin
+    low = math.floor(math.log10(magnitudes.min())) - margin
+    high = math.ceil(math.log10(magnitudes.max())) + margin
+    return 10.0**low, 10.0**high
+
+
+def evaluate_blocks(grid, n, evaluate, max_memory, n_filters=1, n_bins=None):
+    """
+    Evaluate quantities on a frequency grid in blocks and reduce them per bin.
+
+    The grid is split into bins of equal length such that there are at most
+    *n_bins* bins. Each bin is reduced to its minimum and maximum, in the order
+    they occur, so that the reduced quantities look the same as the full ones when
+    plotted with at most *n_bins* pixels. Only one block of the grid is evaluated at
+    a time, so the memory use does not depend on *n*.
+
+    Parameters
+    ----------
+    grid : callable
+        Function returning the frequency-points with indices ``start:stop`` for the
+        arguments *start* and *stop*.
+    n : int
+        Number of frequency-points.
+    evaluate : callable
+        Function returning a dict of quantities for an array of frequency-points,
+        with frequency along the last axis. Called for consecutive blocks.
+    max_memory : int
+        Approximate maximum number of bytes used when evaluating a block.
+    n_filters : int, default: 1
+        Number of filters evaluated by *evaluate*.
+    n_bins : int, optional
+        Maximum number of bins. Default: 4096.
+
+    Returns
+    -------
+    dict
+        The reduced quantities and the corresponding frequency-points as 'w'.
+    """
+    if n_bins is None:
+        n_bins = _REDUCED_BINS
+    bin_size = max(1, -(-n // n_bins))
+    block_size = max(1, max_memory // (_BLOCK_BYTES_PER_POINT * n_filters) // bin_size)
+    block_size *= bin_size
+    reduced = {'w': []}
+    for start in range(0, n, block_size):
+        w = grid(start, min(start + block_size, n))
+        for name, values in evaluate(w).items():
+            reduced.setdefault(name, []).append(minmax_reduce(values, bin_size))
+        reduced['w'].append(minmax_reduce(w, bin_size, extrema=False))
+    return {name: np.concatenate(values, axis=-1) for name, values in reduced.items()}
+
+
+def minmax_reduce(values, bin_size, extrema=True):
+    """
+    Reduce consecutive bins along the last axis to two values each.
+
+    Parameters
+    ----------
+    values : ndarray
+        Values to reduce. The last bin may be shorter than *bin_size*.
+    bin_size : int
+        Number of values per bin. If 1, *values* is returned.
+    extrema : bool, default: True
+        If True, keep the minimum and maximum of each bin, NaN if all values of the
+        bin are NaN, in the order they occur. Otherwise, keep the first and last
+        value of each bin, e.g., for the frequency-points.
+
+    Returns
+    -------
+    ndarray
+        Array with ``2 * ceil(values.shape[-1] / bin_size)`` values along the last
+        axis.
+    """
+    if bin_size == 1:
+        return values
+    padding = -values.shape[-1] % bin_size
+    if padding:
+        # Repeating the last value changes neither extrema nor last values
+        values = np.concatenate(
+            (values, np.repeat(values[..., -1:], padding, axis=-1)), axis=-1
+        )
+    values = values.reshape(*values.shape[:-1], -1, bin_size)
+    if extrema:
+        nan = np.isnan(values)
+        low = np.where(nan, np.inf, values).argmin(axis=-1)
+        high = np.where(nan, -np.inf, values).argmax(axis=-1)
+        indices = np.stack((np.minimum(low, high), np.maximum(low, high)), axis=-1)
+        values = np.take_along_axis(values, indices, axis=-1)
+    else:
+        values = values[..., [0, -1]]
+    return values.reshape(*values.shape[:-2], -1)
+
+
+def envelope_indices(x, values, xlim, n_columns, log=False):
+    """
+    Return indices of points preserving the envelope of curves per pixel column.
+
+    The x-range is split into *n_columns* columns and, for each column and curve,
+    the first, last, minimum, and maximum finite point is kept, as well as the
+    points on both sides of non-finite values, where the line is broken. Plotting
+    the kept points with lines draws the same pixels as plotting all points, so
+    peaks, notches, and jumps are preserved.
+
+    Parameters
+    ----------
+    x : ndarray
+        Increasing x-values.
+    values : ndarray
+        Curves with x along the last axis.
+    xlim : (float, float)
+        The x-range mapped to the columns. Points outside are grouped into one
+        column on each side.
+    n_columns : int
+        Number of columns, e.g., the width of the Axes in pixels.
+    log : bool, default: False
+        Whether the x-axis is logarithmic.
+
+    Returns
+    -------
+    ndarray or None
+        Increasing indices of the points to keep, or None if all points should be
+        kept, i.e., if there are at most four points per column or *x* is not
+        increasing.
+    """
+    n = x.size
+    if n <= 4 * n_columns or n_columns < 1 or np.any(np.diff(x) < 0):
+        return None
+    x0, x1 = xlim
+    if log:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x, x0, x1 = np.log10(x), np.log10(x0), np.log10(x1)
+    if not x1 > x0:
+        return None
+    with np.errstate(invalid='ignore'):
+        column = np.floor((x - x0) * (n_columns / (x1 - x0)))
+    column = np.clip(np.nan_to_num(column, nan=-1), -1, n_columns).astype(np.intp)
+    starts = np.flatnonzero(np.diff(column, prepend=column[0] - 1))
+    segment = np.repeat(np.arange(starts.size), np.diff(starts, append=n))
+    keep = np.zeros(n, dtype=bool)
+    keep[starts] = True
+    keep[np.append(starts[1:], n) - 1] = True
+    for row in values.reshape(-1, n):
+        finite = np.isfinite(row)
+        if not finite.all():
+            breaks = np.flatnonzero(finite[1:] != finite[:-1])
+            keep[breaks] = True
+            keep[breaks + 1] = True
+        for extreme, fill in ((np.minimum, np.inf), (np.maximum, -np.inf)):
+            key = np.where(finite, row, fill)
+            matches = np.flatnonzero(key == extreme.reduceat(key, starts)[segment])
+            # The first match of each segment
+            first = np.diff(segment[matches], prepend=-1) != 0
+            keep[matches[first]] = True
+    return np.flatnonzero(keep)
+
+
+def unwrap_continued(phase, previous=None):
+    """
+    Unwrap phase along the last axis, continuing from a previous block.
+
+    Parameters
+    ----------
+    phase : ndarray
+        Wrapped phase.
+    previous : ndarray, optional
+        The last unwrapped phase of the previous block.
+
+    Returns
+    -------
+    ndarray
+        The unwrapped phase, equal to unwrapping the concatenated blocks at once.
+    """
+    if previous is None:
+        return np.unwrap(phase)
+    phase = np.concatenate((np.asarray(previous)[..., np.newaxis], phase), axis=-1)
+    return np.unwrap(phase)[..., 1:]
+
+
+def group_delay_from_phase(w, phase):
+    """
+    Estimate group delay from unwrapped phase response.
+
+    The group delay between consecutive frequency-points is estimated from the
+    difference of the phase, ignoring jumps larger than 3 rad, e.g., at zeros on
+    the unit circle. The estimate at each point is the mean of the estimates of
+    the adjacent intervals.
+
+    Parameters
+    ----------
+    w : array-like
+        Frequency-points.
+    phase : array-like
+        Unwrapped phase response, with frequency along the last axis.
+
+    Returns
+    -------
+    ndarray
+        The estimated group delay at *w*.
+    """
+    w = np.asarray(w)
+    phase = np.asarray(phase)
+    if w.size < 2:
+        return np.full(phase.shape, np.nan)
+    phase_diff = np.diff(phase, axis=-1)
+    phase_diff[np.abs(phase_diff) > 3] = np.nan
+    gd_between = -phase_diff / np.diff(w)
+    gd = np.empty(phase.shape, dtype=gd_between.dtype)
+    gd[..., 0] = gd_between[..., 0]
+    gd[..., -1] = gd_between[..., -1]
+    left = gd_between[..., :-1]
+    right = gd_between[..., 1:]
+    gd[..., 1:-1] = np.where(
+        np.isnan(left), right, np.where(np.isnan(right), left, (left + right) / 2)
+    )
+    return gd
+
+
+def _uniform_grid_period(w):
+    """
+    Return the FFT length matching a uniform frequency grid.
+
+    Parameters
+    ----------
+    w : ndarray
+        Frequency-points.
+
+    Returns
+    -------
+    int or None
+        The length :math:`L` such that :math:`w_k = 2\\pi k/L` for all *k*, or None
+        if *w* is not such a grid.
+    """
+    if w.ndim != 1 or w.size < 2 or w[0] != 0 or not np.isrealobj(w):
+        return None
+    step = w[1]
+    if step <= 0:
+        return None
+    period = round(2 * np.pi / step)
+    if period < w.size or not math.isclose(2 * np.pi / period, step, rel_tol=1e-12):
+        return None
+    reference = np.arange(w.size) * (2 * np.pi / period)
+    if not np.allclose(w, reference, rtol=1e-12, atol=0):
+        return None
+    return period
+
+
+def _uniform_grid(w):
+    """
+    Return start and step of a uniform frequency grid.
+
+    Parameters
+    ----------
+    w : ndarray
+        Frequency-points.
+
+    Returns
+    -------
+    tuple of float or None
+        ``(w[0], step)`` such that :math:`w_k = w_0 + k \\cdot step`, or None if *w*
+        is not such a grid.
+    """
+    if w.ndim != 1 or w.size < 2 or not np.isrealobj(w):
+        return None
+    start = float(w[0])
+    step = float(w[-1] - w[0]) / (w.size - 1)
+    if step <= 0:
+        return None
+    reference = start + np.arange(w.size) * step
+    if not np.allclose(w, reference, rtol=0, atol=1e-12 * np.abs(w).max()):
+        return None
+    return start, step
+
+
+def _uses_transform(length, w):
+    """
+    Return whether :func:`_polyval_grid` evaluates polynomials of *length*
+    coefficients at *w* using FFTs or the chirp-z transform.
+    """
+    period = _uniform_grid_period(w)
+    if period is not None and period <= 2 * w.size:
+        return True
+    fft_length = _next_fast_len(length + w.size - 1)
+    return (
+        length * w.size > 4 * fft_length * math.log2(fft_length)
+        and _uniform_grid(w) is not None
+    )
+
+
+def _next_fast_len(n):
+    """Return the smallest 5-smooth integer larger than or equal to *n*."""
+    if n <= 6:
+        return n
+    best = 1 << (n - 1).bit_length()
+    p5 = 1
+    while p5 < best:
+        p35 = p5
+        while p35 < best:
+            quotient = -(-n // p35)
+            best = min(best, p35 << (quotient - 1).bit_length())
+            p35 *= 3
+        p5 *= 5
+    return best
+
+
+def _polyval_grid(coeffs, w, dtype=None, workers=None):
+    """
+    Evaluate polynomials in :math:`e^{-j\\omega}` at *w*.
+
+    Uniform grids starting at zero are evaluated using :func:`_polyval_fft`,
+    other uniform grids using :func:`_polyval_czt` when that requires fewer
+    operations, and remaining grids using :func:`_polyval`.
+
+    Parameters
+    ----------
+    coeffs : array-like
+        Coefficients, lowest order first, along the last axis.
+    w : ndarray
+        Frequency-points.
+    dtype : {None, numpy.complex128, numpy.complex64}, optional
+        Precision of the computation, see :func:`freqz_tf`.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
+
+    Returns
+    -------
+    ndarray
+        Array of shape ``coeffs.shape[:-1] + w.shape``.
+    """
+    coeffs = np.atleast_1d(np.asarray(coeffs))
+    if not _is_single(dtype):
+        return _polyval_grid_error(coeffs, w, workers=workers)[0]
+    values, error = _polyval_grid_error(coeffs, w, single=True, workers=workers)
+    return _guard_single(values, error, lambda w: _polyval(np.exp(-1j * w), coeffs), w)
+
+
+def _polyval_grid_error(coeffs, w, single=False, workers=None):
+    """
+    Evaluate polynomials in :math:`e^{-j\\omega}` at *w* with an error estimate.
+
+    Parameters
+    ----------
+    coeffs : ndarray
+        Coefficients, lowest order first, along the last axis.
+    w : ndarray
+        Frequency-points.
+    single : bool, default: False
+        Whether to compute in single precision.
+    workers : int, optional
+        Number of threads to evaluate with. Horner's method is split along *w* and
+        FFTs along the filters.
+
+    Returns
+    -------
+    values : ndarray
+        Array of shape ``coeffs.shape[:-1] + w.shape``.
+    error : ndarray or None
+        Estimated relative error of *values* if *single*, otherwise None.
+    """
+    evaluated = _to_single(coeffs) if single else coeffs
+    length = coeffs.shape[-1]
+    period = _uniform_grid_period(w)
+    if period is not None and period > 2 * w.size:
+        # Only a small part of the FFT would be used, e.g., for the first block of
+        # a large grid
+        period = None
+    grid = None
+    if period is None:
+        # Rough operation counts of Horner's method and three FFTs
+        fft_length = _next_fast_len(length + w.size - 1)
+        if length * w.size > 4 * fft_length * math.log2(fft_length):
+            grid = _uniform_grid(w)
+    # Bounds of the round-off error growth relative to sum(abs(coeffs))
+    if period is not None:
+        values = _map_rows(
+            lambda c: _polyval_fft(c, w.size, period), evaluated, workers
+        )
+        growth = 2 * math.log2(period) + math.ceil(length / period)
+    elif grid is not None:
+        values = _map_rows(lambda c: _polyval_czt(c, *grid, w.size), evaluated, workers)
+        growth = 6 * math.log2(fft_length)
+    else:
+
+        def horner(w):
+            x = np.exp(-1j * w)
+            return _polyval(x.astype(np.complex64) if single else x, evaluated)
+
+        values = _map_chunks(horner, w, workers)
+        growth = 2 * length
+    if not single:
+        return values, None
+    with np.errstate(divide='ignore', invalid='ignore'):
+        error = (
+            growth
+            * _SINGLE_EPS
+            * np.abs(coeffs).sum(axis=-1, keepdims=True)
+            / np.abs(values)
+        )
+    return values, error
+
+
+def _polyval_czt(coeffs, start, step, n):
+    """
+    Evaluate a polynomial in :math:`e^{-j\\omega}` on a uniform grid using the
+    chirp-z transform.
+
+    Parameters
+    ----------
+    coeffs : array-like
+        Coefficients, lowest order first, along the last axis.
+    start : float
+        First frequency-point.
+    step : float
+        Distance between frequency-points.
+    n : int
+        Number of frequency-points.
+
+    Returns
+    -------
+    ndarray
+        The polynomial evaluated at :math:`\\omega_k = start + k \\cdot step`,
+        k < *n*.
+
+    Notes
+    -----
+    Uses Bluestein's algorithm, :math:`km = (k^2 + m^2 - (k - m)^2)/2`, which turns
+    the evaluation into a convolution computed with FFTs of a 5-smooth length of
+    at least ``len(coeffs) + n - 1``.
+    """
+    coeffs = np.atleast_1d(np.asarray(coeffs))
+    dtype = np.result_type(coeffs, np.complex64)
+    length = coeffs.shape[-1]
+    fft_length = _next_fast_len(length + n - 1)
+    # The chirps are always computed in double precision as the phase grows
+    # quadratically
+    k = np.arange(max(length, n), dtype=float)
+    chirp = np.exp(-0.5j * step * k**2)
+    x = coeffs * (np.exp(-1j * start * k[:length]) * chirp[:length]).astype(dtype)
+    kernel = np.zeros(fft_length, dtype=dtype)
+    kernel[:n] = chirp[:n].conj()
+    kernel[fft_length - length + 1 :] = chirp[1:length][::-1].conj()
+    y = np.fft.ifft(np.fft.fft(x, fft_length) * np.fft.fft(kernel))
+    return (y[..., :n] * chirp[:n].astype(dtype)).astype(dtype, copy=False)
+
+
+def _polyval_fft(coeffs, n, period):
+    """
+    Evaluate a polynomial in :math:`e^{-j\\omega}` on a uniform grid using an FFT.
+
+    Parameters
+    ----------
+    coeffs : array-like
+        Coefficients, lowest order first.
+    n : int
+        Number of frequency-points.
+    period : int
+        FFT length, see :func:`_uniform_grid_period`.
+
+    Returns
+    -------
+    ndarray
+        The polynomial evaluated at :math:`\\omega_k = 2\\pi k/L`, k < *n*.
+    """
+    coeffs = np.atleast_1d(np.asarray(coeffs))
+    length = coeffs.shape[-1]
+    if length > period:
+        # e^{-j 2 pi k m / L} is periodic in m, so fold the coefficients to
+        # keep the FFT length equal to the grid period
+        coeffs = np.pad(coeffs, [(0, 0)] * (coeffs.ndim - 1) + [(0, -length % period)])
+        coeffs = coeffs.reshape(*coeffs.shape[:-1], -1, period).sum(axis=-2)
+    dtype = np.result_type(coeffs, np.complex64)
+    if np.isrealobj(coeffs) and n <= period // 2 + 1:
+        return np.fft.rfft(coeffs, period)[..., :n].astype(dtype, copy=False)
+    return np.fft.fft(coeffs, period)[..., :n].astype(dtype, copy=False)
+
+
+def _polyval(x, coeffs):
+    """
+    Evaluate polynomials at *x*.
+
+    Parameters
+    ----------
+    x : ndarray
+        Points to evaluate at.
+    coeffs : array-like
+        Coefficients, lowest order first, along the last axis.
+
+    Returns
+    -------
+    ndarray
+        Array of shape ``coeffs.shape[:-1] + x.shape``.
+    """
+    coeffs = np.moveaxis(np.atleast_1d(coeffs), -1, 0)
+    return np.polynomial.polynomial.polyval(x, coeffs, tensor=True)
+
+
+def _polyvalfromroots(x, roots):
+    """
+    Evaluate polynomials given by their roots at *x*.
+
+    Parameters
+    ----------
+    x : ndarray
+        Points to evaluate at.
+    roots : array-like
+        Roots along the last axis.
+
+    Returns
+    -------
+    ndarray
+        Array of shape ``roots.shape[:-1] + x.shape``.
+    """
+    roots = np.moveaxis(np.atleast_1d(roots), -1, 0)
+    return np.polynomial.polynomial.polyvalfromroots(x, roots, tensor=True)
+
+
+def _autocorrelation(coeffs):
+    """
+    Return the autocorrelation of coefficients along the last axis for lags
+    :math:`0, 1, \\ldots, N - 1`.
+    """
+    length = coeffs.shape[-1]
+    if length <= 64:
+        return np.stack(
+            [
+                (coeffs[..., lag:] * coeffs[..., : length - lag]).sum(axis=-1)
+                for lag in range(length)
+            ],
+            axis=-1,
+        )
+    fft_length = _next_fast_len(2 * length - 1)
+    spectrum = np.fft.rfft(coeffs, fft_length)
+    return np.fft.irfft(spectrum.real**2 + spectrum.imag**2, fft_length)[..., :length]
+
+
+def _polynomial_power(coeffs, w, workers=None):
+    """
+    Squared magnitude of real polynomials in :math:`e^{-j\\omega}`.
+
+    Parameters
+    ----------
+    coeffs : array-like
+        Real coefficients along the last axis.
+    w : ndarray
+        Frequency-points.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
+
+    Returns
+    -------
+    ndarray
+        Array of shape ``coeffs.shape[:-1] + w.shape``.
+    """
+    coeffs = np.atleast_1d(np.asarray(coeffs, dtype=float))
+    if _uses_transform(coeffs.shape[-1], w):
+        # One transform of the coefficients is cheaper than computing and
+        # transforming the autocorrelation, and its squared magnitude has a
+        # smaller rounding error where the response is small
+        return np.abs(_polyval_grid(coeffs, w, workers=workers)) ** 2
+    lags = _autocorrelation(coeffs)
+    symmetric = np.concatenate((lags[..., :0:-1], lags), axis=-1)
+    power = fir_amplitude(symmetric, 1, w, workers)
+    # Bound of the round-off error, which is large relative to the power where the
+    # response is small
+    error = (
+        coeffs.shape[-1]
+        * np.finfo(float).eps
+        * np.abs(symmetric).sum(axis=-1, keepdims=True)
+    )
+    inaccurate = np.broadcast_to(~(error <= _POWER_RTOL * power), power.shape)
+    columns = inaccurate.reshape(-1, w.size).any(axis=0)
+    if columns.any():
+        power[..., columns] = np.abs(_polyval_grid(coeffs, w[columns])) ** 2
+    return power
+
+
+def _polynomial_group_delay(coeffs, w, dtype=None, workers=None):
+    """
+    Group delay of a polynomial in :math:`e^{-j\\omega}`.
+
+    Parameters
+    ----------
+    coeffs : array-like
+        Coefficients, lowest order first, along the last axis.
+    w : ndarray
+        Frequency-points.
+    dtype : {None, numpy.complex128, numpy.complex64}, optional
+        Precision of the computation, see :func:`freqz_tf`.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
+
+    Returns
+    -------
+    ndarray
+        Array of shape ``coeffs.shape[:-1] + w.shape``.
+    """
+    coeffs = np.atleast_1d(np.asarray(coeffs))
+    ramped = coeffs * np.arange(coeffs.shape[-1])
+    single = _is_single(dtype)
+    values, error = _polyval_grid_error(coeffs, w, single, workers)
+    ramped_values, ramped_error = _polyval_grid_error(ramped, w, single, workers)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = ramped_values / values
+        gd = np.real(ratio)
+    gd[~np.isfinite(gd)] = np.nan
+    if not single:
+        return gd
+    # Taking the real part may cancel, so bound the error using abs(ratio)
+    with np.errstate(invalid='ignore'):
+        error = (error + ramped_error) * np.abs(ratio) / np.maximum(1, np.abs(gd))
+    return _guard_single(
+        gd, error, functools.partial(_polynomial_group_delay, coeffs), w
+    )
+
+
+def _root_group_delay(x, roots):
+    """
+    Group delay contribution of polynomials given by their roots.
+
+    Parameters
+    ----------
+    x : ndarray
+        Points on the unit circle to evaluate at.
+    roots : array-like
+        Roots along the last axis.
+
+    Returns
+    -------
+    ndarray
+        Array of shape ``roots.shape[:-1] + x.shape``.
+    """
+    roots = np.atleast_1d(np.asarray(roots))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gd = np.real(x / (x - roots[..., np.newaxis])).sum(axis=-2)
+    gd[~np.isfinite(gd)] = np.nan
+    return gd
+
+
+def _polynomial_group_delay_s(coeffs, s):
+    """
+    Return :math:`\\mathrm{Re}\\{B'(s)/B(s)\\}` of polynomials in *s*.
+
+    Parameters
+    ----------
+    coeffs : array-like
+        Coefficients, highest power first, along the last axis.
+    s : ndarray
+        Points on the imaginary axis to evaluate at.
+
+    Returns
+    -------
+    ndarray
+        Array of shape ``coeffs.shape[:-1] + s.shape``.
+    """
+    coeffs = np.atleast_1d(np.asarray(coeffs))[..., ::-1]
+    if coeffs.shape[-1] < 2:
+        # Constant polynomials have no group delay
+        return np.zeros(coeffs.shape[:-1] + s.shape)
+    derivative = coeffs[..., 1:] * np.arange(1, coeffs.shape[-1])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gd = np.real(_polyval(s, derivative) / _polyval(s, coeffs))
+    gd[~np.isfinite(gd)] = np.nan
+    return gd
+
+
+def _root_group_delay_s(s, roots):
+    """
+    Sum of :math:`\\mathrm{Re}\\{1/(s - r)\\}` over roots along the last axis.
+
+    Parameters
+    ----------
+    s : ndarray
+        Points on the imaginary axis to evaluate at.
+    roots : array-like
+        Roots along the last axis.
+
+    Returns
+    -------
+    ndarray
+        Array of shape ``roots.shape[:-1] + s.shape``.
+    """
+    roots = np.atleast_1d(np.asarray(roots))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gd = np.real(1 / (s - roots[..., np.newaxis])).sum(axis=-2)
+    gd[~np.isfinite(gd)] = np.nan
+    return gd
+
+
+def _fir_amplitude_series(num, kind, w):
+    """
+    Evaluate the amplitude of linear-phase FIR filters as a trigonometric series.
+
+    Each term :math:`\\phi_k` of the series is :math:`\\cos(k\\omega)`,
+    :math:`\\cos((k + 1/2)\\omega)`, :math:`\\sin(k\\omega)`, or
+    :math:`\\sin((k + 1/2)\\omega)` for types 1 to 4. All satisfy
+    :math:`\\phi_{k+1} = 2\\cos(\\omega)\\phi_k - \\phi_{k-1}`, so the series is
+    evaluated using Clenshaw's recurrence.
+    """
+    half = num.shape[-1] // 2
+    if kind in (1, 3):
+        # Coefficients from the center tap outwards
+        coeffs = 2 * num[..., half::-1]
+        coeffs[..., 0] /= 2
+        phi0 = np.cos(0 * w) if kind == 1 else np.zeros_like(w)
+        phi1 = np.cos(w) if kind == 1 else np.sin(w)
+    else:
+        coeffs = 2 * num[..., half - 1 :: -1]
+        phi0 = np.cos(w / 2) if kind == 2 else np.sin(w / 2)
+        phi1 = np.cos(1.5 * w) if kind == 2 else np.sin(1.5 * w)
+    nonzero = np.flatnonzero(np.any(coeffs != 0, axis=tuple(range(coeffs.ndim - 1))))
+    if _SPARSE_TERM_COST * nonzero.size < coeffs.shape[-1]:
+        # Mostly zero taps, e.g., half-band filters, so only sum the nonzero terms
+        orders = nonzero + (0.0 if kind in (1, 3) else 0.5)
+        return _sparse_sum(
+            coeffs[..., nonzero], orders, np.cos if kind in (1, 2) else np.sin, w
+        )
+    x2 = 2 * np.cos(w)
+    b0 = np.empty(coeffs.shape[:-1] + w.shape)
+    b1 = np.zeros_like(b0)
+    b2 = np.zeros_like(b0)
+    for k in range(coeffs.shape[-1] - 1, 0, -1):
+        # b0 = c_k + 2 cos(w) b1 - b2 without temporary arrays
+        np.multiply(x2, b1, out=b0)
+        b0 -= b2
+        b0 += coeffs[..., k, np.newaxis]
+        b0, b1, b2 = b2, b0, b1
+    return coeffs[..., 0, np.newaxis] * phi0 + b1 * phi1 - b2 * phi0
+
+
+def _sparse_sum(values, orders, function, w):
+    """
+    Evaluate :math:`\\sum_k v_k f(n_k\\omega)` in blocks of frequency-points.
+
+    Parameters
+    ----------
+    values : ndarray
+        Values :math:`v_k` along the last axis.
+    orders : ndarray
+        1-D array of the orders :math:`n_k`.
+    function : callable
+        The function :math:`f`, e.g., :func:`numpy.cos`.
+    w : ndarray
+        Frequency-points.
+
+    Returns
+    -------
+    ndarray
+        Array of shape ``values.shape[:-1] + w.shape``.
+    """
+    points = np.ravel(w)
+    values = values[..., np.newaxis]
+    result = np.empty(
+        values.shape[:-2] + points.shape,
+        dtype=np.result_type(values, function(np.zeros(0))),
+    )
+    block = max(1, _BLOCK_ELEMENTS // max(1, values.size))
+    for start in range(0, points.size, block):
+        terms = function(np.multiply.outer(orders, points[start : start + block]))
+        # Summed term by term rather than as a matrix product, which rounds
+        # differently depending on the number of frequency-points
+        result[..., start : start + block] = (values * terms).sum(axis=-2)
+    return result.reshape(result.shape[:-1] + np.shape(w))
+
+
+def _scatter_taps(indices, values, length):
+    """
+    Return the coefficients of sparse taps along the last axis, summing the
+    values of repeated indices.
+    """
+    coeffs = np.zeros((length,) + values.shape[:-1], dtype=values.dtype)
+    np.add.at(coeffs, indices, np.moveaxis(values, -1, 0))
+    return np.moveaxis(coeffs, 0, -1)
+
+
+def _check_taps(indices, values):
+    """Convert sparse taps to arrays and check their shapes."""
+    indices = np.asarray(indices)
+    if indices.ndim != 1 or (
+        indices.size and not np.issubdtype(indices.dtype, np.integer)
+    ):
+        raise ValueError("'indices' must be a 1-D array of integers.")
+    if indices.size and indices.min() < 0:
+        raise ValueError("'indices' must be non-negative.")
+    values = np.atleast_1d(np.asarray(values))
+    if values.shape[-1] != indices.size:
+        raise ValueError(
+            f"'values' must have {indices.size} taps along the last axis, got "
+            f"{values.shape[-1]}."
+        )
+    return indices.astype(np.intp), values
+
+
+def _check_ss(A, B, C, D):
+    """Convert state-space matrices to 2-D arrays and check their shapes."""
+    A = np.atleast_2d(np.asarray(A))
+    B = np.asarray(B)
+    C = np.atleast_2d(np.asarray(C))
+    if B.ndim < 2:
+        B = B.reshape(-1, 1)
+    n = A.shape[0]
+    if A.shape != (n, n) or B.shape[0] != n or C.shape[1] != n:
+        raise ValueError(
+            "The state-space matrices must have shapes A: (n, n), B: (n, m), and C: "
+            f"(p, n), got {A.shape!r}, {B.shape!r}, and {C.shape!r}."
+        )
+    D = np.broadcast_to(np.asarray(D), (C.shape[0], B.shape[1]))
+    return A, B, C, D
+
+
+def _ss_response(A, B, C, z, derivative=False):
+    """
+    Evaluate :math:`C(zI - A)^{-1}B`, and optionally its derivative, at *z*.
+
+    Parameters
+    ----------
+    A, B, C : ndarray
+        State-space matrices, see :func:`_check_ss`.
+    z : ndarray
+        1-D array of points to evaluate at.
+    derivative : bool, default: False
+        Whether to also return :math:`-C(zI - A)^{-2}B`.
+
+    Returns
+    -------
+    h : ndarray
+        Array of shape ``(p, m) + z.shape``.
+    derivative : ndarray or None
+        Array of shape ``(p, m) + z.shape`` if *derivative*.
+    """
+    n = A.shape[0]
+    if n == 0:
+        zeros = np.zeros((C.shape[0], B.shape[1]) + z.shape, dtype=complex)
+        return zeros, zeros if derivative else None
+    eigenvalues, vectors = np.linalg.eig(A)
+    if np.linalg.cond(vectors) < _MODAL_MAX_CONDITION:
+        # Diagonalized: one eigendecomposition, then a sum over the modes
+        left = C @ vectors
+        right = np.linalg.solve(vectors, B)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            resolvent = 1 / (z - eigenvalues[:, np.newaxis])
+            h = np.einsum('pi,im,ik->pmk', left, right, resolvent, optimize=True)
+            if not derivative:
+                return h, None
+            return h, -np.einsum(
+                'pi,im,ik->pmk', left, right, resolvent**2, optimize=True
+            )
+    # Solve (zI - A)X = B for blocks of frequency-points
+    h = np.empty((C.shape[0], B.shape[1]) + z.shape, dtype=complex)
+    dh = np.empty_like(h) if derivative else None
+    block = max(1, _BLOCK_ELEMENTS // (n * n))
+    identity = np.eye(n)
+    for start in range(0, z.size, block):
+        stop = min(start + block, z.size)
+        matrices = z[start:stop, np.newaxis, np.newaxis] * identity - A
+        x = np.linalg.solve(matrices, np.broadcast_to(B, (stop - start,) + B.shape))
+        h[..., start:stop] = np.moveaxis(C @ x, 0, -1)
+        if derivative:
+            x = np.linalg.solve(matrices, x)
+            dh[..., start:stop] = -np.moveaxis(C @ x, 0, -1)
+    return h, dh
+
+
+def _root_log_magnitude(x, roots):
+    """
+    Sum of :math:`\\log_{10}|x - r|` over roots along the last axis.
+
+    Parameters
+    ----------
+    x : ndarray
+        Points to evaluate at, e.g., on the unit circle.
+    roots : array-like
+        Roots along the last axis.
+
+    Returns
+    -------
+    ndarray
+        Array of shape ``roots.shape[:-1] + x.shape``.
+    """
+    roots = np.atleast_1d(np.asarray(roots))
+    with np.errstate(divide='ignore'):
+        return np.log10(np.abs(x - roots[..., np.newaxis])).sum(axis=-2)
+
+
+def _root_angle(w, roots):
+    """
+    Sum of the angles of :math:`e^{j\\omega} - r` over roots along the last axis,
+    continuous in :math:`\\omega`.
+
+    For :math:`|r| \\le 1`, the angle is :math:`\\omega + \\arg(1 - re^{-j\\omega})`
+    and otherwise :math:`\\arg(-r) + \\arg(1 - e^{j\\omega}/r)`, where the
+    arguments have positive real parts and need no unwrapping.
+
+    Parameters
+    ----------
+    w : ndarray
+        Frequency-points.
+    roots : array-like
+        Roots along the last axis.
+
+    Returns
+    -------
+    ndarray
+        Array of shape ``roots.shape[:-1] + w.shape``.
+    """
+    roots = np.atleast_1d(np.asarray(roots))[..., np.newaxis]
+    x = np.exp(1j * w)
+    inside = np.abs(roots) <= 1
+    with np.errstate(divide='ignore', invalid='ignore'):
+        angles = np.where(
+            inside,
+            w + np.angle(1 - roots / x),
+            np.angle(-roots) + np.angle(1 - x / roots),
+        )
+    return angles.sum(axis=-2)
+
+
+def _check_sos(sos):
+    """Convert *sos* to an array and check that it has six columns."""
+    sos = np.atleast_2d(np.asarray(sos))
+    if sos.shape[-1] != 6:
+        raise ValueError(f"'sos' must have shape (n_sections, 6), got {sos.shape!r}.")
+    return sos
+
+
+def _freqz_sections(sos, w, dtype=None, workers=None):
+    """
+    Evaluate each second-order section.
+
+    Parameters
+    ----------
+    sos : array-like
+        Second-order sections.
+    w : array-like
+        Frequency-points.
+    dtype : {None, numpy.complex128, numpy.complex64}, optional
+        Precision of the computation, see :func:`freqz_tf`.
+    workers : int, optional
+        Number of threads to evaluate with, see :func:`freqz_tf`.
+
+    Returns
+    -------
+    ndarray
+        Array of shape ``sos.shape[:-1] + w.shape``.
+    """
+    sos = _check_sos(sos)
+    return freqz_tf(sos[..., :3], sos[..., 3:], w, dtype, workers)
+
+
+def _root_seeds(roots, w0, w1):
+    """
+    Return frequency-points around the angles of roots close to the unit circle.
+
+    Parameters
+    ----------
+    roots : array-like
+        Zeros and poles.
+    w0, w1 : float
+        Frequency range.
+
+    Returns
+    -------
+    ndarray
+        Frequency-points in :math:`[w_0, w_1]`, nearest the angles of the roots
+        first.
+    """
+    roots = np.ravel(np.asarray(roots, dtype=complex))
+    distance = np.abs(1 - np.abs(roots))
+    near = distance < 0.1
+    angles = np.mod(np.angle(roots[near]), 2 * np.pi)
+    # The width of a resonance or notch is proportional to the distance
+    width = np.maximum(distance[near], 1e-9 * (w1 - w0))
+    offsets = np.outer(width, [0, -1, 1, -2, 2, -4, 4])
+    order = np.argsort(np.abs(offsets), axis=None, kind='stable')
+    seeds = (angles[:, np.newaxis] + offsets).ravel()[order]
+    return seeds[(seeds >= w0) & (seeds <= w1)]
+
+
+def _log_interpolation_error(h_left, h_mid, h_right):
+    """
+    Deviation of the logarithm of *h_mid* from the mean of the logarithms of
+    *h_left* and *h_right*, maximized over leading dimensions.
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        magnitude = (
+            np.log(np.abs(h_mid))
+            - (np.log(np.abs(h_left)) + np.log(np.abs(h_right))) / 2
+        )
+        phase = (np.angle(h_mid * h_left.conj()) - np.angle(h_right * h_mid.conj())) / 2
+        error = np.abs(magnitude + 1j * phase)
+    error = np.where(np.isnan(error), np.inf, error)
+    return error.reshape(-1, error.shape[-1]).max(axis=0)
+
+
+def _is_single(dtype):
+    """Return whether *dtype* requests single precision computation."""
+    if dtype is None:
+        return False
+    dtype = np.dtype(dtype)
+    if dtype == np.complex64:
+        return True
+    if dtype == np.complex128:
+        return False
+    raise ValueError(
+        f"Unsupported dtype {dtype}; supported values are complex64 and complex128."
+    )
+
+
+def _to_single(a):
+    """Convert *a* to single precision, keeping it real if it is real."""
+    a = np.asarray(a)
+    return a.astype(np.complex64 if np.iscomplexobj(a) else np.float32)
+
+
+def _guard_single(values, error, recompute, w):
+    """
+    Recompute single precision results in double precision where inaccurate.
+
+    Parameters
+    ----------
+    values : ndarray
+        Single precision results with frequency along the last axis.
+    error : ndarray
+        Estimated relative error of *values*, broadcastable to *values*.
+    recompute : callable
+        Function computing the results in double precision for a subset of *w*.
+    w : ndarray
+        Frequency-points.
+
+    Returns
+    -------
+    ndarray
+        *values*, modified in-place.
+    """
+    inaccurate = np.broadcast_to(~(error <= _SINGLE_RTOL), values.shape)
+    columns = inaccurate.reshape(-1, values.shape[-1]).any(axis=0)
+    if columns.any():
+        values[..., columns] = recompute(w[columns])
+    return values
+
+
+def _root_distance_sum(x, roots, power):
+    """
+    Return the sum of :math:`(1 + |r|)/|x - r|^p` over roots along the last axis.
+    """
+    roots = np.atleast_1d(roots)
+    with np.errstate(divide='ignore'):
+        return (
+            (1 + np.abs(roots[..., np.newaxis]))
+            / np.abs(x - roots[..., np.newaxis]) ** power
+        ).sum(axis=-2)
+
+
+def _map_chunks(function, array, workers, axis=-1, min_size=None):
+    """
+    Apply a function to chunks of an array in a thread pool.
+
+    NumPy releases the GIL in most array operations, so the chunks are evaluated
+    concurrently.
+
+    Parameters
+    ----------
+    function : callable
+        Function evaluating a chunk. Must treat each element along *axis*
+        independently, so that the concatenated result does not depend on the
+        chunks.
+    array : ndarray
+        Array to split into at most *workers* chunks along *axis*.
+    workers : int or None
+        Number of threads. If None or 1, *function* is applied to *array*.
+    axis : int, default: -1
+        Axis to split *array* and concatenate the results along.
+    min_size : int, optional
+        Minimum size of a chunk along *axis*. Default: 4096.
+
+    Returns
+    -------
+    ndarray
+    """
+    if min_size is None:
+        min_size = _MIN_CHUNK_SIZE
+    if not workers or np.ndim(array) == 0:
+        return function(array)
+    chunks = min(workers, array.shape[axis] // min_size)
+    if chunks <= 1:
+        return function(array)
+    with ThreadPoolExecutor(chunks) as executor:
+        results = executor.map(function, np.array_split(array, chunks, axis=axis))
+        return np.concatenate(list(results), axis=axis)
+
+
+def _map_rows(function, coeffs, workers):
+    """
+    Apply a function to the filters of coefficients along the last axis in a
+    thread pool, see :func:`_map_chunks`.
+    """
+    if not workers or coeffs.ndim < 2:
+        return function(coeffs)
+    rows = coeffs.reshape(-1, coeffs.shape[-1])
+    values = _map_chunks(function, rows, workers, axis=0, min_size=1)
+    return values.reshape(*coeffs.shape[:-1], values.shape[-1])
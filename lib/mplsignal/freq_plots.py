@@ -9,14 +9,28 @@ __all__ = [
     "freqz",
     "freqz_tf",
     "freqz_zpk",
+    "freqz_sos",
+    "freqz_ss",
     "freqz_fir",
+    "freqz_moving_average",
+    "freqz_cic",
+    "freqz_comb",
+    "freqs",
+    "freqs_tf",
+    "freqs_zpk",
+    "FrequencyResponse",
+    "ResponseCache",
 ]
+import functools
+import math
 from collections.abc import Sequence
 from typing import TYPE_CHECKING, Literal, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
-from mplsignal import _api, _utils
+from mplsignal import _api, _cache, _utils
+from mplsignal._cache import ResponseCache
+from mplsignal.system import DiscreteSystem
 from mplsignal.ticker import (
     DegreeFormatter,
     DegreeLocator,
@@ -30,6 +44,150 @@ if TYPE_CHECKING:
     from matplotlib.figure import Figure
 
 
+class FrequencyResponse:
+    """
+    Frequency response of a discrete- or continuous-time system at frequency-points.
+
+    Quantities derived from the response, e.g., the magnitude in dB and the
+    unwrapped phase, are computed when first accessed and then reused, so that
+    they are only computed once when the response is plotted in several styles.
+
+    Parameters
+    ----------
+    w : array-like
+        Frequency-points in rad/sample, or rad/s for continuous-time systems.
+    h : array-like or callable, optional
+        Frequency response at *w*, or a function returning it for *w*. If 2-D, one
+        row per filter.
+    magnitude, magnitude_db, phase_unwrapped, group_delay : array-like or \
+callable, optional
+        The quantity at *w*, or a function returning it for *w*. If None, it is
+        computed from *h*.
+
+    Examples
+    --------
+    >>> from mplsignal.freq_plots import freqz
+    >>> fig, response = freqz([1, 2, 1], [1, -1.2, 0.5], return_response=True)
+    >>> fig = freqz(response=response, style='magnitude')
+    """
+
+    __slots__ = ('_w', '_h', '_sources', '_values')
+
+    def __init__(
+        self,
+        w,
+        h=None,
+        magnitude=None,
+        magnitude_db=None,
+        phase_unwrapped=None,
+        group_delay=None,
+    ):
+        self._w = np.asarray(w)
+        self._h = None if h is None or callable(h) else np.asarray(h)
+        self._sources = {
+            'h': h if callable(h) else None,
+            'magnitude': magnitude,
+            'magnitude_db': magnitude_db,
+            'phase_unwrapped': phase_unwrapped,
+            'group_delay': group_delay,
+        }
+        self._values = {}
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(n_points={self._w.size}, "
+            f"computed={sorted(k for k in self._values if isinstance(k, str))})"
+        )
+
+    @property
+    def w(self):
+        """Frequency-points in rad/sample, or rad/s for continuous-time systems."""
+        return self._w
+
+    @property
+    def h(self):
+        """Frequency response, or None if only derived quantities are known."""
+        if self._h is None and self._sources['h'] is not None:
+            self._h = np.asarray(self._sources['h'](self._w))
+        return self._h
+
+    @property
+    def magnitude(self):
+        """Magnitude response."""
+        return self._get('magnitude', self._compute_magnitude)
+
+    @property
+    def magnitude_db(self):
+        """Magnitude response in dB."""
+        return self._get('magnitude_db', lambda: 20 * np.log10(self.magnitude))
+
+    @property
+    def phase_unwrapped(self):
+        """Unwrapped phase response in radians."""
+        return self._get(
+            'phase_unwrapped', lambda: np.unwrap(np.angle(self._require_h('phase')))
+        )
+
+    @property
+    def group_delay(self):
+        """
+        Group delay in samples, or seconds for continuous-time systems.
+
+        If not given, it is estimated from differences of the unwrapped phase.
+        """
+        return self._get(
+            'group_delay',
+            lambda: _utils.group_delay_from_phase(self._w, self.phase_unwrapped),
+        )
+
+    def scaled_w(self, freq_unit='rad', fs=None):
+        """
+        Return the frequency-points in a unit.
+
+        Parameters
+        ----------
+        freq_unit : {'rad', 'deg', 'norm', 'fs', 'normfs'}, default: 'rad'
+            Unit, see :func:`freqz`.
+        fs : float, optional
+            Sample frequency. Required if *freq_unit* is 'fs'.
+
+        Returns
+        -------
+        ndarray
+        """
+        return self._get(
+            ('w', freq_unit, fs), lambda: _get_freq_scale(freq_unit, fs) * self._w
+        )
+
+    def _get(self, name, compute):
+        """Return a cached quantity, computing it if missing."""
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        source = self._sources.get(name)
+        if source is None:
+            value = compute()
+        elif callable(source):
+            value = np.asarray(source(self._w))
+        else:
+            value = np.asarray(source)
+        self._values[name] = value
+        return value
+
+    def _compute_magnitude(self):
+        has_h = self._h is not None or self._sources['h'] is not None
+        if not has_h and self._sources['magnitude_db'] is not None:
+            return 10 ** (self.magnitude_db / 20)
+        return np.abs(self._require_h('magnitude'))
+
+    def _require_h(self, name):
+        h = self.h
+        if h is None:
+            raise ValueError(f"Cannot compute the {name} without the response 'h'.")
+        return h
+
+
 def freqz(
     num=None,
     den=None,
@@ -49,23 +207,47 @@ def freqz(
     include_nyquist: bool = False,
     fs: float = 2 * np.pi,
     align_ylabels: bool = True,
+    sos=None,
+    cache: Union[bool, ResponseCache] = False,
+    wrange: tuple[float, float] | None = None,
+    adaptive: bool = False,
+    adaptive_tol: float = 1e-2,
+    precision: Literal['double', 'single'] = 'double',
+    max_memory: int | None = None,
+    workers: int | None = None,
+    response: Union["FrequencyResponse", None] = None,
+    return_response: bool = False,
+    decimate: bool = True,
+    linear_phase: Union[bool, Literal[1, 2, 3, 4], None] = False,
+    ss=None,
+    taps=None,
     **kwargs,
-) -> "Figure":
+) -> Union["Figure", tuple["Figure", "FrequencyResponse"]]:
     """
     Plot the frequency response of a discrete-time system.
 
     Parameters
     ----------
-    num : array-like, optional
-        Numerator of transfer function.
+    num : array-like or :class:`~mplsignal.system.DiscreteSystem`, optional
+        Numerator of transfer function. If 2-D, each row is the numerator of a
+        separate filter and one line per filter is plotted.
+
+        If a :class:`~mplsignal.system.DiscreteSystem`, the system is evaluated in
+        the representation it was given in, and the response is looked up in, and
+        stored in, the cache of the system unless *cache* is given. Cannot be
+        combined with *den*, *zeros*, *poles*, *sos*, *ss*, *taps*, or *response*.
     den : array-like, optional
-        Denominator of transfer function.
+        Denominator of transfer function. If 2-D, each row is the denominator of a
+        separate filter.
     zeros : array-like, optional
-        Zeros of transfer function.
+        Zeros of transfer function. If 2-D, each row is the zeros of a separate
+        filter.
     poles : array-like, optional
-        Poles of transfer function.
-    gain : float, default: 1.0
-        The gain of pole-zero-based transfer function.
+        Poles of transfer function. If 2-D, each row is the poles of a separate
+        filter.
+    gain : float or array-like, default: 1.0
+        The gain of pole-zero-based transfer function. If 1-D, the gain of each
+        filter.
     w : int or array-like, optional
         If a single integer, compute at that many frequency points in the
         range :math:`[0, \\pi]`, default: 512.
@@ -79,9 +261,18 @@ def freqz(
         Axes or iterable of Axes to plot in. If None, create required Axes.
     style : {'stacked', 'twin', 'magnitude', 'phase', 'group_delay', \
 'tristacked'}, default: 'stacked'
-        Plotting style.
+        Plotting style. For 'magnitude', transfer functions with real coefficients
+        are evaluated as power responses, cosine series of the autocorrelations of
+        *num* and *den*, in real arithmetic without forming the complex response.
+        This applies when *w* is not evaluated using FFTs or the chirp-z
+        transform, e.g., explicit non-uniform *w*. Otherwise, as for the default
+        grid, the squared magnitude of the transform is cheaper and at least as
+        accurate.
     magnitude_scale : {'linear', 'log'}, default: 'log'
-        Whether magnitude is plotted in linear or logarithmic (dB) scale.
+        Whether magnitude is plotted in linear or logarithmic (dB) scale. For
+        *zeros* and *poles*, the magnitude in dB is computed as a sum of the
+        logarithms of the distances to the zeros and poles, which does not overflow
+        for high-order filters.
     frequency_scale : {'linear', 'log'}, default: 'linear'
         Whether frequency is plotted in linear or logarithmic scale.
     whole : bool, default: False
@@ -95,26 +286,157 @@ def freqz(
         Sample frequency.
     align_ylabels : bool, default: True
         Align the y-labels when *style* is 'stacked' or 'tristacked'
+    sos : array-like, optional
+        Second-order sections of shape ``(n_sections, 6)``, where each row is
+        ``[b0, b1, b2, a0, a1, a2]``. Cannot be combined with *num*, *den*,
+        *zeros*, or *poles*.
+
+        The sections are evaluated separately and the magnitude in dB is computed
+        as the sum of the magnitudes of the sections. This is numerically
+        preferable for high-order filters.
+    cache : bool or :class:`ResponseCache`, default: False
+        Cache to look up and store the evaluated response in. If True, a cache
+        shared by all ``freq*``-functions is used. If False, the response is
+        always evaluated.
+    wrange : (float, float), optional
+        Frequency band, in rad/sample, to plot. If given, *w* must be an integer
+        and the response is computed at that many frequency points in the range
+        :math:`[w_0, w_1]`. For long transfer functions and second-order sections,
+        the response is evaluated using the chirp-z transform, which is much faster
+        than evaluating a dense explicit *w* for narrow bands.
+    adaptive : bool, default: False
+        Determine the frequency points adaptively. Starting from a coarse grid,
+        points are added where the magnitude or phase is not well approximated by
+        linear interpolation, and, for *zeros* and *poles*, around zeros and poles
+        close to the unit circle. If True, *w* must be an integer and is the
+        maximum number of frequency points. If *frequency_scale* is 'log', the
+        intervals are bisected on the logarithmic scale.
+    adaptive_tol : float, default: 0.01
+        Tolerance for *adaptive*. Corresponds to about 0.087 dB in magnitude and
+        0.01 rad in phase.
+    precision : {'double', 'single'}, default: 'double'
+        Floating-point precision used to compute the response. 'single' computes in
+        complex64 and float32, which halves the memory traffic for large *w*.
+        Frequency-points where the estimated relative error exceeds 1e-3, e.g.,
+        deep in the stopband of high-order filters, are recomputed in double
+        precision.
+    max_memory : int, optional
+        Approximate maximum number of bytes to use for evaluating the response. If
+        given, the frequency-points are evaluated in blocks, so that very large *w*
+        can be plotted with bounded memory. The plotted quantities are reduced to
+        the minimum and maximum of 4096 bins of consecutive frequency-points, which
+        looks the same as plotting all points at screen resolution. Cannot be
+        combined with *adaptive*.
+    workers : int, optional
+        Number of threads to evaluate the response with. Large frequency grids are
+        split among the threads, and so are multiple filters evaluated using FFTs.
+        The result is bit-identical to evaluating with a single thread.
+    response : :class:`FrequencyResponse`, optional
+        Previously evaluated response to plot, e.g., returned using
+        *return_response*. Quantities already computed for another plot are reused.
+        Cannot be combined with *num*, *den*, *zeros*, *poles*, *sos*, or *w*.
+    return_response : bool, default: False
+        If True, also return the :class:`FrequencyResponse`.
+    decimate : bool, default: True
+        Decimate curves with many more frequency-points than the Axes is wide in
+        pixels before plotting. For each of two columns per pixel, the first, last,
+        minimum, and maximum point of each curve is kept, so the plot looks the
+        same, including peaks, notches, and phase jumps, while drawing and vector
+        output is much faster. Zooming in interactively or saving at more than
+        twice the figure resolution may show less detail; set to False to plot all
+        points.
+    linear_phase : bool or {1, 2, 3, 4} or None, default: False
+        Linear-phase type of an FIR filter given by *num* with *den* equal to 1:
+        1 and 2 for symmetric *num* of odd and even length, 3 and 4 for
+        antisymmetric *num* of odd and even length. If None, the type is detected
+        from the symmetry of *num*, and if True, *num* must be symmetric or
+        antisymmetric. For linear-phase filters, the real amplitude response is
+        evaluated as a cosine or sine series of half the length, the phase is
+        exactly linear, with jumps of :math:`\\pi` where the amplitude changes
+        sign, and the group delay is constant, without unwrapping the phase.
+        Ignored if *adaptive*, *precision* is 'single', or *max_memory* is given.
+    ss : tuple of array-like, optional
+        State-space matrices ``(A, B, C, D)`` of shapes ``(n, n)``, ``(n, m)``,
+        ``(p, n)``, and ``(p, m)``. One line per input-output pair is plotted, in
+        row-major order. Cannot be combined with *num*, *den*, *zeros*, *poles*, or
+        *sos*.
+
+        *A* is diagonalized once and the response is evaluated for all
+        frequency-points as a sum over the modes, which is much more accurate than
+        converting to a transfer function. If the eigenvectors of *A* are
+        ill-conditioned, the state equations are solved for each frequency-point.
+        Only computed in double precision.
+    taps : tuple of array-like, optional
+        Sparse FIR filter ``(indices, values)``, where *values* are the nonzero
+        taps at the non-negative integer *indices*. If *values* is 2-D, each row
+        is a separate filter with the same *indices*. Cannot be combined with
+        *num*, *den*, *zeros*, *poles*, *sos*, or *ss*.
+
+        Only the given taps are evaluated, so the cost is proportional to the
+        number of nonzero taps rather than the length of the filter, unless the
+        frequency grid is evaluated faster using FFTs. Only computed in double
+        precision.
     **kwargs
         Additional arguments passed to :func:`matplotlib.axes.Axes.plot`.
 
     Returns
     -------
     :class:`~matplotlib.figure.Figure`
+        The figure. If *return_response* is True, a tuple of the figure and the
+        :class:`FrequencyResponse`.
     """
     # if Axes not provided
 
-    if num is None and zeros is None:
-        raise ValueError("At least one of 'num' and 'zeros' must be provided.")
-
-    if num is not None and zeros is not None:
-        raise ValueError("At most one of 'num' and 'zeros' must be provided.")
-
-    if den is None and poles is None:
-        raise ValueError("At least one of 'den' and 'poles' must be provided.")
-
-    if den is not None and poles is not None:
-        raise ValueError("At most one of 'den' and 'poles' must be provided.")
+    if isinstance(num, DiscreteSystem):
+        if any(
+            value is not None for value in (den, zeros, poles, sos, ss, taps, response)
+        ):
+            raise ValueError(
+                "A 'DiscreteSystem' cannot be combined with 'den', 'zeros', 'poles', "
+                "'sos', 'ss', 'taps', or 'response'."
+            )
+        if cache is False:
+            cache = num.cache
+        arguments = num._freqz_arguments()
+        num, den, zeros, poles = (
+            arguments['num'],
+            arguments['den'],
+            arguments['zeros'],
+            arguments['poles'],
+        )
+        gain, sos, ss = arguments['gain'], arguments['sos'], arguments['ss']
+
+    if response is not None:
+        if any(
+            value is not None for value in (num, den, zeros, poles, sos, ss, taps, w)
+        ):
+            raise ValueError(
+                "'response' cannot be combined with 'num', 'den', 'zeros', 'poles', "
+                "'sos', 'ss', 'taps', or 'w'."
+            )
+    elif taps is not None:
+        if any(value is not None for value in (num, den, zeros, poles, sos, ss)):
+            raise ValueError(
+                "'taps' cannot be combined with 'num', 'den', 'zeros', 'poles', "
+                "'sos', or 'ss'."
+            )
+        if len(taps) != 2:
+            raise ValueError("'taps' must be a tuple (indices, values).")
+    elif ss is not None:
+        if any(value is not None for value in (num, den, zeros, poles, sos)):
+            raise ValueError(
+                "'ss' cannot be combined with 'num', 'den', 'zeros', 'poles', or "
+                "'sos'."
+            )
+        if len(ss) != 4:
+            raise ValueError("'ss' must be a tuple (A, B, C, D).")
+    elif sos is not None:
+        if num is not None or den is not None or zeros is not None or poles is not None:
+            raise ValueError(
+                "'sos' cannot be combined with 'num', 'den', 'zeros', or 'poles'."
+            )
+    else:
+        _check_filter(num, den, zeros, poles)
 
     _api.check_in_iterable(('rad', 'deg', 'norm', 'fs', 'normfs'), freq_unit=freq_unit)
     _api.check_in_iterable(('rad', 'deg'), phase_unit=phase_unit)
@@ -124,37 +446,76 @@ def freqz(
     )
     _api.check_in_iterable(('linear', 'log'), magnitude_scale=magnitude_scale)
     _api.check_in_iterable(('linear', 'log'), frequency_scale=frequency_scale)
+    _api.check_in_iterable(('double', 'single'), precision=precision)
 
     if not np.iterable(ax) and ax is not None:
         ax = [ax]
 
-    if w is None:
-        w = 512
+    if response is None:
+        if w is None:
+            w = 512
 
-    if isinstance(w, int):
-        if frequency_scale == 'linear':
-            w = np.linspace(
-                0, 2 * np.pi if whole else np.pi, w, endpoint=include_nyquist
-            )
+        if wrange is not None and not isinstance(w, int):
+            raise ValueError("'w' must be an integer when 'wrange' is provided.")
+
+        if adaptive and not isinstance(w, int):
+            raise ValueError("'w' must be an integer when 'adaptive' is True.")
+
+        if adaptive and max_memory is not None:
+            raise ValueError("'max_memory' cannot be combined with 'adaptive'.")
+
+        if workers is not None and workers < 1:
+            raise ValueError("'workers' must be a positive integer.")
+
+        if linear_phase is not False:
+            if num is None or den is None or not _is_one(den):
+                if linear_phase is not None:
+                    raise ValueError(
+                        "'linear_phase' requires an FIR filter given by 'num' with "
+                        "'den' equal to 1."
+                    )
+                linear_phase = None
+            else:
+                linear_phase = _utils.fir_linear_phase_type(num, linear_phase)
         else:
-            w = np.logspace(
-                1e-5,
-                2 * np.pi if whole else np.pi,
-                w,
-                endpoint=include_nyquist,
-            )
-        if kwargs.get('xmax', None) is None and not include_nyquist:
+            linear_phase = None
+
+        if (
+            isinstance(w, int)
+            and wrange is None
+            and not adaptive
+            and not include_nyquist
+            and kwargs.get('xmax', None) is None
+        ):
             kwargs['xmax'] = 2 * np.pi if whole else np.pi
 
-    if num is not None and den is not None:
-        h = _utils.freqz_tf(num, den, w)
-
-    if zeros is not None and poles is not None and gain is not None:
-        h = _utils.freqz_zpk(zeros, poles, gain, w)
+        response = _freqz_response(
+            num,
+            den,
+            zeros,
+            poles,
+            gain,
+            sos,
+            w,
+            whole,
+            include_nyquist,
+            frequency_scale,
+            style,
+            magnitude_scale,
+            cache,
+            wrange,
+            adaptive,
+            adaptive_tol,
+            precision,
+            max_memory,
+            workers,
+            linear_phase,
+            ss,
+            taps,
+        )
 
-    return _plot_h(
-        w,
-        h,
+    fig = _plot_h(
+        response,
         ax=ax,
         style=style,
         freq_unit=freq_unit,
@@ -163,13 +524,302 @@ def freqz(
         frequency_scale=frequency_scale,
         fs=fs,
         align_ylabels=align_ylabels,
+        decimate=decimate,
         **kwargs,
     )
+    if return_response:
+        return fig, response
+    return fig
+
+
+def _freqz_response(
+    num,
+    den,
+    zeros,
+    poles,
+    gain,
+    sos,
+    w,
+    whole,
+    include_nyquist,
+    frequency_scale,
+    style,
+    magnitude_scale,
+    cache,
+    wrange,
+    adaptive,
+    adaptive_tol,
+    precision,
+    max_memory,
+    workers,
+    linear_phase=None,
+    ss=None,
+    taps=None,
+):
+    """
+    Evaluate the frequency response for :func:`freqz`.
+
+    Returns
+    -------
+    :class:`FrequencyResponse`
+        The response. Quantities other than *h* are evaluated when first accessed.
+        If *max_memory* is given, only the quantities plotted in *style* are
+        available, reduced as described in :func:`freqz`.
+    """
+    dtype = np.complex64 if precision == 'single' else np.complex128
+    roots = None
+    magnitude_db = None
+    phase = None
+    power = None
+    if taps is not None:
+        kind, arrays = 'taps', _utils._check_taps(*taps)
+        frequency_response = functools.partial(
+            _utils.freqz_taps, *arrays, workers=workers
+        )
+        group_delay = functools.partial(
+            _utils.group_delay_taps, *arrays, workers=workers
+        )
+    elif ss is not None:
+        kind, arrays = 'ss', _utils._check_ss(*ss)
+        # One row per input-output pair
+        frequency_response = _rows(
+            functools.partial(_utils.freqz_ss, *arrays, workers=workers)
+        )
+        group_delay = _rows(
+            functools.partial(_utils.group_delay_ss, *arrays, workers=workers)
+        )
+    elif sos is not None:
+        kind, arrays = 'sos', (sos,)
+        frequency_response = functools.partial(
+            _utils.freqz_sos, sos, dtype=dtype, workers=workers
+        )
+        group_delay = functools.partial(
+            _utils.group_delay_sos, sos, dtype=dtype, workers=workers
+        )
+        magnitude_db = functools.partial(
+            _utils.freqz_sos_db, sos, dtype=dtype, workers=workers
+        )
+    elif num is not None and den is not None:
+        kind, arrays = 'tf', (num, den)
+        frequency_response = functools.partial(
+            _utils.freqz_tf, num, den, dtype=dtype, workers=workers
+        )
+        group_delay = functools.partial(
+            _utils.group_delay, num, den, dtype=dtype, workers=workers
+        )
+        if (
+            style == 'magnitude'
+            and precision == 'double'
+            and not np.iscomplexobj(num)
+            and not np.iscomplexobj(den)
+        ):
+            # Magnitude plots do not need the complex response
+            power = functools.partial(_utils.freqz_tf_power, num, den, workers=workers)
+    elif zeros is not None and poles is not None:
+        kind, arrays = 'zpk', (zeros, poles, gain)
+        frequency_response = functools.partial(
+            _utils.freqz_zpk, zeros, poles, gain, dtype=dtype, workers=workers
+        )
+        group_delay = functools.partial(
+            _utils.group_delay_zpk, zeros, poles, dtype=dtype, workers=workers
+        )
+        magnitude_db = functools.partial(
+            _utils.freqz_zpk_db, zeros, poles, gain, dtype=dtype, workers=workers
+        )
+        roots = np.concatenate((np.ravel(zeros), np.ravel(poles)))
+        if precision == 'double':
+            phase = functools.partial(
+                _utils.freqz_zpk_phase, zeros, poles, gain, workers=workers
+            )
+    else:
+        raise ValueError(
+            "'num' and 'den', or 'zeros' and 'poles', must be provided together."
+        )
+
+    if cache is True:
+        cache = _cache.default_cache
+    elif cache is False:
+        cache = None
+    if cache is not None:
+        if isinstance(w, int):
+            grid = (
+                w,
+                whole,
+                include_nyquist,
+                frequency_scale,
+                wrange,
+                adaptive_tol if adaptive else None,
+                precision,
+            )
+        else:
+            grid = (w, precision)
+        key = _cache.response_key(kind, arrays, grid)
+
+    def evaluate(name, compute):
+        if cache is None:
+            return compute()
+        return cache.get(key, name, compute)
+
+    h_adaptive = None
+    if adaptive:
+        w0, w1 = wrange if wrange is not None else (0, 2 * np.pi if whole else np.pi)
+        log = frequency_scale == 'log'
+        if log and wrange is None:
+            # Same lower limit as the uniform logarithmic grid
+            w0 = 1e-5
+
+        def adaptive_grid():
+            nonlocal h_adaptive
+            w_adaptive, h_adaptive = _utils.adaptive_grid(
+                frequency_response,
+                w0,
+                w1,
+                w,
+                tol=adaptive_tol,
+                roots=roots,
+                log=log,
+            )
+            return w_adaptive
+
+        w = evaluate('w', adaptive_grid)
+    elif isinstance(w, int):
+        grid = _frequency_grid(w, whole, include_nyquist, frequency_scale, wrange)
+    else:
+        w = np.asarray(w)
+
+        def grid(start, stop):
+            return w[start:stop]
+
+    if max_memory is None:
+        if isinstance(w, int):
+            w = grid(0, w)
+
+        if linear_phase is not None and h_adaptive is None and precision == 'double':
+            num = np.asarray(num)
+            amplitude = evaluate(
+                'amplitude',
+                lambda: _utils.fir_amplitude(num, linear_phase, w, workers=workers),
+            )
+            phase = _utils.fir_phase(num, linear_phase, w, amplitude)
+            delay = (num.shape[-1] - 1) / 2
+            return FrequencyResponse(
+                w,
+                lambda w: np.abs(amplitude) * np.exp(1j * phase),
+                magnitude=np.abs(amplitude),
+                phase_unwrapped=phase,
+                group_delay=lambda w: np.full(phase.shape, delay),
+            )
+
+        def lazy(name, function):
+            # Quantities are evaluated, or looked up, when first accessed
+            return lambda w: evaluate(name, lambda: function(w))
+
+        if power is not None and h_adaptive is None:
+            power_values = functools.cache(lambda: evaluate('power', lambda: power(w)))
+            return FrequencyResponse(
+                w,
+                lazy('h', frequency_response),
+                magnitude=lambda w: np.sqrt(power_values()),
+                magnitude_db=lambda w: 10 * np.log10(power_values()),
+                group_delay=lazy('gd', group_delay),
+            )
+
+        if phase is not None and h_adaptive is None:
+            # Magnitude and phase are sums over the roots, without the complex
+            # response, which over- or underflows for high-order filters
+            db_values = functools.cache(
+                lambda: evaluate('magnitude_db', lambda: magnitude_db(w))
+            )
+
+            def magnitude(w):
+                # Linear magnitudes beyond the range of floats are infinite
+                with np.errstate(over='ignore'):
+                    return 10 ** (db_values() / 20)
+
+            return FrequencyResponse(
+                w,
+                lazy('h', frequency_response),
+                magnitude=magnitude,
+                magnitude_db=lambda w: db_values(),
+                phase_unwrapped=lazy('phase', lambda w: _principal_start(phase(w))),
+                group_delay=lazy('gd', group_delay),
+            )
+
+        h = evaluate(
+            'h', lambda: frequency_response(w) if h_adaptive is None else h_adaptive
+        )
+        return FrequencyResponse(
+            w,
+            h,
+            magnitude_db=(
+                lazy('magnitude_db', magnitude_db) if magnitude_db is not None else None
+            ),
+            group_delay=lazy('gd', group_delay),
+        )
+    else:
+        n = w if isinstance(w, int) else w.size
+        needs_magnitude = style not in ('phase', 'group_delay')
+        needs_phase = style not in ('magnitude', 'group_delay')
+        needs_gd = style in ('group_delay', 'tristacked')
+        use_magnitude_db = magnitude_db is not None and magnitude_scale == 'log'
+        previous_phase = None
+
+        def evaluate_block(w):
+            nonlocal previous_phase
+            quantities = {}
+            if needs_phase or (
+                needs_magnitude and not use_magnitude_db and power is None
+            ):
+                h = frequency_response(w)
+            if needs_magnitude:
+                if use_magnitude_db:
+                    quantities['magnitude'] = magnitude_db(w)
+                elif power is not None:
+                    p = power(w)
+                    with np.errstate(divide='ignore'):
+                        quantities['magnitude'] = (
+                            10 * np.log10(p) if magnitude_scale == 'log' else np.sqrt(p)
+                        )
+                elif magnitude_scale == 'log':
+                    quantities['magnitude'] = 20 * np.log10(np.abs(h))
+                else:
+                    quantities['magnitude'] = np.abs(h)
+            if needs_phase:
+                # Continue unwrapping from the end of the previous block
+                phase = _utils.unwrap_continued(np.angle(h), previous_phase)
+                previous_phase = phase[..., -1]
+                quantities['phase'] = phase
+            if needs_gd:
+                quantities['gd'] = group_delay(w)
+            return quantities
+
+        streamed = None
+
+        def stream(name):
+            nonlocal streamed
+            if streamed is None:
+                n_filters = np.size(frequency_response(grid(0, 1)))
+                streamed = _utils.evaluate_blocks(
+                    grid, n, evaluate_block, max_memory, n_filters
+                )
+            return streamed[name]
+
+        w = evaluate('streamed_w', lambda: stream('w'))
+        quantities = {}
+        if needs_magnitude:
+            name = 'magnitude_db' if magnitude_scale == 'log' else 'magnitude'
+            quantities[name] = evaluate(f'streamed_{name}', lambda: stream('magnitude'))
+        if needs_phase:
+            quantities['phase_unwrapped'] = evaluate(
+                'streamed_phase', lambda: stream('phase')
+            )
+        if needs_gd:
+            quantities['group_delay'] = evaluate('streamed_gd', lambda: stream('gd'))
+        return FrequencyResponse(w, **quantities)
 
 
 def _plot_h(
-    w,
-    h,
+    response,
     fs=None,
     ax=None,
     style='stacked',
@@ -178,6 +828,8 @@ def _plot_h(
     magnitude_scale='log',
     frequency_scale='linear',
     align_ylabels=True,
+    time_unit='samples',
+    decimate=True,
     **kwargs,
 ):
     """
@@ -185,8 +837,8 @@ def _plot_h(
 
     Parameters
     ----------
-    w
-    h
+    response : :class:`FrequencyResponse`
+        The response. Each quantity is computed once and shared between the Axes.
     fs
     ax
     style
@@ -194,10 +846,15 @@ def _plot_h(
     phase_unit
     magnitude_scale
     frequency_scale
+    align_ylabels
+    time_unit : str, default: 'samples'
+        Unit of the group delay.
+    decimate : bool, default: True
+        Whether to decimate long curves, see :func:`freqz`.
     **kwargs
     """
-    minx = kwargs.pop('xmin', w.min())
-    maxx = kwargs.pop('xmax', w.max())
+    minx = kwargs.pop('xmin', response.w.min())
+    maxx = kwargs.pop('xmax', response.w.max())
     maglabel = kwargs.get(
         'maglabel',
         'Magnitude, dB' if magnitude_scale == 'log' else "Magnitude",
@@ -205,7 +862,7 @@ def _plot_h(
     phaselabel = kwargs.get('phaselabel', 'Phase, %s' % (phase_unit))
     freqlabel = kwargs.get('freqlabel', _get_freq_unit_text(freq_unit))
 
-    group_delay_label = kwargs.get('gdlabel', 'Group delay, samples')
+    group_delay_label = kwargs.get('gdlabel', f'Group delay, {time_unit}')
     if style in ('stacked', 'twin'):
         if ax is None:
             fig = plt.gcf()
@@ -227,10 +884,17 @@ def _plot_h(
                 ax = ax[0].figure.axes
             fig = ax[0].figure
 
+        # Multiple filters are distinguished using the color cycle
+        magnitude = (
+            response.magnitude_db if magnitude_scale == 'log' else response.magnitude
+        )
+        single_filter = magnitude.ndim == 1
+        mag_color = {}
+        if single_filter:
+            mag_color['color'] = ax[0]._get_lines.get_next_color()
         _mag_plot_z(
             ax[0],
-            w,
-            h,
+            response,
             xmin=minx,
             xmax=maxx,
             xlabel=(freqlabel if style == 'twin' else None),
@@ -239,20 +903,22 @@ def _plot_h(
             frequency_scale=frequency_scale,
             magnitude_scale=magnitude_scale,
             fs=fs,
-            color=ax[0]._get_lines.get_next_color(),
+            decimate=decimate,
+            **mag_color,
             **kwargs,
         )
 
-        phase_color = (
-            ax[0]._get_lines.get_next_color()
-            if style == 'twin'
-            else ax[1]._get_lines.get_next_color()
-        )
+        phase_color = {}
+        if single_filter:
+            phase_color['c'] = (
+                ax[0]._get_lines.get_next_color()
+                if style == 'twin'
+                else ax[1]._get_lines.get_next_color()
+            )
 
         _phase_plot_z(
             ax[1],
-            w,
-            h,
+            response,
             xmin=minx,
             xmax=maxx,
             phase_unit=phase_unit,
@@ -260,8 +926,9 @@ def _plot_h(
             ylabel=phaselabel,
             xlabel=(freqlabel if style == 'stacked' else None),
             fs=fs,
+            decimate=decimate,
             frequency_scale=frequency_scale,
-            c=phase_color,
+            **phase_color,
             **kwargs,
         )
         if align_ylabels and style == 'stacked':
@@ -272,8 +939,7 @@ def _plot_h(
             ax = [plt.gca()]
         _mag_plot_z(
             ax[0],
-            w,
-            h,
+            response,
             xmin=minx,
             xmax=maxx,
             ylabel=maglabel,
@@ -282,6 +948,7 @@ def _plot_h(
             magnitude_scale=magnitude_scale,
             frequency_scale=frequency_scale,
             fs=fs,
+            decimate=decimate,
             **kwargs,
         )
         return ax[0].figure
@@ -290,8 +957,7 @@ def _plot_h(
             ax = [plt.gca()]
         _group_delay_plot_z(
             ax[0],
-            w,
-            h,
+            response,
             xmin=minx,
             xmax=maxx,
             freq_unit=freq_unit,
@@ -299,6 +965,7 @@ def _plot_h(
             xlabel=freqlabel,
             frequency_scale=frequency_scale,
             fs=fs,
+            decimate=decimate,
             **kwargs,
         )
         return ax[0].figure
@@ -307,8 +974,7 @@ def _plot_h(
             ax = [plt.gca()]
         _phase_plot_z(
             ax[0],
-            w,
-            h,
+            response,
             xmin=minx,
             xmax=maxx,
             freq_unit=freq_unit,
@@ -317,6 +983,7 @@ def _plot_h(
             xlabel=freqlabel,
             frequency_scale=frequency_scale,
             fs=fs,
+            decimate=decimate,
             **kwargs,
         )
         return ax[0].figure
@@ -333,8 +1000,7 @@ def _plot_h(
             fig = ax[0].figure
         _mag_plot_z(
             ax[0],
-            w,
-            h,
+            response,
             xmin=minx,
             xmax=maxx,
             xlabel=None,
@@ -343,12 +1009,12 @@ def _plot_h(
             magnitude_scale=magnitude_scale,
             frequency_scale=frequency_scale,
             fs=fs,
+            decimate=decimate,
             **kwargs,
         )
         _phase_plot_z(
             ax[1],
-            w,
-            h,
+            response,
             xmin=minx,
             xmax=maxx,
             phase_unit=phase_unit,
@@ -357,12 +1023,12 @@ def _plot_h(
             xlabel=None,
             frequency_scale=frequency_scale,
             fs=fs,
+            decimate=decimate,
             **kwargs,
         )
         _group_delay_plot_z(
             ax[2],
-            w,
-            h,
+            response,
             xmin=minx,
             xmax=maxx,
             freq_unit=freq_unit,
@@ -370,6 +1036,7 @@ def _plot_h(
             xlabel=freqlabel,
             frequency_scale=frequency_scale,
             fs=fs,
+            decimate=decimate,
             **kwargs,
         )
         if align_ylabels:
@@ -380,8 +1047,7 @@ def _plot_h(
 
 def _mag_plot_z(
     ax,
-    w,
-    h,
+    response,
     xmin=None,
     xmax=None,
     freq_unit=None,
@@ -392,15 +1058,25 @@ def _mag_plot_z(
     magnitude_scale='log',
     frequency_scale='linear',
     fs=1,
+    decimate=True,
     **kwargs,
 ):
     """Plot magnitude response."""
-    magnitude = np.abs(h)
     if magnitude_scale == 'log':
-        magnitude = 20 * np.log10(np.abs(h))
+        magnitude = response.magnitude_db
+    else:
+        magnitude = response.magnitude
     wscale = _get_freq_scale(freq_unit, fs)
-    w = wscale * w
-    ax.plot(w, magnitude, label=kwargs.pop("label", "Magnitude"), **kwargs)
+    w = response.scaled_w(freq_unit, fs)
+    if xmin is None:
+        xmin = response.w.min()
+    if xmax is None:
+        xmax = response.w.max()
+    if decimate:
+        w, magnitude = _decimate(
+            ax, w, magnitude, wscale * xmin, wscale * xmax, frequency_scale
+        )
+    ax.plot(w, magnitude.T, label=kwargs.pop("label", "Magnitude"), **kwargs)
 
     if xlabel is not None:
         ax.set_xlabel(xlabel)
@@ -418,17 +1094,12 @@ def _mag_plot_z(
     if frequency_scale == 'log':
         ax.set_xscale('log')
 
-    if xmin is None:
-        xmin = w.min()
-    if xmax is None:
-        xmax = w.max()
     ax.set_xlim(wscale * xmin, wscale * xmax)
 
 
 def _phase_plot_z(
     ax,
-    w,
-    h,
+    response,
     xmin=None,
     xmax=None,
     freq_unit=None,
@@ -439,15 +1110,24 @@ def _phase_plot_z(
     ylocator=None,
     frequency_scale='linear',
     fs=1,
+    decimate=True,
     **kwargs,
 ):
     """Plot phase response."""
-    phase = np.unwrap(np.angle(h))
+    phase = response.phase_unwrapped
     if phase_unit == 'deg':
         phase = 180 / np.pi * phase
     wscale = _get_freq_scale(freq_unit, fs)
-    w = wscale * w
-    ax.plot(w, phase, label=kwargs.pop("label", "Phase"), **kwargs)
+    w = response.scaled_w(freq_unit, fs)
+    if xmin is None:
+        xmin = response.w.min()
+    if xmax is None:
+        xmax = response.w.max()
+    if decimate:
+        w, phase = _decimate(
+            ax, w, phase, wscale * xmin, wscale * xmax, frequency_scale
+        )
+    ax.plot(w, phase.T, label=kwargs.pop("label", "Phase"), **kwargs)
 
     if xlabel is not None:
         ax.set_xlabel(xlabel)
@@ -467,17 +1147,12 @@ def _phase_plot_z(
     if frequency_scale == 'log':
         ax.set_xscale('log')
 
-    if xmin is None:
-        xmin = w.min()
-    if xmax is None:
-        xmax = w.max()
     ax.set_xlim(wscale * xmin, wscale * xmax)
 
 
 def _group_delay_plot_z(
     ax,
-    w,
-    h,
+    response,
     xmin=None,
     xmax=None,
     freq_unit=None,
@@ -487,14 +1162,21 @@ def _group_delay_plot_z(
     ylocator=None,
     frequency_scale='linear',
     fs=1,
+    decimate=True,
     **kwargs,
 ):
     """Plot group delay."""
-    gd, w = _utils.group_delay_from_h(w, h)
+    gd = response.group_delay
     wscale = _get_freq_scale(freq_unit, fs)
-    w = wscale * w
+    w = response.scaled_w(freq_unit, fs)
 
-    ax.plot(w, gd, label=kwargs.pop("label", "Group delay"), **kwargs)
+    if xmin is None:
+        xmin = response.w.min()
+    if xmax is None:
+        xmax = response.w.max()
+    if decimate:
+        w, gd = _decimate(ax, w, gd, wscale * xmin, wscale * xmax, frequency_scale)
+    ax.plot(w, gd.T, label=kwargs.pop("label", "Group delay"), **kwargs)
 
     if xlabel is not None:
         ax.set_xlabel(xlabel)
@@ -512,10 +1194,6 @@ def _group_delay_plot_z(
     if frequency_scale == 'log':
         ax.set_xscale('log')
 
-    if xmin is None:
-        xmin = w.min()
-    if xmax is None:
-        xmax = w.max()
     ax.set_xlim(wscale * xmin, wscale * xmax)
 
 
@@ -540,22 +1218,168 @@ def freqz_tf(num, den, **kwargs):
     return freqz(num=num, den=den, **kwargs)
 
 
-def freqz_fir(num, **kwargs):
+def freqz_fir(num, linear_phase=None, indices=None, **kwargs):
     """
     Plot the frequency response of a discrete-time FIR filter.
 
     Parameters
     ----------
     num : array-like
-        Numerator of transfer function.
+        Numerator of transfer function, or, if *indices* is given, the nonzero
+        taps at *indices*.
+    linear_phase : bool or {1, 2, 3, 4} or None, default: None
+        Linear-phase type of the filter. If None, it is detected from the symmetry
+        of *num*. Linear-phase filters are evaluated using the real amplitude
+        response, see :func:`freqz`.
+    indices : array-like, optional
+        Indices of the nonzero taps *num* of a sparse filter, see *taps* of
+        :func:`freqz`. Cannot be combined with *linear_phase* True or 1 to 4.
     **kwargs
         Additional arguments  passed to :func:`freqz`.
 
+    Returns
+    -------
+    None.
+
+    Notes
+    -----
+    If *indices* is not given and at most a quarter of the taps of *num* are
+    nonzero, e.g., for comb, half-band, and interpolated FIR filters, only the
+    nonzero taps are evaluated. Sparse linear-phase filters are instead evaluated
+    using the amplitude response, summing only its nonzero terms.
+    """
+    if indices is not None:
+        if linear_phase is not None and linear_phase is not False:
+            raise ValueError("'linear_phase' cannot be combined with 'indices'.")
+        return freqz(taps=(indices, num), **kwargs)
+    num = np.asarray(num)
+    if linear_phase is None and num.ndim in (1, 2):
+        nonzero = np.flatnonzero(np.any(num != 0, axis=tuple(range(num.ndim - 1))))
+        if (
+            nonzero.size <= _utils._SPARSE_FRACTION * num.shape[-1]
+            and _utils.fir_linear_phase_type(num) is None
+        ):
+            return freqz(taps=(nonzero, num[..., nonzero]), **kwargs)
+    return freqz(num=num, den=np.array([1.0]), linear_phase=linear_phase, **kwargs)
+
+
+def freqz_moving_average(length, **kwargs):
+    """
+    Plot the frequency response of a discrete-time moving average.
+
+    The response :math:`\\frac{1}{L}\\sum_{n=0}^{L-1} z^{-n}` is evaluated using the
+    closed form of its amplitude, the Dirichlet kernel, so the cost does not
+    depend on the length.
+
+    Parameters
+    ----------
+    length : int
+        Number of averaged samples :math:`L`.
+    **kwargs
+        Additional arguments passed to :func:`freqz_cic`.
+
     Returns
     -------
     None.
     """
-    return freqz(num=num, den=np.array([1.0]), **kwargs)
+    return freqz_cic(length, 1, 1, normalize=True, **kwargs)
+
+
+def freqz_cic(R, M=1, N=1, normalize=True, **kwargs):
+    """
+    Plot the frequency response of a discrete-time cascaded integrator-comb filter.
+
+    The response :math:`(\\sum_{n=0}^{RM-1} z^{-n})^N` is evaluated using the
+    closed form of its amplitude, the Dirichlet kernel to the power of :math:`N`,
+    so the cost does not depend on :math:`RM` or :math:`N`. The magnitude in dB is
+    evaluated as a sum of logarithms, which does not overflow or underflow. The
+    frequency is relative to the input, high, sample rate.
+
+    Parameters
+    ----------
+    R : int
+        Rate change factor.
+    M : int, default: 1
+        Differential delay.
+    N : int, default: 1
+        Number of stages.
+    normalize : bool, default: True
+        Whether to divide by the DC gain :math:`(RM)^N`.
+    **kwargs
+        Additional arguments passed to :func:`freqz`, except *cache*, *adaptive*,
+        *adaptive_tol*, *precision*, *max_memory*, *workers*, and *linear_phase*,
+        which apply to evaluating a filter.
+
+    Returns
+    -------
+    None.
+    """
+    for name, value in (('R', R), ('M', M), ('N', N)):
+        if int(value) != value or value < 1:
+            raise ValueError(f"'{name}' must be a positive integer.")
+    length = int(R) * int(M)
+    order = int(N)
+
+    def response(w):
+        return _linear_phase_response(
+            w,
+            _utils.cic_amplitude(length, order, w, normalize),
+            order * (length - 1) / 2,
+            magnitude_db=_utils.cic_magnitude_db(length, order, w, normalize),
+        )
+
+    return _freqz_closed_form(response, **kwargs)
+
+
+def freqz_comb(delay, gain=-1.0, feedback=False, **kwargs):
+    """
+    Plot the frequency response of a discrete-time comb filter.
+
+    The response is evaluated in closed form, so the cost does not depend on the
+    delay. Feedforward comb filters with *gain* :math:`\\pm 1` are linear-phase and
+    are evaluated using their real amplitude response, :math:`2\\cos(D\\omega/2)`
+    or :math:`2\\sin(D\\omega/2)`, so the phase is not unwrapped.
+
+    Parameters
+    ----------
+    delay : int
+        Delay :math:`D` in samples.
+    gain : float, default: -1.0
+        Gain :math:`g` of the delayed signal.
+    feedback : bool, default: False
+        If False, plot the feedforward comb filter :math:`1 + gz^{-D}`. If True,
+        plot the feedback comb filter :math:`1/(1 - gz^{-D})`.
+    **kwargs
+        Additional arguments passed to :func:`freqz`, except *cache*, *adaptive*,
+        *adaptive_tol*, *precision*, *max_memory*, *workers*, and *linear_phase*,
+        which apply to evaluating a filter.
+
+    Returns
+    -------
+    None.
+    """
+    if int(delay) != delay or delay < 1:
+        raise ValueError("'delay' must be a positive integer.")
+    delay = int(delay)
+    if np.ndim(gain) != 0:
+        raise ValueError("'gain' must be a scalar.")
+
+    def response(w):
+        if not feedback and gain in (1, -1):
+            half = delay * w / 2
+            amplitude = 2 * np.cos(half) if gain == 1 else 2 * np.sin(half)
+            return _linear_phase_response(
+                w, amplitude, delay / 2, quadrature=gain == -1
+            )
+        return FrequencyResponse(
+            w,
+            _utils.freqz_comb(delay, gain, w, feedback),
+            group_delay=functools.partial(
+                _utils.group_delay_comb, delay, gain, feedback=feedback
+            ),
+        )
+
+    return _freqz_closed_form(response, **kwargs)
 
 
 def freqz_zpk(zeros, poles, gain=1.0, **kwargs):
@@ -581,6 +1405,406 @@ def freqz_zpk(zeros, poles, gain=1.0, **kwargs):
     return freqz(zeros=zeros, poles=poles, gain=gain, **kwargs)
 
 
+def freqz_sos(sos, **kwargs):
+    """
+    Plot the frequency response of a discrete-time system represented using
+    second-order sections.
+
+    Parameters
+    ----------
+    sos : array-like
+        Second-order sections of shape ``(n_sections, 6)``, where each row is
+        ``[b0, b1, b2, a0, a1, a2]``.
+    **kwargs
+        Additional arguments passed to :func:`freqz`.
+
+    Returns
+    -------
+    None.
+    """
+    return freqz(sos=sos, **kwargs)
+
+
+def freqz_ss(A, B, C, D=0, **kwargs):
+    """
+    Plot the frequency response of a discrete-time system represented using
+    state-space matrices.
+
+    Parameters
+    ----------
+    A : array-like
+        State matrix of shape ``(n, n)``.
+    B : array-like
+        Input matrix of shape ``(n, m)``.
+    C : array-like
+        Output matrix of shape ``(p, n)``.
+    D : array-like, default: 0
+        Feedthrough matrix of shape ``(p, m)``.
+    **kwargs
+        Additional arguments passed to :func:`freqz`.
+
+    Returns
+    -------
+    None.
+    """
+    return freqz(ss=(A, B, C, D), **kwargs)
+
+
+def freqs(
+    num=None,
+    den=None,
+    zeros=None,
+    poles=None,
+    gain: float = 1.0,
+    w=None,
+    freq_unit: Literal['rad/s', 'Hz'] = 'rad/s',
+    phase_unit: Literal['rad', 'deg'] = 'rad',
+    ax: Union["Axes", Sequence["Axes"], None] = None,
+    style: Literal[
+        'stacked', 'twin', 'magnitude', 'phase', 'group_delay', 'tristacked'
+    ] = 'stacked',
+    magnitude_scale: Literal['log', 'linear'] = 'log',
+    frequency_scale: Literal['log', 'linear'] = 'log',
+    wrange: tuple[float, float] | None = None,
+    points_per_decade: int = 50,
+    align_ylabels: bool = True,
+    workers: int | None = None,
+    return_response: bool = False,
+    decimate: bool = True,
+    **kwargs,
+) -> Union["Figure", tuple["Figure", "FrequencyResponse"]]:
+    """
+    Plot the frequency response of a continuous-time system.
+
+    Parameters
+    ----------
+    num : array-like, optional
+        Numerator of transfer function, highest power of *s* first. If 2-D, each
+        row is the numerator of a separate filter and one line per filter is
+        plotted.
+    den : array-like, optional
+        Denominator of transfer function, highest power of *s* first. If 2-D, each
+        row is the denominator of a separate filter.
+    zeros : array-like, optional
+        Zeros of transfer function. If 2-D, each row is the zeros of a separate
+        filter.
+    poles : array-like, optional
+        Poles of transfer function. If 2-D, each row is the poles of a separate
+        filter.
+    gain : float or array-like, default: 1.0
+        The gain of pole-zero-based transfer function. If 1-D, the gain of each
+        filter.
+    w : array-like, optional
+        Angular frequencies, in rad/s, to determine the transfer function at. If
+        None, a grid spanning *wrange* is used.
+    freq_unit : {'rad/s', 'Hz'}, default: 'rad/s'
+        Unit for frequency axes.
+    phase_unit : {'rad', 'deg'}, default: 'rad'
+        Unit for phase.
+    ax : :class:`~matplotlib.axes.Axes` or iterable of :class:`~matplotlib.axes.Axes`,\
+ optional
+        Axes or iterable of Axes to plot in. If None, create required Axes.
+    style : {'stacked', 'twin', 'magnitude', 'phase', 'group_delay', \
+'tristacked'}, default: 'stacked'
+        Plotting style.
+    magnitude_scale : {'linear', 'log'}, default: 'log'
+        Whether magnitude is plotted in linear or logarithmic (dB) scale. For
+        *zeros* and *poles*, the magnitude in dB is computed as a sum of the
+        logarithms of the distances to the zeros and poles.
+    frequency_scale : {'linear', 'log'}, default: 'log'
+        Whether frequency is plotted in linear or logarithmic scale. If 'log', the
+        frequency-points are logarithmically spaced with *points_per_decade* points
+        per decade, so the number of points is proportional to the number of
+        decades covered. If 'linear', 512 uniformly spaced points are used.
+    wrange : (float, float), optional
+        Angular frequency range, in rad/s, to plot if *w* is None. Default: from
+        one decade below the smallest to one decade above the largest nonzero
+        magnitude of the zeros and poles.
+    points_per_decade : int, default: 50
+        Number of frequency-points per decade if *frequency_scale* is 'log'.
+    align_ylabels : bool, default: True
+        Align the y-labels when *style* is 'stacked' or 'tristacked'
+    workers : int, optional
+        Number of threads to evaluate the response with, see :func:`freqz`.
+    return_response : bool, default: False
+        If True, also return the :class:`FrequencyResponse`.
+    decimate : bool, default: True
+        Decimate curves with many more frequency-points than the Axes is wide in
+        pixels before plotting, see :func:`freqz`.
+    **kwargs
+        Additional arguments passed to :func:`matplotlib.axes.Axes.plot`.
+
+    Returns
+    -------
+    :class:`~matplotlib.figure.Figure`
+        The figure. If *return_response* is True, a tuple of the figure and the
+        :class:`FrequencyResponse`.
+    """
+    _check_filter(num, den, zeros, poles)
+    _api.check_in_iterable(('rad/s', 'Hz'), freq_unit=freq_unit)
+    _api.check_in_iterable(('rad', 'deg'), phase_unit=phase_unit)
+    _api.check_in_iterable(
+        ('stacked', 'twin', 'magnitude', 'phase', 'group_delay', 'tristacked'),
+        style=style,
+    )
+    _api.check_in_iterable(('linear', 'log'), magnitude_scale=magnitude_scale)
+    _api.check_in_iterable(('linear', 'log'), frequency_scale=frequency_scale)
+    if w is not None and wrange is not None:
+        raise ValueError("'w' cannot be combined with 'wrange'.")
+    if workers is not None and workers < 1:
+        raise ValueError("'workers' must be a positive integer.")
+
+    if not np.iterable(ax) and ax is not None:
+        ax = [ax]
+
+    magnitude_db = None
+    if num is not None and den is not None:
+        frequency_response = functools.partial(
+            _utils.freqs_tf, num, den, workers=workers
+        )
+        group_delay = functools.partial(_utils.group_delay_s, num, den, workers=workers)
+    elif zeros is not None and poles is not None:
+        frequency_response = functools.partial(
+            _utils.freqs_zpk, zeros, poles, gain, workers=workers
+        )
+        group_delay = functools.partial(
+            _utils.group_delay_zpk_s, zeros, poles, workers=workers
+        )
+        magnitude_db = functools.partial(
+            _utils.freqs_zpk_db, zeros, poles, gain, workers=workers
+        )
+    else:
+        raise ValueError(
+            "'num' and 'den', or 'zeros' and 'poles', must be provided together."
+        )
+
+    if w is None:
+        if wrange is None:
+            if zeros is not None:
+                roots = np.concatenate((np.ravel(zeros), np.ravel(poles)))
+            else:
+                roots = [
+                    np.roots(row)
+                    for coeffs in (num, den)
+                    for row in np.atleast_2d(coeffs)
+                ]
+                roots = np.concatenate(roots)
+            wrange = _utils.decade_range(roots)
+        if frequency_scale == 'log':
+            w = _utils.log_grid(wrange[0], wrange[1], points_per_decade)
+        else:
+            w = np.linspace(wrange[0], wrange[1], 512)
+    w = np.asarray(w, dtype=float)
+
+    response = FrequencyResponse(
+        w, frequency_response(w), magnitude_db=magnitude_db, group_delay=group_delay
+    )
+    fig = _plot_h(
+        response,
+        ax=ax,
+        style=style,
+        freq_unit=freq_unit,
+        phase_unit=phase_unit,
+        magnitude_scale=magnitude_scale,
+        frequency_scale=frequency_scale,
+        align_ylabels=align_ylabels,
+        time_unit='s',
+        decimate=decimate,
+        **kwargs,
+    )
+    if return_response:
+        return fig, response
+    return fig
+
+
+def freqs_tf(num, den, **kwargs):
+    """
+    Plot the frequency response of a continuous-time system represented using a
+    transfer function.
+
+    Parameters
+    ----------
+    num : array-like
+        Numerator of transfer function, highest power of *s* first.
+    den : array-like
+        Denominator of transfer function, highest power of *s* first.
+    **kwargs
+        Additional arguments passed to :func:`freqs`.
+
+    Returns
+    -------
+    None.
+    """
+    return freqs(num=num, den=den, **kwargs)
+
+
+def freqs_zpk(zeros, poles, gain=1.0, **kwargs):
+    """
+    Plot the frequency response of a continuous-time system represented using
+    zeros, poles and gain.
+
+    Parameters
+    ----------
+    zeros : array-like
+        Zeros of system.
+    poles : array-like
+        Poles of system.
+    gain : float, default: 1.0
+        Gain of system.
+    **kwargs
+        Additional arguments passed to :func:`freqs`.
+
+    Returns
+    -------
+    None.
+    """
+    return freqs(zeros=zeros, poles=poles, gain=gain, **kwargs)
+
+
+def _frequency_grid(n, whole, include_nyquist, frequency_scale, wrange):
+    """
+    Return a function of *start* and *stop* returning those of the *n*
+    frequency-points that :func:`freqz` evaluates at.
+    """
+    if wrange is not None:
+        return functools.partial(_utils.linear_grid, wrange[0], wrange[1], n, True)
+    wmax = 2 * np.pi if whole else np.pi
+    if frequency_scale == 'linear':
+        return functools.partial(_utils.linear_grid, 0, wmax, n, include_nyquist)
+    exponents = functools.partial(
+        _utils.linear_grid, -5, np.log10(wmax), n, include_nyquist
+    )
+
+    def grid(start, stop):
+        return 10 ** exponents(start, stop)
+
+    return grid
+
+
+# Arguments of freqz that only apply to evaluating a filter, with their defaults
+_EVALUATION_DEFAULTS = {
+    'cache': False,
+    'adaptive': False,
+    'adaptive_tol': 1e-2,
+    'precision': 'double',
+    'max_memory': None,
+    'workers': None,
+    'linear_phase': False,
+}
+
+
+def _freqz_closed_form(
+    response,
+    w=None,
+    whole=False,
+    include_nyquist=False,
+    frequency_scale='linear',
+    wrange=None,
+    **kwargs,
+):
+    """
+    Plot a response given in closed form using :func:`freqz`.
+
+    Parameters
+    ----------
+    response : callable
+        Function of the frequency-points returning a :class:`FrequencyResponse`.
+    w, whole, include_nyquist, frequency_scale, wrange
+        The frequency-points, see :func:`freqz`.
+    **kwargs
+        Additional arguments passed to :func:`freqz`. Arguments controlling how
+        a filter is evaluated cannot be honored for a closed form and raise a
+        ValueError if not at their defaults.
+    """
+    for name, default in _EVALUATION_DEFAULTS.items():
+        if kwargs.get(name, default) != default:
+            raise ValueError(
+                f"'{name}' is not supported for responses evaluated in closed form."
+            )
+    if w is None:
+        w = 512
+    if isinstance(w, int):
+        if wrange is None and not include_nyquist and kwargs.get('xmax', None) is None:
+            kwargs['xmax'] = 2 * np.pi if whole else np.pi
+        w = _frequency_grid(w, whole, include_nyquist, frequency_scale, wrange)(0, w)
+    elif wrange is not None:
+        raise ValueError("'w' must be an integer when 'wrange' is provided.")
+    return freqz(
+        response=response(np.asarray(w, dtype=float)),
+        frequency_scale=frequency_scale,
+        **kwargs,
+    )
+
+
+def _linear_phase_response(w, amplitude, delay, quadrature=False, magnitude_db=None):
+    """Return the response with real *amplitude* and constant group delay."""
+    phase = _utils.delay_phase(w, delay, amplitude, quadrature)
+    return FrequencyResponse(
+        w,
+        lambda w: np.abs(amplitude) * np.exp(1j * phase),
+        magnitude=np.abs(amplitude),
+        magnitude_db=magnitude_db,
+        phase_unwrapped=phase,
+        group_delay=lambda w: np.full(w.shape, float(delay)),
+    )
+
+
+def _principal_start(phase):
+    """
+    Shift unwrapped *phase* by a multiple of :math:`2\\pi` so that it starts in
+    :math:`(-\\pi, \\pi]`, as the unwrapped angle of the response does.
+    """
+    start = phase[..., :1]
+    return phase - (start - np.angle(np.exp(1j * start)))
+
+
+def _rows(function):
+    """
+    Wrap a function of *w* returning MIMO responses to return one row per
+    input-output pair, or a 1-D array for single-input single-output systems.
+    """
+
+    def wrapper(w):
+        values = function(w)
+        if values.shape[:2] == (1, 1):
+            return values[0, 0]
+        return values.reshape(-1, values.shape[-1])
+
+    return wrapper
+
+
+def _is_one(den):
+    """Return whether the denominators *den* are all equal to 1."""
+    den = np.asarray(den)
+    return (den.ndim == 0 or den.shape[-1] == 1) and bool(np.all(den == 1))
+
+
+def _check_filter(num, den, zeros, poles):
+    """Check that the filter is given by exactly one representation."""
+    if num is None and zeros is None:
+        raise ValueError("At least one of 'num' and 'zeros' must be provided.")
+
+    if num is not None and zeros is not None:
+        raise ValueError("At most one of 'num' and 'zeros' must be provided.")
+
+    if den is None and poles is None:
+        raise ValueError("At least one of 'den' and 'poles' must be provided.")
+
+    if den is not None and poles is not None:
+        raise ValueError("At most one of 'den' and 'poles' must be provided.")
+
+
+def _decimate(ax, w, values, xmin, xmax, frequency_scale):
+    """Keep the points of curves that are visible at the resolution of *ax*."""
+    n_columns = math.ceil(_utils._COLUMNS_PER_PIXEL * ax.bbox.width)
+    indices = _utils.envelope_indices(
+        w, values, (xmin, xmax), n_columns, log=frequency_scale == 'log'
+    )
+    if indices is None:
+        return w, values
+    return w[indices], values[..., indices]
+
+
 def _get_freq_scale(freq_unit, fs):
     """Return scale factor based on named option."""
     if freq_unit == 'deg':
@@ -591,6 +1815,8 @@ def _get_freq_scale(freq_unit, fs):
         if fs is None:
             raise ValueError("Cannot use freq_unit = 'fs' without providing fs")
         return fs / (2 * np.pi)
+    if freq_unit == 'Hz':
+        return 1 / (2 * np.pi)
     return 1
 
 
@@ -599,7 +1825,7 @@ def _set_freq_formatter(freq_unit, axis):
     if freq_unit == 'deg':
         axis.set_major_formatter(DegreeFormatter())
         return DegreeLocator()
-    if freq_unit in ('fs', 'norm'):
+    if freq_unit in ('fs', 'norm', 'rad/s', 'Hz'):
         return None
     if freq_unit == 'normfs':
         axis.set_major_formatter(SampleFrequencyFormatter(fs=2 * np.pi))
@@ -614,8 +1840,10 @@ def _get_freq_unit_text(freq_unit):
         return "Frequency, deg/sample"
     if freq_unit in ('norm', 'normfs'):
         return 'Normalized frequency'
-    if freq_unit == 'fs':
+    if freq_unit in ('fs', 'Hz'):
         return "Frequency, Hz"
+    if freq_unit == 'rad/s':
+        return "Frequency, rad/s"
     return "Frequency, rad/sample"
 
 
@@ -11,11 +11,14 @@ __all__ = [
     "splane_tf",
 ]
 
-import math
-
 import adjustText
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.artist import Artist
+from matplotlib.text import Text
+from matplotlib.transforms import IdentityTransform
+from mplsignal import _api, _roots, _utils
+from mplsignal.system import DiscreteSystem
 
 
 def zplane(
@@ -35,6 +38,12 @@ def zplane(
     zero_props=None,
     pole_props=None,
     multiplicity_props=None,
+    atol: float = 1e-12,
+    rtol: float = 1e-9,
+    label_layout: str = 'adjust',
+    mode: str = 'markers',
+    bins=256,
+    extent=None,
     **kwargs,
 ):
     r"""
@@ -42,8 +51,11 @@ def zplane(
 
     Parameters
     ----------
-    zeros : array-like, optional
-        Zeros of transfer function.
+    zeros : array-like or :class:`~mplsignal.system.DiscreteSystem`, optional
+        Zeros of transfer function. If a
+        :class:`~mplsignal.system.DiscreteSystem`, its zeros and poles are plotted,
+        including those at the origin from differences in the lengths of the
+        numerator and denominator. The roots are computed once per system.
 
     poles : array-like, optional
         Poles of transfer function.
@@ -105,24 +117,96 @@ def zplane(
 
         .. versionadded:: 0.2.0
 
+    atol : float, default: 1e-12
+        Absolute tolerance for plotting zeros, or poles, as one marker with
+        multiplicity.
+
+    rtol : float, default: 1e-9
+        Relative tolerance for plotting zeros, or poles, as one marker with
+        multiplicity. Two zeros, or poles, :math:`a` and :math:`b` are the same if
+        :math:`|a - b| \le \max(atol, rtol \cdot \max(|a|, |b|))`, and the marker
+        is plotted at the mean of each group. Increase the tolerances to group
+        multiple roots computed from a transfer function, which spread by about
+        :math:`\epsilon^{1/m}` for multiplicity :math:`m`.
+
+    label_layout : {'adjust', 'fast', 'none'}, default: 'adjust'
+        Placement of the texts showing multiplicity. 'adjust' moves the texts
+        iteratively using adjustText to avoid overlaps, which is slow for many
+        texts. 'fast' offsets the texts radially from the origin, and further out
+        where they would overlap, in one vectorized pass when drawing. 'none' places
+        the texts at the poles and zeros. For 'fast' and 'none', all texts are drawn
+        by a single artist.
+
+    mode : {'markers', 'density'}, default: 'markers'
+        'markers' plots a marker for each zero and pole. 'density' plots the
+        numbers of zeros and poles in the bins of a 2-D histogram over the plane as
+        images, e.g., for millions of roots from a coefficient-sensitivity study.
+        Zeros and poles are counted separately, in chunks to bound the memory, and
+        shown in logarithmic color scales, by default 'Blues' for zeros and 'Reds'
+        for poles, with empty bins transparent. *zero_props* and *pole_props* are
+        then passed to :meth:`~matplotlib.axes.Axes.imshow`, and the marker
+        arguments and *multiplicity_props* are ignored.
+
+    bins : int or (int, int), default: 256
+        Number of bins along the real and imaginary axes for *mode* 'density'.
+
+    extent : (float, float, float, float), optional
+        Region ``(xmin, xmax, ymin, ymax)`` of the histogram for *mode* 'density'.
+        Zeros and poles outside it are not counted. Default: all finite zeros and
+        poles, and the unit circle if *unitcircle* is True, with a margin.
+
     **kwargs
-        Additional arguments passed to :meth:`matplotlib.Axes.plot`.
+        Additional arguments passed to :meth:`matplotlib.Axes.plot`, or to
+        :meth:`~matplotlib.axes.Axes.imshow` for *mode* 'density'.
 
     Returns
     -------
     None.
     """
+    _api.check_in_iterable(('adjust', 'fast', 'none'), label_layout=label_layout)
+    _api.check_in_iterable(('markers', 'density'), mode=mode)
+    if isinstance(zeros, DiscreteSystem):
+        if poles is not None:
+            raise ValueError("A 'DiscreteSystem' cannot be combined with 'poles'.")
+        zeros, poles, _ = zeros.zpk
     # if Axes not provided
     if ax is None:
         ax = plt.gca()
     ax.axvline(color=spinecolor, linewidth=spinelinewidth)
     ax.axhline(color=spinecolor, linewidth=spinelinewidth)
-    if markercolor is None:
-        markercolor = ax._get_lines.get_next_color()
     if reallabel is None:
         reallabel = "Real part"
     if imaglabel is None:
         imaglabel = "Imaginary part"
+    if unitcircle:
+        ax.add_patch(
+            plt.Circle(
+                (0, 0),
+                radius=1,
+                fill=False,
+                edgecolor=spinecolor,
+                linewidth=spinelinewidth,
+            )
+        )
+    if mode == 'density':
+        _plot_density(
+            zeros,
+            poles,
+            ax,
+            bins,
+            extent,
+            unitcircle,
+            zero_props=zero_props,
+            pole_props=pole_props,
+            **kwargs,
+        )
+        ax.set_xlabel(reallabel)
+        ax.set_ylabel(imaglabel)
+        ax.axis('equal')
+        return ax
+
+    if markercolor is None:
+        markercolor = ax._get_lines.get_next_color()
 
     # Update zero properties
     if zero_props is None:
@@ -148,17 +232,7 @@ def zplane(
     if "ls" not in pole_props and "linestyle" not in pole_props:
         pole_props["ls"] = 'none'
 
-    if unitcircle:
-        ax.add_patch(
-            plt.Circle(
-                (0, 0),
-                radius=1,
-                fill=False,
-                edgecolor=spinecolor,
-                linewidth=spinelinewidth,
-            )
-        )
-    xvals, yvals, texts = _plot_plane(
+    xvals, yvals, labels = _plot_plane(
         zeros,
         poles,
         ax=ax,
@@ -166,12 +240,23 @@ def zplane(
         imaglabel=imaglabel,
         zero_props=zero_props,
         pole_props=pole_props,
-        multiplicity_props=multiplicity_props,
+        atol=atol,
+        rtol=rtol,
         **kwargs,
     )
     ax.axis('equal')
-    if texts:
+    if multiplicity_props is None:
+        multiplicity_props = {}
+    if labels and label_layout == 'adjust':
+        texts = [ax.text(x, y, text, **multiplicity_props) for x, y, text in labels]
         adjustText.adjust_text(texts, x=xvals, y=yvals, ax=ax)
+    elif labels:
+        x, y, texts = zip(*labels)
+        ax.add_artist(
+            _MultiplicityTexts(
+                x, y, texts, offset=label_layout == 'fast', **multiplicity_props
+            )
+        )
     return ax
 
 
@@ -184,7 +269,7 @@ def splane(zeros=None, poles=None, **kwargs):
     return zplane(zeros=zeros, poles=poles, unitcircle=False, **kwargs)
 
 
-def zplane_tf(num=None, den=None, **kwargs):
+def zplane_tf(num=None, den=None, method='auto', **kwargs):
     """
     Plot the z-plane of a discrete-time system represented as a transfer function.
 
@@ -194,15 +279,24 @@ def zplane_tf(num=None, den=None, **kwargs):
         Numerator of transfer function.
     den : array-like, optional
         Denominator of transfer function.
+    method : {'auto', 'eig', 'linear_phase', 'aberth'}, default: 'auto'
+        Method to compute the roots of *num* and *den*. 'eig' uses
+        :func:`numpy.roots`. 'linear_phase' exploits the reciprocal root pairs of
+        symmetric and antisymmetric coefficients, e.g., of linear-phase FIR
+        filters, and finds the roots on the unit circle from sign changes of the
+        amplitude response. 'aberth' uses the Aberth-Ehrlich iteration, which is
+        faster than 'eig' for high degrees. 'auto' uses 'linear_phase' for
+        symmetric and antisymmetric coefficients, 'aberth' for degrees of at
+        least 256, and 'eig' otherwise.
     **kwargs
         Additional arguments passed to :func:`zplane`.
     """
-    zeros = None if num is None else np.roots(num)
-    poles = None if den is None else np.roots(den)
+    zeros = None if num is None else _roots.roots(num, method)
+    poles = None if den is None else _roots.roots(den, method)
     return zplane(zeros=zeros, poles=poles, **kwargs)
 
 
-def splane_tf(num=None, den=None, **kwargs):
+def splane_tf(num=None, den=None, method='auto', **kwargs):
     """
     Plot the s-plane of a continuous-time system represented as a transfer function.
 
@@ -212,15 +306,24 @@ def splane_tf(num=None, den=None, **kwargs):
         Numerator of transfer function.
     den : array-like, optional
         Denominator of transfer function.
+    method : {'auto', 'eig', 'linear_phase', 'aberth'}, default: 'auto'
+        Method to compute the roots of *num* and *den*. 'eig' uses
+        :func:`numpy.roots`. 'linear_phase' exploits the reciprocal root pairs of
+        symmetric and antisymmetric coefficients, e.g., of linear-phase FIR
+        filters, and finds the roots on the unit circle from sign changes of the
+        amplitude response. 'aberth' uses the Aberth-Ehrlich iteration, which is
+        faster than 'eig' for high degrees. 'auto' uses 'linear_phase' for
+        symmetric and antisymmetric coefficients, 'aberth' for degrees of at
+        least 256, and 'eig' otherwise.
     **kwargs
         Additional arguments passed to :func:`splane`.
     """
-    zeros = None if num is None else np.roots(num)
-    poles = None if den is None else np.roots(den)
+    zeros = None if num is None else _roots.roots(num, method)
+    poles = None if den is None else _roots.roots(den, method)
     return splane(zeros=zeros, poles=poles, **kwargs)
 
 
-def _get_positions(items):
+def _get_positions(positions, multiplicities):
     """
     Convert complex poles and zeros to x- and y-positions.
 
@@ -229,29 +332,24 @@ def _get_positions(items):
 
     Parameters
     ----------
-    items : list
-        List of complex positions.
+    positions : ndarray
+        Complex positions.
+    multiplicities : ndarray
+        Multiplicity of each position.
 
     Returns
     -------
-    pos_x : list
-        List with x-positions for *items*.
-    pos_x : list
-        List with y-positions for *items*.
+    pos_x : ndarray
+        x-positions for *positions*.
+    pos_y : ndarray
+        y-positions for *positions*.
     texts : list
         List with (x, y, multiplicity-string)-tuples for items with multiplicity > 1.
     """
-    pos_x = []
-    pos_y = []
-    texts = []
-    for zero, mul in items.items():
-        x = np.real(zero)
-        y = np.imag(zero)
-        pos_x.append(x)
-        pos_y.append(y)
-        if mul > 1:
-            texts.append((x, y, f"{mul}"))
-
+    pos_x = np.real(positions)
+    pos_y = np.imag(positions)
+    multiple = np.flatnonzero(multiplicities > 1)
+    texts = [(pos_x[i], pos_y[i], f"{multiplicities[i]}") for i in multiple.tolist()]
     return pos_x, pos_y, texts
 
 
@@ -263,7 +361,8 @@ def _plot_plane(
     ax=None,
     zero_props=None,
     pole_props=None,
-    multiplicity_props=None,
+    atol=1e-12,
+    rtol=1e-9,
     **kwargs,
 ):
     """
@@ -278,68 +377,282 @@ def _plot_plane(
     ax
     zero_props
     pole_props
-    multiplicity_props
+    atol
+    rtol
     **kwargs
 
     Returns
     -------
-    List of texts.
+    xvals, yvals : ndarray
+        Positions of the plotted markers.
+    labels : list
+        List with (x, y, multiplicity-string)-tuples for items with multiplicity > 1.
     """
-    text_items = []
-    xvals = []
-    yvals = []
-    if multiplicity_props is None:
-        multiplicity_props = {}
-    if zeros is not None:
-        zeros_d = _get_multiplicities(zeros)
-        x_pos, y_pos, texts = _get_positions(zeros_d)
+    labels = []
+    xvals = [np.zeros(0)]
+    yvals = [np.zeros(0)]
+    for items, props in ((zeros, zero_props), (poles, pole_props)):
+        if items is None:
+            continue
+        x_pos, y_pos, texts = _get_positions(*_get_multiplicities(items, atol, rtol))
         ax.plot(
             x_pos,
             y_pos,
-            **zero_props,
+            **props,
             **kwargs,
         )
-        xvals.extend(x_pos)
-        yvals.extend(y_pos)
-        text_items.extend(
-            ax.text(x, y, text, **multiplicity_props) for x, y, text in texts
-        )
-
-    if poles is not None:
-        poles_d = _get_multiplicities(poles)
-        x_pos, y_pos, texts = _get_positions(poles_d)
-        ax.plot(
-            x_pos,
-            y_pos,
-            **pole_props,
-            **kwargs,
-        )
-        xvals.extend(x_pos)
-        yvals.extend(y_pos)
-        text_items.extend(
-            ax.text(x, y, text, **multiplicity_props) for x, y, text in texts
-        )
+        xvals.append(x_pos)
+        yvals.append(y_pos)
+        labels.extend(texts)
 
     ax.set_xlabel(reallabel)
     ax.set_ylabel(imaglabel)
-    return xvals, yvals, text_items
-
-
-def _is_close(x, y):
-    """Check if poles/zeros are close."""
-    return math.isclose(np.real(x), np.real(y)) and math.isclose(np.imag(x), np.imag(y))
-
-
-def _get_multiplicities(x):
-    """Turn list of poles/zeros into a dict with location and multiplicity."""
-    res = dict()
-    for val in x:
-        existed = False
-        for ref in res:
-            if _is_close(val, ref):
-                res[ref] += 1
-                existed = True
-                continue
-        if not existed:
-            res[val] = 1
-    return res
+    return np.concatenate(xvals), np.concatenate(yvals), labels
+
+
+def _plot_density(
+    zeros,
+    poles,
+    ax,
+    bins,
+    extent,
+    unitcircle,
+    zero_props=None,
+    pole_props=None,
+    **kwargs,
+):
+    """Plot zeros and poles as images of 2-D histograms over the plane."""
+    nx, ny = np.broadcast_to(bins, 2)
+    sets = [
+        (np.ravel(np.asarray(items)), props, cmap)
+        for items, props, cmap in (
+            (zeros, zero_props, 'Blues'),
+            (poles, pole_props, 'Reds'),
+        )
+        if items is not None
+    ]
+    if extent is None:
+        extent = _density_extent([items for items, _, _ in sets], unitcircle)
+    for items, props, cmap in sets:
+        counts = _histogram_plane(items, extent, nx, ny)
+        if not counts.any():
+            continue
+        image_props = {
+            'cmap': cmap,
+            'norm': 'log',
+            'interpolation': 'nearest',
+            'origin': 'lower',
+            'aspect': 'auto',
+            **kwargs,
+            **(props or {}),
+        }
+        ax.imshow(np.ma.masked_equal(counts, 0), extent=extent, **image_props)
+
+
+def _density_extent(sets, unitcircle, margin=0.05):
+    """
+    Return the region ``(xmin, xmax, ymin, ymax)`` containing the finite points of
+    *sets*, and the unit circle if *unitcircle*, with a relative *margin*.
+    """
+    lower = np.full(2, -1.0 if unitcircle else np.inf)
+    upper = np.full(2, 1.0 if unitcircle else -np.inf)
+    for items in sets:
+        for start in range(0, items.size, _utils._BLOCK_ELEMENTS):
+            chunk = items[start : start + _utils._BLOCK_ELEMENTS]
+            chunk = chunk[np.isfinite(chunk)]
+            if chunk.size:
+                points = np.stack((chunk.real, np.imag(chunk)))
+                lower = np.minimum(lower, points.min(axis=1))
+                upper = np.maximum(upper, points.max(axis=1))
+    if not np.all(lower <= upper):
+        lower, upper = np.full(2, -1.0), np.full(2, 1.0)
+    pad = margin * (upper - lower).max()
+    if pad == 0:
+        pad = 1.0
+    return (lower[0] - pad, upper[0] + pad, lower[1] - pad, upper[1] + pad)
+
+
+def _histogram_plane(items, extent, nx, ny):
+    """
+    Return the numbers of complex *items* in *nx* by *ny* bins over *extent*, as an
+    array of shape ``(ny, nx)``.
+
+    The items are counted in chunks, so the memory is bounded for any number of
+    items. As for :func:`numpy.histogram2d`, the last bins include their upper edges.
+    """
+    xmin, xmax, ymin, ymax = extent
+    counts = np.zeros(nx * ny, dtype=np.int64)
+    for start in range(0, items.size, _utils._BLOCK_ELEMENTS):
+        chunk = items[start : start + _utils._BLOCK_ELEMENTS]
+        x = chunk.real
+        y = np.imag(chunk)
+        ix = np.floor((x - xmin) * (nx / (xmax - xmin)))
+        iy = np.floor((y - ymin) * (ny / (ymax - ymin)))
+        ix[x == xmax] = nx - 1
+        iy[y == ymax] = ny - 1
+        inside = (ix >= 0) & (ix < nx) & (iy >= 0) & (iy < ny)
+        index = (iy[inside] * nx + ix[inside]).astype(np.intp)
+        counts += np.bincount(index, minlength=nx * ny)
+    return counts.reshape(ny, nx)
+
+
+class _MultiplicityTexts(Artist):
+    """
+    Texts showing multiplicity, drawn by a single artist.
+
+    Parameters
+    ----------
+    x, y : array-like
+        Positions of the poles and zeros in data coordinates.
+    texts : list of str
+        The texts.
+    offset : bool, default: False
+        Whether to offset the texts from the poles and zeros, see
+        :func:`_radial_offsets`.
+    **kwargs
+        Properties of the texts, see :class:`~matplotlib.text.Text`.
+    """
+
+    def __init__(self, x, y, texts, offset=False, **kwargs):
+        super().__init__()
+        self._xy = np.column_stack([x, y]).astype(float)
+        self._texts = list(texts)
+        self._offset = offset
+        if offset:
+            kwargs = {
+                'horizontalalignment': 'center',
+                'verticalalignment': 'center',
+                **kwargs,
+            }
+        # Template reused for drawing each text
+        self._text = Text(transform=IdentityTransform(), **kwargs)
+        self.set_zorder(self._text.get_zorder())
+
+    def draw(self, renderer):
+        if not self.get_visible() or not self._texts:
+            return
+        self._text.set_figure(self.figure)
+        xy = self.axes.transData.transform(self._xy)
+        if self._offset:
+            size = renderer.points_to_pixels(self._text.get_fontsize())
+            xy = xy + _radial_offsets(xy, self.axes.transData.transform((0, 0)), size)
+        for (x, y), text in zip(xy, self._texts):
+            self._text.set_position((x, y))
+            self._text.set_text(text)
+            self._text.draw(renderer)
+
+
+def _radial_offsets(xy, origin, size):
+    """
+    Return offsets of texts placed radially from the origin without overlaps.
+
+    Parameters
+    ----------
+    xy : ndarray
+        Positions of shape ``(n, 2)`` in display coordinates.
+    origin : ndarray
+        Position of the origin in display coordinates.
+    size : float
+        Font size in display units.
+
+    Returns
+    -------
+    ndarray
+        Offsets of shape ``(n, 2)``. Each text is moved by *size* away from the
+        origin, and texts that would share a cell of a grid with spacing 1.5 *size*
+        are moved further out by *size* for each preceding text in the cell.
+    """
+    direction = xy - origin
+    norm = np.hypot(*direction.T)[:, np.newaxis]
+    with np.errstate(invalid='ignore'):
+        direction = np.where(norm > 0, direction / norm, np.sqrt(0.5))
+    offsets = size * direction
+    # Rank of each text among the texts in the same cell, in order
+    _, cells = np.unique(
+        np.floor((xy + offsets) / (1.5 * size)), axis=0, return_inverse=True
+    )
+    cells = cells.ravel()
+    order = np.argsort(cells, kind='stable')
+    starts = np.searchsorted(cells[order], cells[order])
+    rank = np.empty_like(cells)
+    rank[order] = np.arange(cells.size) - starts
+    return offsets * (1 + rank[:, np.newaxis])
+
+
+def _get_multiplicities(x, atol=1e-12, rtol=1e-9):
+    """
+    Group poles/zeros that are close and return their locations and multiplicity.
+
+    Parameters
+    ----------
+    x : array-like
+        Poles or zeros.
+    atol, rtol : float
+        Tolerances, see :func:`zplane`. Groups are the connected components of
+        close pairs.
+
+    Returns
+    -------
+    positions : ndarray
+        Mean of each group, in order of first occurrence.
+    multiplicities : ndarray
+        Number of poles/zeros in each group.
+    """
+    x = np.ravel(np.asarray(x, dtype=complex))
+    n = x.size
+    magnitude = np.abs(x)
+    tol = max(atol, rtol * magnitude.max(initial=0))
+    # Candidate pairs are in the same or adjacent cells of a grid with the largest
+    # tolerance as spacing, which, unlike sorting on the real part, stays linear
+    # for roots sharing a real part
+    if tol > 0:
+        cells = np.floor(x.real / tol) + 1j * np.floor(x.imag / tol)
+    else:
+        cells = x
+    # Complex values sort lexicographically on the real and imaginary parts
+    order = np.argsort(cells, kind='stable')
+    cells = cells[order]
+    unique, start = np.unique(cells, return_index=True)
+    stop = np.append(start[1:], n)
+    # Later roots in the same cell, and all roots in half of the adjacent cells
+    lower = [np.arange(1, n + 1)]
+    upper = [stop[np.searchsorted(unique, cells)]]
+    if tol > 0:
+        for offset in (1j, 1 - 1j, 1, 1 + 1j):
+            neighbours = cells + offset
+            cell = np.minimum(np.searchsorted(unique, neighbours), unique.size - 1)
+            found = unique[cell] == neighbours
+            lower.append(np.where(found, start[cell], 0))
+            upper.append(np.where(found, stop[cell], 0))
+    first = np.tile(np.arange(n), len(lower))
+    lower = np.concatenate(lower)
+    counts = np.concatenate(upper) - lower
+    first = np.repeat(first, counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    i = order[first]
+    j = order[np.repeat(lower, counts) + offsets]
+    close = np.abs(x[i] - x[j]) <= np.maximum(
+        atol, rtol * np.maximum(magnitude[i], magnitude[j])
+    )
+    i = i[close]
+    j = j[close]
+    # Label each group by its first pole/zero, propagating the smallest index
+    labels = np.arange(n)
+    while True:
+        smallest = np.minimum(labels[i], labels[j])
+        previous = labels.copy()
+        np.minimum.at(labels, i, smallest)
+        np.minimum.at(labels, j, smallest)
+        labels = labels[labels]
+        if np.array_equal(labels, previous):
+            break
+    groups, inverse, multiplicities = np.unique(
+        labels, return_inverse=True, return_counts=True
+    )
+    positions = (
+        np.bincount(inverse, x.real, groups.size)
+        + 1j * np.bincount(inverse, x.imag, groups.size)
+    ) / multiplicities
+    # Exact for groups of identical values
+    positions = np.where(multiplicities == 1, x[groups], positions)
+    return positions, multiplicities
@@ -0,0 +1,345 @@
+"""
+Batch rendering of frequency responses and pole-zero plots to image files.
+
+Each plot is described by a spec, a dict with the keys
+
+name : str, optional
+    File name, without extension, of the image in the output directory. It must
+    be unique and must not contain path separators. Default: the index of the
+    spec.
+plot : {'freqz', 'zplane'}, default: 'freqz'
+    Function to plot with.
+num, den, zeros, poles, gain, sos : optional
+    The filter, as for :func:`~mplsignal.freq_plots.freqz`. Complex numbers are
+    given as strings, e.g., ``"0.5+0.5j"``. For 'zplane', *num* and *den*, and
+    *sos* are converted to zeros and poles.
+figsize : (float, float), optional
+    Figure size in inches. Default: :rc:`figure.figsize`.
+dpi : float, optional
+    Resolution of the image.
+
+All other keys are passed to the plot function, e.g., *style* and *w*.
+
+The specs are rendered in a pool of processes, where each process reuses a single
+figure and does not use pyplot. The ``mplsignal-render`` command renders specs
+from a file with one JSON object per line::
+
+    mplsignal-render filters.jsonl -o images -j 8
+"""
+
+# Copyright (c) Oscar Gustafsson.
+# Distributed under the terms of the Modified BSD License.
+
+__all__ = [
+    "RenderSummary",
+    "load_specs",
+    "main",
+    "render_batch",
+    "render_spec",
+]
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import matplotlib as mpl
+import numpy as np
+from matplotlib.figure import Figure
+from mplsignal import _roots
+from mplsignal.freq_plots import freqz
+from mplsignal.plane_plots import zplane
+
+# Number of Axes to create for each style of freqz
+_FREQZ_AXES = {
+    'stacked': 2,
+    'twin': 1,
+    'magnitude': 1,
+    'phase': 1,
+    'group_delay': 1,
+    'tristacked': 3,
+}
+
+_ARRAY_KEYS = ('num', 'den', 'zeros', 'poles', 'gain', 'sos', 'w')
+
+# Figure reused by all specs rendered in a process
+_figure = None
+
+
+class RenderSummary:
+    """
+    Result of :func:`render_batch`.
+
+    Attributes
+    ----------
+    rendered : list of :class:`pathlib.Path`
+        Paths of the written images.
+    failed : list of (str, str)
+        Name and error message of each spec that could not be rendered.
+    elapsed : float
+        Wall-clock time in seconds.
+    """
+
+    def __init__(self, rendered, failed, elapsed):
+        self.rendered = rendered
+        self.failed = failed
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(rendered={len(self.rendered)}, "
+            f"failed={len(self.failed)}, elapsed={self.elapsed:.3g})"
+        )
+
+    def __str__(self):
+        total = len(self.rendered) + len(self.failed)
+        lines = [
+            f"Rendered {len(self.rendered)} of {total} figures in "
+            f"{self.elapsed:.2f} s ({self.throughput:.1f} figures/s)."
+        ]
+        if self.failed:
+            lines.append(f"{len(self.failed)} failed:")
+            lines.extend(f"  {name}: {error}" for name, error in self.failed)
+        return "\n".join(lines)
+
+    @property
+    def throughput(self):
+        """Number of rendered figures per second."""
+        return len(self.rendered) / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def render_spec(spec, fig=None):
+    """
+    Render a spec into a figure.
+
+    Parameters
+    ----------
+    spec : dict
+        The spec, see :mod:`mplsignal.render`.
+    fig : :class:`~matplotlib.figure.Figure`, optional
+        Figure to render into. It is cleared first. If None, a new figure is
+        created.
+
+    Returns
+    -------
+    :class:`~matplotlib.figure.Figure`
+    """
+    if fig is None:
+        fig = Figure(layout='constrained')
+    else:
+        fig.clear()
+    kwargs = {
+        key: _to_array(value) if key in _ARRAY_KEYS else value
+        for key, value in spec.items()
+    }
+    kwargs.pop('name', None)
+    kwargs.pop('dpi', None)
+    plot = kwargs.pop('plot', 'freqz')
+    fig.set_size_inches(kwargs.pop('figsize', mpl.rcParams['figure.figsize']))
+    if plot == 'freqz':
+        n_axes = _FREQZ_AXES.get(kwargs.get('style', 'stacked'), 1)
+        ax = fig.subplots(n_axes, 1, squeeze=False)[:, 0]
+        freqz(ax=list(ax), **kwargs)
+    elif plot == 'zplane':
+        num = kwargs.pop('num', None)
+        den = kwargs.pop('den', None)
+        sos = kwargs.pop('sos', None)
+        kwargs.pop('gain', None)
+        if sos is not None:
+            sos = np.atleast_2d(sos)
+            kwargs['zeros'] = np.concatenate([_roots.roots(b) for b in sos[:, :3]])
+            kwargs['poles'] = np.concatenate([_roots.roots(a) for a in sos[:, 3:]])
+        elif num is not None or den is not None:
+            kwargs['zeros'] = _roots.roots(num) if num is not None else None
+            kwargs['poles'] = _roots.roots(den) if den is not None else None
+        zplane(ax=fig.add_subplot(), **kwargs)
+    else:
+        raise ValueError(
+            f"Unknown plot: {plot!r}; supported values are 'freqz' and 'zplane'."
+        )
+    return fig
+
+
+def render_batch(specs, directory, processes=None, format='png', dpi=None):
+    """
+    Render specs to image files using a pool of processes.
+
+    Parameters
+    ----------
+    specs : iterable of dict
+        The specs, see :mod:`mplsignal.render`.
+    directory : path-like
+        Directory to write the images to. It is created if it does not exist.
+    processes : int, optional
+        Number of processes. If 1, the specs are rendered in the calling process.
+        Default: the number of CPUs.
+    format : str, default: 'png'
+        Image format and file extension.
+    dpi : float, optional
+        Resolution of images whose spec does not set *dpi*. Default:
+        :rc:`savefig.dpi`.
+
+    Returns
+    -------
+    :class:`RenderSummary`
+    """
+    if processes is not None and processes < 1:
+        raise ValueError(f"'processes' must be at least 1, got {processes!r}.")
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    jobs = []
+    invalid = []
+    names = set()
+    for index, spec in enumerate(specs):
+        name = str(spec.get('name', f"{index:05d}"))
+        error = _check_name(name, names)
+        if error is not None:
+            invalid.append((name, error))
+            continue
+        names.add(name)
+        path = directory / f"{name}.{format}"
+        jobs.append((name, spec, path, spec.get('dpi', dpi)))
+    if processes is None:
+        processes = os.cpu_count() or 1
+    start = time.perf_counter()
+    if processes == 1 or len(jobs) <= 1:
+        results = [_render_job(job) for job in jobs]
+    else:
+        chunksize = max(1, len(jobs) // (4 * processes))
+        with ProcessPoolExecutor(processes) as executor:
+            results = list(executor.map(_render_job, jobs, chunksize=chunksize))
+    elapsed = time.perf_counter() - start
+    rendered = [path for _, path, error in results if error is None]
+    failed = invalid + [
+        (name, error) for name, _, error in results if error is not None
+    ]
+    return RenderSummary(rendered, failed, elapsed)
+
+
+def load_specs(file):
+    """
+    Read specs from a file with one JSON object per line.
+
+    Empty lines and lines starting with '#' are ignored.
+
+    Parameters
+    ----------
+    file : path-like or file-like
+        The file, or '-' for standard input.
+
+    Returns
+    -------
+    list of dict
+    """
+    if file == '-':
+        return _parse_specs(sys.stdin)
+    if hasattr(file, 'read'):
+        return _parse_specs(file)
+    with open(file, encoding='utf-8') as f:
+        return _parse_specs(f)
+
+
+def main(argv=None):
+    """
+    Entry point of the ``mplsignal-render`` command.
+
+    Parameters
+    ----------
+    argv : list of str, optional
+        Command-line arguments. Default: ``sys.argv[1:]``.
+
+    Returns
+    -------
+    int
+        Exit status, 1 if any spec failed.
+    """
+    parser = argparse.ArgumentParser(
+        prog='mplsignal-render',
+        description="Render frequency responses and pole-zero plots to images.",
+    )
+    parser.add_argument(
+        'specs',
+        help="file with one JSON filter spec per line, or '-' for standard input",
+    )
+    parser.add_argument(
+        '-o', '--output', default='.', help="directory to write the images to"
+    )
+    parser.add_argument(
+        '-j',
+        '--processes',
+        type=int,
+        default=None,
+        help="number of processes (default: number of CPUs)",
+    )
+    parser.add_argument('--format', default='png', help="image format (default: png)")
+    parser.add_argument('--dpi', type=float, default=None, help="image resolution")
+    args = parser.parse_args(argv)
+    if args.processes is not None and args.processes < 1:
+        parser.error(
+            f"argument -j/--processes: must be at least 1, got {args.processes}"
+        )
+    try:
+        specs = load_specs(args.specs)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    summary = render_batch(
+        specs, args.output, processes=args.processes, format=args.format, dpi=args.dpi
+    )
+    print(summary)
+    return 1 if summary.failed else 0
+
+
+def _parse_specs(lines):
+    """Parse JSON lines into specs."""
+    specs = []
+    for lineno, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        try:
+            spec = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Line {lineno}: invalid JSON: {e}") from e
+        if not isinstance(spec, dict):
+            raise ValueError(f"Line {lineno}: spec must be a JSON object.")
+        specs.append(spec)
+    return specs
+
+
+def _to_array(value):
+    """Convert a JSON value to an array, parsing complex numbers from strings."""
+    if isinstance(value, str):
+        return complex(value.replace(' ', ''))
+    if isinstance(value, list):
+        return np.asarray([_to_array(item) for item in value])
+    return value
+
+
+def _check_name(name, names):
+    """Return an error if *name* is not a unique file name, without directories."""
+    if name in ('', '.', '..') or any(sep in name for sep in ('/', '\\', os.sep)):
+        return f"ValueError: Invalid name {name!r}; names must be file names."
+    if name in names:
+        return f"ValueError: Duplicate name {name!r}."
+    return None
+
+
+def _render_job(job):
+    """Render a spec to a file, returning the name, path, and any error."""
+    global _figure
+    name, spec, path, dpi = job
+    if _figure is None:
+        _figure = Figure(layout='constrained')
+    try:
+        render_spec(spec, _figure)
+        _figure.savefig(path, dpi=dpi)
+    except Exception as e:  # Report the failure and continue with the next spec
+        return name, None, f"{type(e).__name__}: {e}"
+    return name, path, None
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -11,7 +11,7 @@ module is aimed to be used as such a callback. The focus is to make a plot that
 used to see the results clearly and quickly. For publication quality plots, the
 functions in :mod:`~mplsignal.freq_plots` are generally preferred.
 """
-from .freq_plots import _plot_h
+from .freq_plots import FrequencyResponse, _plot_h
 
 
 def freqz(w, h):
@@ -42,7 +42,7 @@ def freqz(w, h):
     ...
     ... signal.freqz([1, 1, 1, 1], plot=scipyplot.freqz)
     """
-    fig = _plot_h(w, h)
+    fig = _plot_h(FrequencyResponse(w, h))
     fig.set_layout_engine("constrained")
 
 
@@ -75,7 +75,7 @@ def freqz_twin(w, h):
     ...
     ... signal.freqz([1, 1, 1, 1], plot=scipyplot.freqz_twin)
     """
-    fig = _plot_h(w, h, style='twin')
+    fig = _plot_h(FrequencyResponse(w, h), style='twin')
     fig.set_layout_engine("constrained")
     fig.legend(ncols=2, loc='upper center')
 
@@ -108,7 +108,7 @@ def freqz_magnitude(w, h):
     ...
     ... signal.freqz([1, 1, 1, 1], plot=scipyplot.freqz_magnitude)
     """
-    fig = _plot_h(w, h, style='magnitude')
+    fig = _plot_h(FrequencyResponse(w, h), style='magnitude')
     fig.set_layout_engine("constrained")
 
 
@@ -140,7 +140,7 @@ def freqz_phase(w, h):
     ...
     ... signal.freqz([1, 1, 1, 1], plot=scipyplot.freqz_phase)
     """
-    fig = _plot_h(w, h, style='phase')
+    fig = _plot_h(FrequencyResponse(w, h), style='phase')
     fig.set_layout_engine("constrained")
 
 
@@ -173,5 +173,5 @@ def freqz_tristacked(w, h):
     ...
     ... signal.freqz([1, 1, 1, 1], plot=scipyplot.freqz_tristacked)
     """
-    fig = _plot_h(w, h, style='tristacked')
+    fig = _plot_h(FrequencyResponse(w, h), style='tristacked')
     fig.set_layout_engine("constrained")
@@ -0,0 +1,336 @@
+"""
+Discrete-time systems with cached conversions between representations.
+"""
+
+# Copyright (c) Oscar Gustafsson.
+# Distributed under the terms of the Modified BSD License.
+
+__all__ = [
+    "DiscreteSystem",
+]
+
+import functools
+
+import numpy as np
+from mplsignal import _api, _roots, _utils
+from mplsignal._cache import ResponseCache
+
+
+class DiscreteSystem:
+    """
+    Discrete-time system with cached conversions between representations.
+
+    Give the system in one representation: as a transfer function, *num* and
+    *den*, as zeros, poles, and gain, as second-order sections, *sos*, or as a
+    state-space model, *ss*. Other representations, e.g., the roots for a pole-zero
+    plot, are computed when first accessed and then reused. The system can be
+    passed to :func:`~mplsignal.freq_plots.freqz` and
+    :func:`~mplsignal.plane_plots.zplane` in place of the filter, so that the
+    conversions happen once when the same filter is plotted repeatedly.
+
+    Parameters
+    ----------
+    num, den : array-like, optional
+        Numerator and denominator of transfer function, in decreasing powers of
+        :math:`z`, or increasing powers of :math:`z^{-1}`, as for
+        :func:`~mplsignal.freq_plots.freqz`.
+    zeros, poles : array-like, optional
+        Zeros and poles of transfer function.
+    gain : float, default: 1.0
+        Gain of pole-zero-based transfer function.
+    sos : array-like, optional
+        Second-order sections of shape ``(n_sections, 6)``, where each row is
+        ``[b0, b1, b2, a0, a1, a2]``.
+    ss : tuple of array-like, optional
+        State-space matrices ``(A, B, C, D)``.
+    root_method : {'auto', 'eig', 'linear_phase', 'aberth'}, default: 'auto'
+        Method to compute the roots of transfer functions, see
+        :func:`~mplsignal.plane_plots.zplane_tf`.
+    cache : :class:`~mplsignal.freq_plots.ResponseCache`, optional
+        Cache of evaluated frequency responses, keyed on the frequency grid. It is
+        used by :func:`~mplsignal.freq_plots.freqz` unless another cache is
+        given. Default: a new cache for the system.
+
+    Examples
+    --------
+    >>> from mplsignal import DiscreteSystem, freqz, zplane
+    >>> system = DiscreteSystem(num=[1, 2, 1], den=[1, -1.2, 0.5])
+    >>> fig = freqz(system)
+    >>> fig = freqz(system, style='group_delay')
+    >>> ax = zplane(system)
+    >>> system.cache.hits, system.cache.misses
+    (1, 2)
+    """
+
+    def __init__(
+        self,
+        num=None,
+        den=None,
+        zeros=None,
+        poles=None,
+        gain=1.0,
+        sos=None,
+        ss=None,
+        root_method='auto',
+        cache=None,
+    ):
+        _api.check_in_iterable(
+            ('auto', 'eig', 'linear_phase', 'aberth'), root_method=root_method
+        )
+        given = [
+            name
+            for name, value in (
+                ('tf', num if num is not None else den),
+                ('zpk', zeros if zeros is not None else poles),
+                ('sos', sos),
+                ('ss', ss),
+            )
+            if value is not None
+        ]
+        if len(given) != 1:
+            raise ValueError(
+                "Exactly one of 'num' and 'den', 'zeros' and 'poles', 'sos', or 'ss' "
+                "must be provided."
+            )
+        self.representation = given[0]
+        self.root_method = root_method
+        self.cache = ResponseCache() if cache is None else cache
+        self._conversions = {}
+        if self.representation == 'tf':
+            if num is None or den is None:
+                raise ValueError("'num' and 'den' must be provided together.")
+            self._conversions['tf'] = _frozen(
+                _check_1d(num, 'num'), _check_1d(den, 'den')
+            )
+        elif self.representation == 'zpk':
+            if zeros is None or poles is None:
+                raise ValueError("'zeros' and 'poles' must be provided together.")
+            self._conversions['zpk'] = _frozen(
+                _check_1d(zeros, 'zeros'), _check_1d(poles, 'poles'), np.asarray(gain)
+            )
+        elif self.representation == 'sos':
+            sos = np.atleast_2d(np.asarray(sos))
+            if sos.ndim != 2 or sos.shape[1] != 6:
+                raise ValueError(
+                    f"'sos' must have shape (n_sections, 6), got {sos.shape!r}."
+                )
+            self._conversions['sos'] = _frozen(sos)[0]
+        else:
+            if len(ss) != 4:
+                raise ValueError("'ss' must be a tuple (A, B, C, D).")
+            self._conversions['ss'] = _frozen(*_utils._check_ss(*ss))
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(representation={self.representation!r}, "
+            f"computed={sorted(self._conversions)})"
+        )
+
+    @property
+    def tf(self):
+        """Numerator and denominator of the transfer function."""
+        return self._get('tf', self._compute_tf)
+
+    @property
+    def zpk(self):
+        """Zeros, poles, and gain of the transfer function."""
+        return self._get('zpk', self._compute_zpk)
+
+    @property
+    def sos(self):
+        """
+        Second-order sections.
+
+        When converted, complex-conjugate poles and zeros are paired into sections
+        and the poles closest to the unit circle are placed in the last sections,
+        each with the zeros closest to them.
+        """
+        return self._get('sos', lambda: _frozen(_zpk_to_sos(*self.zpk))[0])
+
+    @property
+    def ss(self):
+        """State-space matrices, in controllable canonical form when converted."""
+        return self._get('ss', lambda: _frozen(*_tf_to_ss(*self.tf)))
+
+    def _get(self, name, compute):
+        """Return a cached representation, computing it if missing."""
+        try:
+            return self._conversions[name]
+        except KeyError:
+            pass
+        value = self._conversions[name] = compute()
+        return value
+
+    def _compute_tf(self):
+        if self.representation == 'zpk':
+            return _frozen(*_zpk_to_tf(*self.zpk))
+        if self.representation == 'sos':
+            sos = self.sos
+            return _frozen(
+                functools.reduce(np.convolve, sos[:, :3]),
+                functools.reduce(np.convolve, sos[:, 3:]),
+            )
+        return _frozen(*_ss_to_tf(*self.ss))
+
+    def _compute_zpk(self):
+        if self.representation == 'sos':
+            sections = [
+                _tf_to_zpk(section[:3], section[3:], self.root_method)
+                for section in self.sos
+            ]
+            zeros, poles, gains = zip(*sections)
+            return _frozen(np.concatenate(zeros), np.concatenate(poles), np.prod(gains))
+        zeros, poles, gain = _tf_to_zpk(*self.tf, self.root_method)
+        if self.representation == 'ss':
+            # The eigenvalues are more accurate than the roots of the characteristic
+            # polynomial
+            poles = np.linalg.eigvals(self.ss[0])
+        return _frozen(zeros, poles, gain)
+
+    def _freqz_arguments(self):
+        """Return the filter arguments of :func:`freqz` in the given representation."""
+        arguments = dict(
+            num=None, den=None, zeros=None, poles=None, gain=1.0, sos=None, ss=None
+        )
+        if self.representation == 'tf':
+            arguments['num'], arguments['den'] = self.tf
+        elif self.representation == 'zpk':
+            arguments['zeros'], arguments['poles'], arguments['gain'] = self.zpk
+        elif self.representation == 'sos':
+            arguments['sos'] = self.sos
+        else:
+            arguments['ss'] = self.ss
+        return arguments
+
+
+def _check_1d(value, name):
+    value = np.atleast_1d(np.asarray(value))
+    if value.ndim != 1:
+        raise ValueError(f"'{name}' must be 1-D.")
+    return value
+
+
+def _frozen(*arrays):
+    """Return read-only copies of *arrays*, so that cached conversions stay valid."""
+    frozen = []
+    for array in arrays:
+        array = np.array(array)
+        array.flags.writeable = False
+        frozen.append(array)
+    return tuple(frozen)
+
+
+def _tf_to_zpk(num, den, method):
+    """
+    Return the zeros, poles, and gain of a transfer function in powers of
+    :math:`z^{-1}`, including those at the origin.
+    """
+    length = max(num.size, den.size)
+    # Equal lengths turn differences in the lengths into roots at the origin
+    num = np.pad(num, (0, length - num.size))
+    den = np.pad(den, (0, length - den.size))
+    nonzero_num = np.flatnonzero(num)
+    nonzero_den = np.flatnonzero(den)
+    if nonzero_den.size == 0:
+        raise ValueError("'den' must have a nonzero coefficient.")
+    if nonzero_num.size == 0:
+        gain = 0.0
+    else:
+        gain = num[nonzero_num[0]] / den[nonzero_den[0]]
+    return _roots.roots(num, method), _roots.roots(den, method), gain
+
+
+def _zpk_to_tf(zeros, poles, gain):
+    """Return the transfer function in powers of :math:`z^{-1}`."""
+    length = max(zeros.size, poles.size) + 1
+    num = gain * np.atleast_1d(np.poly(zeros))
+    den = np.atleast_1d(np.poly(poles))
+    # Roots in excess of the other are delays or advances in powers of z^-1
+    return (
+        np.pad(num, (length - num.size, 0)),
+        np.pad(den, (length - den.size, 0)),
+    )
+
+
+def _ss_to_tf(A, B, C, D):
+    """Return the transfer function of a single-input, single-output system."""
+    if B.shape[1] != 1 or C.shape[0] != 1:
+        raise ValueError(
+            "Only state-space models with a single input and output can be "
+            "converted to a transfer function."
+        )
+    den = np.atleast_1d(np.poly(A))
+    # det(zI - A + BC) = det(zI - A)(1 + C(zI - A)^-1 B)
+    num = np.atleast_1d(np.poly(A - B @ C)) + (D[0, 0] - 1) * den
+    return num, den
+
+
+def _tf_to_ss(num, den):
+    """Return the controllable canonical form of a transfer function."""
+    length = max(num.size, den.size)
+    num = np.pad(num, (0, length - num.size))
+    den = np.pad(den, (0, length - den.size))
+    if den[0] == 0:
+        raise ValueError("The leading coefficient of 'den' must be nonzero.")
+    num = num / den[0]
+    den = den / den[0]
+    n = length - 1
+    A = np.eye(n, k=-1, dtype=np.result_type(den, float))
+    A[:1] = -den[1:]
+    B = np.eye(n, 1)
+    C = np.atleast_2d(num[1:] - num[0] * den[1:])
+    D = np.atleast_2d(num[0])
+    return A, B, C, D
+
+
+def _zpk_to_sos(zeros, poles, gain):
+    """
+    Return second-order sections of a real filter, pairing complex-conjugate roots.
+    """
+    # Equal numbers of zeros and poles, which is even, with the excess at the origin
+    count = max(zeros.size, poles.size)
+    count += count % 2
+    zeros = np.concatenate((zeros, np.zeros(count - zeros.size)))
+    poles = np.concatenate((poles, np.zeros(count - poles.size)))
+    pole_pairs = _conjugate_pairs(poles, 'poles')
+    zero_pairs = _conjugate_pairs(zeros, 'zeros')
+    # Sections with poles closest to the unit circle last
+    pole_pairs.sort(key=lambda pair: -abs(1 - np.abs(pair).max()))
+    sections = []
+    for pair in reversed(pole_pairs):
+        # Zeros closest to the poles of the section
+        distances = [np.abs(zero_pair - pair[0]).min() for zero_pair in zero_pairs]
+        zero_pair = zero_pairs.pop(int(np.argmin(distances)))
+        sections.append(np.concatenate((np.poly(zero_pair).real, np.poly(pair).real)))
+    sos = np.array(sections[::-1]).reshape(-1, 6)
+    if sos.size == 0:
+        sos = np.array([[1.0, 0, 0, 1, 0, 0]])
+    sos[0, :3] *= np.real(gain)
+    return sos
+
+
+def _conjugate_pairs(roots, name):
+    """Return *roots* of a real polynomial as pairs of conjugates or real roots."""
+    roots = np.asarray(roots, dtype=complex)
+    tol = 1e3 * np.finfo(float).eps * np.maximum(np.abs(roots), 1)
+    real = np.abs(roots.imag) <= tol
+    upper = roots[~real & (roots.imag > 0)]
+    lower = roots[~real & (roots.imag < 0)]
+    if upper.size != lower.size:
+        raise ValueError(
+            f"The {name} must be real or come in complex-conjugate pairs to be "
+            "converted to second-order sections."
+        )
+    upper = upper[np.lexsort((upper.imag, upper.real))]
+    lower = lower[np.lexsort((-lower.imag, lower.real))]
+    if not np.allclose(upper, lower.conj(), rtol=1e-6, atol=1e-12):
+        raise ValueError(
+            f"The {name} must be real or come in complex-conjugate pairs to be "
+            "converted to second-order sections."
+        )
+    pairs = [np.array([root, root.conjugate()]) for root in upper]
+    real = np.sort(roots[real].real)
+    pairs.extend(
+        np.array(real[i : i + 2], dtype=complex) for i in range(0, real.size, 2)
+    )
+    return pairs
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+
+# Copyright (c) Oscar Gustafsson.
+# Distributed under the terms of the Modified BSD License.
+
+
+import numpy as np
+import pytest
+from matplotlib.testing.decorators import check_figures_equal
+from mplsignal import ResponseCache, freqz
+from mplsignal._cache import response_key
+
+
+def test_response_cache_lru():
+    cache = ResponseCache(maxsize=2)
+    cache.get('a', 'h', lambda: np.zeros(4))
+    cache.get('b', 'h', lambda: np.zeros(4))
+    cache.get('a', 'h', lambda: np.zeros(4))
+    cache.get('c', 'h', lambda: np.zeros(4))
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (1, 3)
+    # 'b' was least recently used
+    cache.get('a', 'h', lambda: np.zeros(4))
+    cache.get('b', 'h', lambda: np.zeros(4))
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_response_cache_maxbytes():
+    cache = ResponseCache(maxbytes=100)
+    value = cache.get('a', 'h', lambda: np.zeros(10))
+    assert not value.flags.writeable
+    assert cache.nbytes == 80
+    cache.get('b', 'h', lambda: np.zeros(5))
+    assert len(cache) == 1
+    assert cache.nbytes == 40
+    # Too large to be cached
+    value = cache.get('c', 'h', lambda: np.zeros(20))
+    assert value.flags.writeable
+    assert len(cache) == 1
+    cache.clear()
+    assert (len(cache), cache.nbytes, cache.hits, cache.misses) == (0, 0, 0, 0)
+
+
+def test_response_cache_errors():
+    with pytest.raises(ValueError, match="'maxsize' must be non-negative"):
+        ResponseCache(maxsize=-1)
+    with pytest.raises(ValueError, match="'maxbytes' must be non-negative"):
+        ResponseCache(maxbytes=-1)
+
+
+def test_response_key():
+    grid = (512, False, False, 'linear')
+    key = response_key('tf', ([1, 2, 1], [1]), grid)
+    assert key == response_key('tf', (np.array([1, 2, 1]), np.array([1])), grid)
+    assert key != response_key('tf', ([1, 2, 1], [1.0]), grid)
+    assert key != response_key('tf', ([1, 2, 1], [1]), (512, True, False, 'linear'))
+    assert key != response_key('zpk', ([1, 2, 1], [1]), grid)
+
+
+def test_freqz_cache_styles():
+    cache = ResponseCache()
+    num = [1, 2, 1]
+    den = [1, -1.2, 0.5]
+    freqz(num, den, style='stacked', cache=cache)
+    freqz(num, den, style='tristacked', cache=cache)
+    freqz(num, den, style='magnitude', cache=cache)
+    freqz(num, den, style='group_delay', cache=cache)
+    # Response, power, and group delay are evaluated once each, as magnitude plots
+    # use the power response
+    assert (cache.hits, cache.misses) == (3, 3)
+    freqz(num, den, style='magnitude', cache=cache)
+    assert (cache.hits, cache.misses) == (4, 3)
+    freqz(num, den, style='magnitude', whole=True, cache=cache)
+    assert (cache.hits, cache.misses) == (4, 4)
+
+
+@check_figures_equal(extensions=["png"])
+def test_freqz_cache(fig_test, fig_ref):
+    sos = [[1, 2, 1, 1, -1.2, 0.5], [1, -0.5, 0.25, 1, 0.3, 0.8]]
+    cache = ResponseCache()
+    freqz(sos=sos, ax=fig_ref.subplots(3, 1), style='tristacked')
+    freqz(sos=sos, ax=fig_test.subplots(3, 1), style='tristacked', cache=cache)
+    freqz(sos=sos, ax=fig_test.axes, style='tristacked', cache=cache)
+    freqz(sos=sos, ax=fig_ref.axes, style='tristacked')
+    assert cache.hits == 3
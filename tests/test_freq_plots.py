@@ -4,11 +4,29 @@
 # Distributed under the terms of the Modified BSD License.
 
 
+import warnings
+
 import matplotlib.pyplot as plt
 import numpy as np
 import pytest
 from matplotlib.testing.decorators import check_figures_equal, image_comparison
-from mplsignal import freqz, freqz_fir, freqz_tf, freqz_zpk
+from mplsignal import (
+    FrequencyResponse,
+    ResponseCache,
+    _utils,
+    freqs,
+    freqs_tf,
+    freqs_zpk,
+    freqz,
+    freqz_cic,
+    freqz_comb,
+    freqz_fir,
+    freqz_moving_average,
+    freqz_sos,
+    freqz_ss,
+    freqz_tf,
+    freqz_zpk,
+)
 
 
 def test_freqz():
@@ -73,6 +91,41 @@ def test_freqz_tristacked():
             ValueError,
             "'foo' is not a valid value",
         ),
+        (
+            {'num': [1, 1], 'sos': [[1, 0, 0, 1, 0, 0]]},
+            ValueError,
+            "'sos' cannot be combined",
+        ),
+        (
+            {'num': [1, 1], 'den': [1], 'w': [0.1, 0.2], 'wrange': (0.1, 0.2)},
+            ValueError,
+            "'w' must be an integer",
+        ),
+        (
+            {'num': [1, 1], 'den': [1], 'w': [0.1, 0.2], 'adaptive': True},
+            ValueError,
+            "'w' must be an integer",
+        ),
+        (
+            {'num': [1, 1], 'den': [1], 'adaptive': True, 'max_memory': 2**20},
+            ValueError,
+            "'max_memory' cannot be combined",
+        ),
+        (
+            {'num': [1, 1], 'den': [1], 'workers': 0},
+            ValueError,
+            "'workers' must be a positive integer",
+        ),
+        (
+            {'num': [1, 1], 'response': FrequencyResponse([0, 1], [1, 1])},
+            ValueError,
+            "'response' cannot be combined",
+        ),
+        (
+            {'num': [1, 1], 'poles': [0.5]},
+            ValueError,
+            "'num' and 'den', or 'zeros' and 'poles'",
+        ),
     ],
 )
 def test_freqz_errors(kwargs, error, msg):
@@ -342,3 +395,454 @@ def test_tristacked_freqz_with_current_figure():
     fig4 = freqz(num=num, den=den, style="tristacked")
     assert fig3 is not fig4
     assert len(fig2.axes) == 3
+
+
+@check_figures_equal(extensions=["png"])
+def test_freqz_batched(fig_test, fig_ref):
+    num = [[1, 2, 1], [1, 0, -0.5], [1, -1, 1]]
+    den = [1, -1.2, 0.5]
+    ax_test = fig_test.subplots()
+    freqz(num=num, den=den, style='magnitude', ax=ax_test)
+
+    ax_ref = fig_ref.subplots()
+    for n in num:
+        freqz(num=n, den=den, style='magnitude', ax=ax_ref)
+
+
+@check_figures_equal(extensions=["png"])
+def test_freqz_sos(fig_test, fig_ref):
+    sos = [[1, 2, 1, 1, -1.2, 0.5], [1, -0.5, 0.25, 1, 0.3, 0.8]]
+    num = np.convolve(sos[0][:3], sos[1][:3])
+    den = np.convolve(sos[0][3:], sos[1][3:])
+    ax_ref = fig_ref.subplots(3, 1)
+    freqz(num=num, den=den, ax=ax_ref, style='tristacked')
+
+    ax_test = fig_test.subplots(3, 1)
+    freqz_sos(sos, ax=ax_test, style='tristacked')
+
+
+@check_figures_equal(extensions=["png"])
+def test_freqz_wrange(fig_test, fig_ref):
+    num = np.hanning(200)
+    w = np.linspace(0.2, 0.4, 300)
+    ax_ref = fig_ref.subplots(3, 1)
+    freqz(num=num, den=[1], ax=ax_ref, w=w, style='tristacked')
+
+    ax_test = fig_test.subplots(3, 1)
+    freqz(num=num, den=[1], ax=ax_test, w=300, wrange=(0.2, 0.4), style='tristacked')
+
+
+def test_freqz_adaptive():
+    fig, ax = plt.subplots(3, 1)
+    zeros = [-1, -1]
+    poles = 0.999 * np.exp([0.7j, -0.7j])
+    freqz(zeros=zeros, poles=poles, ax=ax, style='tristacked', adaptive=True)
+    w = ax[0].lines[0].get_xdata()
+    assert 33 < len(w) <= 512
+    assert w[0] == 0
+    assert w[-1] == np.pi
+    np.testing.assert_array_equal(ax[2].lines[0].get_xdata(), w)
+
+
+def test_freqz_adaptive_log():
+    fig, ax = plt.subplots()
+    poles = 0.999 * np.exp([0.7j, -0.7j])
+    freqz(
+        [1],
+        np.poly(poles).real,
+        ax=ax,
+        style='magnitude',
+        adaptive=True,
+        frequency_scale='log',
+    )
+    w = ax.lines[0].get_xdata()
+    np.testing.assert_allclose(w[[0, -1]], [1e-5, np.pi])
+    assert np.all(np.diff(w) > 0)
+    # A linear grid has no points in the lowest decades
+    assert np.count_nonzero(w < 1e-2) >= 10
+
+
+def test_freqz_single_precision():
+    fig, ax = plt.subplots(3, 1)
+    num = np.hanning(64)
+    freqz(num=num, den=[1], ax=ax, style='tristacked', precision='single')
+    fig_ref, ax_ref = plt.subplots(3, 1)
+    freqz(num=num, den=[1], ax=ax_ref, style='tristacked')
+    assert ax[0].lines[0].get_ydata().dtype == np.float32
+    for line, line_ref in zip(
+        [a.lines[0] for a in ax], [a.lines[0] for a in ax_ref], strict=True
+    ):
+        np.testing.assert_allclose(
+            line.get_ydata(), line_ref.get_ydata(), rtol=1e-3, atol=1e-3
+        )
+
+
+@pytest.mark.parametrize('style', ['stacked', 'tristacked', 'phase', 'group_delay'])
+def test_freqz_max_memory(style):
+    num = np.hanning(32)
+    den = [1, -0.9]
+    fig_ref, ax_ref = plt.subplots(3, 1)
+    freqz(num=num, den=den, ax=ax_ref, w=2000, style=style)
+    fig, ax = plt.subplots(3, 1)
+    freqz(num=num, den=den, ax=ax, w=2000, style=style, max_memory=2**14)
+    for a, a_ref in zip(ax, ax_ref, strict=True):
+        for line, line_ref in zip(a.lines, a_ref.lines, strict=True):
+            np.testing.assert_allclose(line.get_xdata(), line_ref.get_xdata())
+            np.testing.assert_allclose(
+                line.get_ydata(), line_ref.get_ydata(), rtol=1e-6, atol=1e-6
+            )
+
+
+def test_freqz_max_memory_reduced():
+    fig, ax = plt.subplots(2, 1)
+    # Delay of 50 samples, for which the phase wraps many times
+    num = np.zeros(51)
+    num[-1] = 1
+    freqz(num=num, den=[1], ax=ax, w=100000, max_memory=2**20)
+    assert len(ax[0].lines[0].get_xdata()) <= 2 * 4096
+    assert ax[0].get_xlim() == (0, np.pi)
+    phase = ax[1].lines[0].get_ydata()
+    # Phase is unwrapped continuously across blocks
+    assert np.abs(np.diff(phase)).max() < 1
+    np.testing.assert_allclose(phase, -50 * ax[1].lines[0].get_xdata(), atol=1e-6)
+
+
+def test_freqz_zpk_high_order(monkeypatch):
+    def freqz_zpk(*args, **kwargs):
+        raise AssertionError("The complex response is not needed.")
+
+    # The complex response over- and underflows, so it must not be evaluated
+    monkeypatch.setattr(_utils, 'freqz_zpk', freqz_zpk)
+    zeros = np.full(2000, -0.5)
+    poles = np.full(2000, 0.5)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        fig, ax = plt.subplots(2, 1)
+        freqz(zeros=zeros, poles=poles, ax=ax)
+        freqz(zeros=zeros, poles=poles, style='magnitude', magnitude_scale='linear')
+    magnitude = ax[0].lines[0].get_ydata()
+    assert np.isfinite(magnitude).all()
+    np.testing.assert_allclose(magnitude[0], 2000 * 20 * np.log10(3))
+    phase = ax[1].lines[0].get_ydata()
+    assert np.isfinite(phase).all()
+    w = ax[1].lines[0].get_xdata()
+    expected = 2000 * (np.angle(np.exp(1j * w) + 0.5) - np.angle(np.exp(1j * w) - 0.5))
+    np.testing.assert_allclose(phase, expected, atol=1e-8)
+
+
+@check_figures_equal(extensions=['png'])
+def test_freqz_workers(fig_test, fig_ref):
+    zeros = [-1, 1j, -1j]
+    poles = [0.9 * np.exp(0.3j), 0.9 * np.exp(-0.3j), 0.5]
+    ax_ref = fig_ref.subplots(3, 1)
+    freqz(zeros=zeros, poles=poles, ax=ax_ref, w=20000, style='tristacked')
+
+    ax_test = fig_test.subplots(3, 1)
+    freqz(zeros=zeros, poles=poles, ax=ax_test, w=20000, style='tristacked', workers=4)
+
+
+def test_frequency_response_lazy():
+    calls = []
+
+    def group_delay(w):
+        calls.append(w.size)
+        return np.ones_like(w)
+
+    w = np.linspace(0, np.pi, 8)
+    h = np.exp(-1j * w) * np.array([[1], [2]])
+    response = FrequencyResponse(w, h, group_delay=group_delay)
+    assert not hasattr(response, '__dict__')
+    np.testing.assert_allclose(response.magnitude_db[1], 20 * np.log10(2))
+    assert response.magnitude_db is response.magnitude_db
+    np.testing.assert_allclose(response.phase_unwrapped[0], -w)
+    assert calls == []
+    np.testing.assert_array_equal(response.group_delay, np.ones_like(w))
+    response.group_delay
+    assert calls == [8]
+    np.testing.assert_allclose(response.scaled_w('norm'), w / (2 * np.pi))
+    assert response.scaled_w('norm') is response.scaled_w('norm')
+    assert "computed=" in repr(response)
+
+
+def test_frequency_response_estimated_group_delay():
+    w = np.linspace(0, np.pi, 50)
+    response = FrequencyResponse(w, np.exp(-3j * w))
+    np.testing.assert_allclose(response.group_delay, 3)
+
+
+def test_frequency_response_without_h():
+    w = np.linspace(0, np.pi, 4)
+    response = FrequencyResponse(w, magnitude_db=np.full(4, 20.0))
+    np.testing.assert_allclose(response.magnitude, 10)
+    with pytest.raises(ValueError, match="Cannot compute the phase"):
+        response.phase_unwrapped
+
+
+def test_freqz_return_response():
+    num = [1, 2, 1]
+    den = [1, -1.2, 0.5]
+    fig, ax = plt.subplots(3, 1)
+    fig, response = freqz(num, den, ax=ax, style='tristacked', return_response=True)
+    assert isinstance(response, FrequencyResponse)
+    gd = response.group_delay
+    np.testing.assert_array_equal(ax[2].lines[0].get_ydata(), gd)
+    fig2, ax2 = plt.subplots(3, 1)
+    freqz(response=response, ax=ax2, style='tristacked')
+    assert response.group_delay is gd
+    for a, a_ref in zip(ax2, ax, strict=True):
+        np.testing.assert_array_equal(
+            a.lines[0].get_ydata(), a_ref.lines[0].get_ydata()
+        )
+
+
+@image_comparison(['freqs_tristacked.png'], style='mpl20')
+def test_freqs_tristacked_image():
+    fig, ax = plt.subplots(3, 1, figsize=(4, 6))
+    freqs_zpk([], [-1, -0.5 + 10j, -0.5 - 10j], 100, ax=ax, style='tristacked')
+    fig.tight_layout()
+
+
+def test_freqs():
+    plt.figure()
+    fig, response = freqs([1, 0], [1, 3, 2], points_per_decade=20, return_response=True)
+    assert len(fig.axes) == 2
+    assert fig.axes[0].get_xscale() == 'log'
+    assert fig.axes[1].get_xlabel() == "Frequency, rad/s"
+    # One decade below and above the poles at -1 and -2
+    assert response.w[0] == 0.1
+    assert response.w[-1] == 100
+    assert response.w.size == 61
+
+
+@check_figures_equal(extensions=['png'])
+def test_freqs_tf_zpk(fig_test, fig_ref):
+    w = np.logspace(-1, 2, 100)
+    freqs_tf([1, 0], [1, 3, 2], w=w, ax=fig_test.subplots(3, 1), style='tristacked')
+    freqs_zpk([0], [-1, -2], w=w, ax=fig_ref.subplots(3, 1), style='tristacked')
+
+
+def test_freqs_units():
+    fig, ax = plt.subplots()
+    freqs([1], [1, 1], wrange=(1, 100), freq_unit='Hz', style='group_delay', ax=ax)
+    np.testing.assert_allclose(ax.get_xlim(), (1 / (2 * np.pi), 100 / (2 * np.pi)))
+    assert ax.get_xlabel() == "Frequency, Hz"
+    assert ax.get_ylabel() == "Group delay, s"
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'error', 'match'),
+    [
+        (
+            {'num': [1], 'den': [1, 1], 'w': [1, 2], 'wrange': (1, 2)},
+            ValueError,
+            "'w' cannot be combined",
+        ),
+        ({'num': [1], 'den': [1, 1], 'freq_unit': 'rad'}, ValueError, "freq_unit"),
+        ({'num': [1], 'poles': [-1]}, ValueError, "must be provided together"),
+        ({'num': [1]}, ValueError, "At least one of 'den' and 'poles'"),
+    ],
+)
+def test_freqs_errors(kwargs, error, match):
+    with pytest.raises(error, match=match):
+        freqs(**kwargs)
+
+
+@check_figures_equal(extensions=['png'], tol=3)
+def test_freqz_decimate(fig_test, fig_ref):
+    num = np.hanning(101)
+    freqz(num, [1], w=2**18, ax=fig_test.subplots(3, 1), style='tristacked')
+    freqz(
+        num,
+        [1],
+        w=2**18,
+        ax=fig_ref.subplots(3, 1),
+        style='tristacked',
+        decimate=False,
+    )
+    lines = [ax.lines[0] for ax in fig_test.axes]
+    assert all(
+        len(line.get_xdata()) < 8 * fig_test.axes[0].bbox.width for line in lines
+    )
+
+
+def test_freqz_fir_linear_phase():
+    num = np.hanning(33)[1:-1]
+    fig, ax = plt.subplots(3, 1)
+    fig, response = freqz_fir(
+        num, ax=ax, style='tristacked', decimate=False, return_response=True
+    )
+    w = ax[1].lines[0].get_xdata()
+    phase = ax[1].lines[0].get_ydata()
+    # The phase is linear apart from jumps of pi in the stopband
+    np.testing.assert_allclose(np.sin(phase + 15 * w), 0, atol=1e-12)
+    np.testing.assert_array_equal(ax[2].lines[0].get_ydata(), 15)
+    np.testing.assert_allclose(
+        response.h, freqz_tf(num, [1], return_response=True)[1].h, atol=1e-13
+    )
+
+
+@check_figures_equal(extensions=['png'])
+def test_freqz_fir_linear_phase_magnitude(fig_test, fig_ref):
+    num = [1, 3, 0, -3, -1]
+    freqz_fir(num, linear_phase=3, style='magnitude', ax=fig_test.subplots())
+    freqz_fir(num, linear_phase=False, style='magnitude', ax=fig_ref.subplots())
+
+
+def test_freqz_linear_phase_requires_fir():
+    with pytest.raises(ValueError, match="'linear_phase' requires an FIR filter"):
+        freqz([1, 1], [1, 0.5], linear_phase=True)
+
+
+@check_figures_equal(extensions=['png'])
+def test_freqz_magnitude_power(fig_test, fig_ref):
+    num = [1, 2, 1]
+    den = [1, -1.2, 0.5]
+    w = np.linspace(0.1, 3, 200) ** 1.5
+    _, response = freqz(
+        num, den, w=w, style='magnitude', ax=fig_test.subplots(), return_response=True
+    )
+    # The complex response is not evaluated
+    assert response._h is None
+    reference = FrequencyResponse(w, _utils.freqz_tf(num, den, w))
+    freqz(response=reference, style='magnitude', ax=fig_ref.subplots())
+
+
+@check_figures_equal(extensions=['png'])
+def test_freqz_ss(fig_test, fig_ref):
+    # Controllable canonical form of the transfer function
+    num = [1, 2, 1]
+    den = [1, -1.2, 0.5]
+    A = [[1.2, -0.5], [1, 0]]
+    B = [1, 0]
+    C = [3.2, 0.5]
+    D = 1
+    freqz_ss(A, B, C, D, ax=fig_test.subplots(3, 1), style='tristacked')
+    freqz_tf(num, den, ax=fig_ref.subplots(3, 1), style='tristacked')
+
+
+def test_freqz_ss_mimo():
+    fig, ax = plt.subplots(2, 1)
+    A = np.diag([0.5, -0.3, 0.9])
+    B = np.ones((3, 2))
+    C = np.ones((2, 3))
+    freqz_ss(A, B, C, np.zeros((2, 2)), ax=ax, w=64)
+    assert len(ax[0].lines) == 4
+    assert len(ax[1].lines) == 4
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'match'),
+    [
+        ({'ss': ([[0.5]], [1], [1], 0), 'num': [1]}, "'ss' cannot be combined"),
+        ({'ss': ([[0.5]], [1], [1])}, r"'ss' must be a tuple \(A, B, C, D\)"),
+    ],
+)
+def test_freqz_ss_errors(kwargs, match):
+    with pytest.raises(ValueError, match=match):
+        freqz(**kwargs)
+
+
+@check_figures_equal(extensions=['png'])
+def test_freqz_fir_sparse(fig_test, fig_ref):
+    # Comb filter, which is not linear-phase due to the second tap
+    num = np.zeros(200)
+    num[[0, 1, 199]] = [1, 0.5, -1]
+    w = np.linspace(0.2, 3, 300) ** 1.2
+    _, response = freqz_fir(
+        num, w=w, ax=fig_test.subplots(3, 1), style='tristacked', return_response=True
+    )
+    np.testing.assert_allclose(response.h, _utils.freqz_tf(num, [1], w), atol=1e-12)
+    freqz(
+        taps=([0, 1, 199], [1, 0.5, -1]),
+        w=w,
+        ax=fig_ref.subplots(3, 1),
+        style='tristacked',
+    )
+
+
+def test_freqz_fir_indices():
+    fig, ax = plt.subplots(2, 1)
+    freqz_fir([[1, -1], [1, 1]], indices=[0, 10**6], ax=ax, w=64)
+    assert len(ax[0].lines) == 2
+    with pytest.raises(ValueError, match="'linear_phase' cannot be combined"):
+        freqz_fir([1, 1], indices=[0, 3], linear_phase=True)
+
+
+@pytest.mark.parametrize(
+    ('kwargs', 'match'),
+    [
+        ({'taps': ([0], [1]), 'num': [1]}, "'taps' cannot be combined"),
+        ({'taps': ([0],)}, r"'taps' must be a tuple \(indices, values\)"),
+    ],
+)
+def test_freqz_taps_errors(kwargs, match):
+    with pytest.raises(ValueError, match=match):
+        freqz(**kwargs)
+
+
+@check_figures_equal(extensions=['png'])
+def test_freqz_cic(fig_test, fig_ref):
+    num = np.ones(1)
+    for _ in range(3):
+        num = np.convolve(num, np.ones(4) / 4)
+    # Exact zeros of the closed form, e.g., at pi/2, are -inf dB
+    w = np.linspace(0.01, 3, 200)
+    freqz_cic(2, 2, 3, w=w, ax=fig_test.subplots(3, 1), style='tristacked')
+    freqz_fir(num, w=w, ax=fig_ref.subplots(3, 1), style='tristacked')
+
+
+@check_figures_equal(extensions=['png'])
+def test_freqz_moving_average(fig_test, fig_ref):
+    freqz_moving_average(5, ax=fig_test.subplots(), style='magnitude', w=100)
+    freqz_cic(5, ax=fig_ref.subplots(), style='magnitude', w=100)
+
+
+@pytest.mark.parametrize(
+    ('delay', 'gain', 'feedback'), [(6, -1, False), (5, 1, False), (4, 0.5, True)]
+)
+def test_freqz_comb(delay, gain, feedback):
+    polynomial = np.zeros(delay + 1)
+    polynomial[0] = 1
+    polynomial[delay] = -gain if feedback else gain
+    num, den = ([1.0], polynomial) if feedback else (polynomial, [1.0])
+    w = np.linspace(0.01, 3, 200)
+    fig, ax = plt.subplots(3, 1)
+    _, response = freqz_comb(
+        delay, gain, feedback, w=w, ax=ax, style='tristacked', return_response=True
+    )
+    np.testing.assert_allclose(response.h, _utils.freqz_tf(num, den, w), atol=1e-12)
+    np.testing.assert_allclose(
+        response.group_delay, _utils.group_delay(num, den, w), atol=1e-10
+    )
+
+
+@pytest.mark.parametrize(
+    ('function', 'args', 'match'),
+    [
+        (freqz_cic, (0,), "'R' must be a positive integer"),
+        (freqz_cic, (2, 1.5), "'M' must be a positive integer"),
+        (freqz_comb, (0,), "'delay' must be a positive integer"),
+        (freqz_comb, (4, [1, -1]), "'gain' must be a scalar"),
+    ],
+)
+def test_freqz_structured_errors(function, args, match):
+    with pytest.raises(ValueError, match=match):
+        function(*args)
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [
+        {'cache': True},
+        {'cache': ResponseCache()},
+        {'adaptive': True},
+        {'precision': 'single'},
+        {'max_memory': 2**20},
+        {'workers': 2},
+        {'linear_phase': None},
+    ],
+)
+@pytest.mark.parametrize('function', [freqz_moving_average, freqz_comb])
+def test_freqz_closed_form_evaluation_arguments(function, kwargs):
+    with pytest.raises(ValueError, match=f"'{next(iter(kwargs))}' is not supported"):
+        function(4, **kwargs)
@@ -1,6 +1,19 @@
 import matplotlib.pyplot as plt
+import numpy as np
+import pytest
 from matplotlib.testing.decorators import check_figures_equal, image_comparison
-from mplsignal.plane_plots import splane, splane_tf, zplane, zplane_tf
+from mplsignal import _utils
+from mplsignal.plane_plots import (
+    _density_extent,
+    _get_multiplicities,
+    _get_positions,
+    _histogram_plane,
+    _radial_offsets,
+    splane,
+    splane_tf,
+    zplane,
+    zplane_tf,
+)
 
 
 @image_comparison(['zplane.png'], style="mpl20")
@@ -74,3 +87,136 @@ def test_splane_tf():
     num = [1, 0, 1]
     den = [1, 1.2, 0.5]
     splane_tf(num, den, ax=ax)
+
+
+def test_get_multiplicities():
+    # Roots close to zero are grouped using the absolute tolerance
+    positions, multiplicities = _get_multiplicities(
+        [1e-17, 0.5 + 0.5j, -1e-17j, 0, 0.5 + 0.5j, 2]
+    )
+    np.testing.assert_allclose(positions, [0, 0.5 + 0.5j, 2], atol=1e-16)
+    np.testing.assert_array_equal(multiplicities, [3, 2, 1])
+    # Groups are connected components of close pairs
+    positions, multiplicities = _get_multiplicities([0, 1, 2, 0.9, 1.9, 0.8], atol=0.15)
+    np.testing.assert_allclose(positions, [0, 0.9, 1.95])
+    np.testing.assert_array_equal(multiplicities, [1, 3, 2])
+    positions, multiplicities = _get_multiplicities([])
+    assert positions.size == 0
+    assert multiplicities.size == 0
+
+
+def test_get_multiplicities_shared_real_part():
+    # Roots on the imaginary axis share the real part, but only neighbours are
+    # compared
+    x = 1j * np.repeat(np.arange(8000), [2, 1] * 4000)
+    positions, multiplicities = _get_multiplicities(x)
+    np.testing.assert_array_equal(positions, 1j * np.arange(8000))
+    np.testing.assert_array_equal(multiplicities, [2, 1] * 4000)
+    # Pairs in adjacent cells of the grid
+    positions, multiplicities = _get_multiplicities(
+        [0.19 + 0.21j, 0.21 + 0.19j, 0.19 + 0.19j, 0.5, 0.21 + 0.21j, 0.61], atol=0.1
+    )
+    np.testing.assert_allclose(positions, [0.2 + 0.2j, 0.5, 0.61])
+    np.testing.assert_array_equal(multiplicities, [4, 1, 1])
+
+
+def test_get_positions():
+    x, y, texts = _get_positions(np.array([1 + 2j, 3j]), np.array([1, 4]))
+    assert isinstance(x, np.ndarray)
+    np.testing.assert_array_equal(x, [1, 0])
+    np.testing.assert_array_equal(y, [2, 3])
+    assert texts == [(0, 3, "4")]
+
+
+@check_figures_equal(extensions=["png"])
+def test_zplane_tolerance(fig_test, fig_ref):
+    # A triple zero spreads by about eps**(1/3) when computed from polynomials
+    zeros = np.roots(np.poly([0.5, 0.5, 0.5]))
+    zplane(zeros, [0.2], ax=fig_test.add_subplot(), rtol=1e-4)
+    zplane([0.5] * 3, [0.2], ax=fig_ref.add_subplot())
+
+
+@check_figures_equal(extensions=["png"])
+def test_zplane_label_layout_none(fig_test, fig_ref):
+    zeros = [0.2 + 0.8j, 0.2 - 0.8j] * 3
+    poles = [-0.7] * 2
+    props = {'color': 'b', 'fontsize': 20}
+    ax_test = fig_test.add_subplot()
+    zplane(zeros, poles, ax=ax_test, multiplicity_props=props, label_layout='none')
+    # All texts are drawn by one artist
+    assert len(ax_test.texts) == 0
+    assert len(ax_test.artists) == 1
+    ax_ref = fig_ref.add_subplot()
+    zplane([0.2 + 0.8j, 0.2 - 0.8j], [-0.7], ax=ax_ref)
+    for x, y, text in ((0.2, 0.8, "3"), (0.2, -0.8, "3"), (-0.7, 0, "2")):
+        ax_ref.text(x, y, text, **props)
+
+
+def test_zplane_label_layout_fast():
+    fig, ax = plt.subplots()
+    zplane([0.5j, 0.5j, -0.5j, -0.5j], ax=ax, label_layout='fast')
+    fig.canvas.draw()
+    with pytest.raises(ValueError, match="is not a valid value for label_layout"):
+        zplane([0.5j], ax=ax, label_layout='bad')
+
+
+def test_radial_offsets():
+    xy = np.array([[11.0, 0], [0, -11], [0, 0], [11, 0.1]])
+    offsets = _radial_offsets(xy, np.zeros(2), 2)
+    np.testing.assert_allclose(offsets[:3], [[2, 0], [0, -2], [np.sqrt(2)] * 2])
+    # The last text shares a cell with the first and is moved further out
+    np.testing.assert_allclose(offsets[3], 4 * xy[3] / np.hypot(*xy[3]))
+
+
+def _random_roots(n, seed):
+    rng = np.random.default_rng(seed)
+    return rng.standard_normal(n) * 0.4 + 1j * rng.standard_normal(n) * 0.4
+
+
+@check_figures_equal(extensions=["png"])
+def test_zplane_density(fig_test, fig_ref):
+    zeros = _random_roots(100_000, 0)
+    poles = _random_roots(50_000, 1) + 0.3
+    extent = (-1.5, 1.5, -1.2, 1.2)
+    ax_test = fig_test.add_subplot()
+    zplane(zeros, poles, ax=ax_test, mode='density', bins=(60, 40), extent=extent)
+    assert len(ax_test.lines) == 2
+    ax_ref = fig_ref.add_subplot()
+    zplane(ax=ax_ref)
+    for items, cmap in ((zeros, 'Blues'), (poles, 'Reds')):
+        counts, _, _ = np.histogram2d(
+            items.real, items.imag, bins=(60, 40), range=(extent[:2], extent[2:])
+        )
+        ax_ref.imshow(
+            np.ma.masked_equal(counts.T, 0),
+            extent=extent,
+            cmap=cmap,
+            norm='log',
+            interpolation='nearest',
+            origin='lower',
+            aspect='auto',
+        )
+    ax_ref.axis('equal')
+
+
+def test_histogram_plane_chunks(monkeypatch):
+    items = np.concatenate((_random_roots(1000, 2), [np.nan, 1.0 + 1.0j, 5.0]))
+    extent = (-1.0, 1.0, -1.0, 1.0)
+    expected, _, _ = np.histogram2d(
+        items.real, items.imag, bins=(16, 8), range=(extent[:2], extent[2:])
+    )
+    monkeypatch.setattr(_utils, '_BLOCK_ELEMENTS', 100)
+    np.testing.assert_array_equal(_histogram_plane(items, extent, 16, 8), expected.T)
+
+
+def test_density_extent():
+    # The unit circle is included with a margin
+    np.testing.assert_allclose(
+        _density_extent([np.array([0.5j, np.inf])], True), (-1.1, 1.1, -1.1, 1.1)
+    )
+    np.testing.assert_allclose(
+        _density_extent([np.array([2 + 1j]), np.array([4 + 2j])], False),
+        (1.9, 4.1, 0.9, 2.1),
+    )
+    with pytest.raises(ValueError, match="is not a valid value for mode"):
+        zplane([0.5j], mode='bad')
@@ -0,0 +1,153 @@
+#!/usr/bin/env python
+
+# Copyright (c) Oscar Gustafsson.
+# Distributed under the terms of the Modified BSD License.
+
+
+import io
+import json
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.testing.decorators import check_figures_equal
+from mplsignal import _roots
+from mplsignal.freq_plots import freqz
+from mplsignal.plane_plots import zplane
+from mplsignal.render import load_specs, main, render_batch, render_spec
+
+SPECS = [
+    {'name': 'lowpass', 'num': [1, 2, 1], 'den': [1, -1.2, 0.5]},
+    {
+        'name': 'pz',
+        'plot': 'zplane',
+        'zeros': ['1j', '-1j'],
+        'poles': ['0.5+0.5j', '0.5-0.5j'],
+    },
+    {'sos': [[1, 2, 1, 1, -1.2, 0.5]], 'style': 'tristacked', 'figsize': [4, 6]},
+    {'name': 'broken', 'num': [1, 2, 1]},
+]
+
+
+@check_figures_equal(extensions=['png'])
+def test_render_spec_freqz(fig_test, fig_ref):
+    ax = fig_ref.subplots(3, 1)
+    freqz([1, 2, 1], [1, -1.2, 0.5], ax=ax, style='tristacked', w=128)
+    render_spec(
+        {'num': [1, 2, 1], 'den': [1, -1.2, 0.5], 'style': 'tristacked', 'w': 128},
+        fig_test,
+    )
+
+
+@check_figures_equal(extensions=['png'])
+def test_render_spec_zplane(fig_test, fig_ref):
+    zplane([1j, -1j], [0.5 + 0.5j, 0.5 - 0.5j], ax=fig_ref.add_subplot())
+    render_spec(
+        {'plot': 'zplane', 'num': [1, 0, 1], 'den': [1, -1, 0.5]},
+        fig_test,
+    )
+
+
+def test_render_spec_zplane_roots(monkeypatch):
+    calls = []
+
+    def roots(coeffs, method='auto'):
+        calls.append(len(coeffs))
+        return np.roots(coeffs)
+
+    # The same root finding as zplane_tf, e.g., for linear-phase filters
+    monkeypatch.setattr(_roots, 'roots', roots)
+    render_spec({'plot': 'zplane', 'num': [1, 2, 3, 2, 1], 'den': [1, -0.5]})
+    render_spec({'plot': 'zplane', 'sos': [[1, 2, 1, 1, -1.2, 0.5]]})
+    assert calls == [5, 2, 3, 3]
+
+
+def test_render_spec_reuses_figure():
+    fig = render_spec(SPECS[2])
+    assert len(fig.axes) == 3
+    assert tuple(fig.get_size_inches()) == (4, 6)
+    assert render_spec(SPECS[1], fig) is fig
+    assert len(fig.axes) == 1
+
+
+def test_render_spec_unknown_plot():
+    with pytest.raises(ValueError, match="Unknown plot: 'splane'"):
+        render_spec({'plot': 'splane', 'zeros': [1]})
+
+
+@pytest.mark.parametrize('processes', [1, 2])
+def test_render_batch(tmp_path, processes):
+    summary = render_batch(SPECS, tmp_path / 'images', processes=processes)
+    assert sorted(path.name for path in summary.rendered) == [
+        '00002.png',
+        'lowpass.png',
+        'pz.png',
+    ]
+    assert all(path.exists() for path in summary.rendered)
+    assert summary.failed == [
+        ('broken', "ValueError: At least one of 'den' and 'poles' must be provided.")
+    ]
+    assert summary.throughput > 0
+    assert "Rendered 3 of 4 figures" in str(summary)
+    plt.close('all')
+
+
+def test_render_batch_names(tmp_path):
+    specs = [
+        {'name': '../escaped', 'num': [1, 1], 'den': [1]},
+        {'name': '..', 'num': [1, 1], 'den': [1]},
+        {'name': 'lowpass', 'num': [1, 1], 'den': [1]},
+        {'name': 'lowpass', 'num': [1, -1], 'den': [1]},
+    ]
+    summary = render_batch(specs, tmp_path / 'images', processes=1)
+    assert [path.name for path in summary.rendered] == ['lowpass.png']
+    assert summary.failed == [
+        (
+            '../escaped',
+            "ValueError: Invalid name '../escaped'; names must be file names.",
+        ),
+        ('..', "ValueError: Invalid name '..'; names must be file names."),
+        ('lowpass', "ValueError: Duplicate name 'lowpass'."),
+    ]
+    assert not (tmp_path / 'escaped.png').exists()
+    plt.close('all')
+
+
+@pytest.mark.parametrize('processes', [0, -1])
+def test_render_batch_processes(tmp_path, processes):
+    with pytest.raises(ValueError, match="'processes' must be at least 1"):
+        render_batch(SPECS, tmp_path, processes=processes)
+
+
+def test_load_specs(tmp_path):
+    lines = ['# Comment', '', *(json.dumps(spec) for spec in SPECS)]
+    path = tmp_path / 'specs.jsonl'
+    path.write_text('\n'.join(lines))
+    assert load_specs(path) == SPECS
+    assert load_specs(io.StringIO('\n'.join(lines))) == SPECS
+    with pytest.raises(ValueError, match="Line 2: invalid JSON"):
+        load_specs(io.StringIO('{}\n{'))
+    with pytest.raises(ValueError, match="Line 1: spec must be a JSON object"):
+        load_specs(io.StringIO('[1, 2]'))
+
+
+def test_main(tmp_path, capsys):
+    path = tmp_path / 'specs.jsonl'
+    path.write_text('\n'.join(json.dumps(spec) for spec in SPECS[:2]))
+    output = tmp_path / 'out'
+    assert main([str(path), '-o', str(output), '-j', '1', '--dpi', '20']) == 0
+    assert "Rendered 2 of 2 figures" in capsys.readouterr().out
+    assert (output / 'lowpass.png').exists()
+    assert main([str(path), '-o', str(output), '--format', 'svg', '-j', '1']) == 0
+    assert (output / 'pz.svg').exists()
+    path.write_text(json.dumps(SPECS[3]))
+    assert main([str(path), '-o', str(output), '-j', '1']) == 1
+
+
+def test_main_processes(tmp_path, capsys):
+    path = tmp_path / 'specs.jsonl'
+    path.write_text('\n'.join(json.dumps(spec) for spec in SPECS))
+    with pytest.raises(SystemExit) as excinfo:
+        main([str(path), '-o', str(tmp_path), '-j', '0'])
+    assert excinfo.value.code == 2
+    assert "must be at least 1" in capsys.readouterr().err
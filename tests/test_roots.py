@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+
+# Copyright (c) Oscar Gustafsson.
+# Distributed under the terms of the Modified BSD License.
+
+
+import numpy as np
+import pytest
+from matplotlib.testing.decorators import check_figures_equal
+from mplsignal import zplane_tf
+from mplsignal._roots import roots
+
+
+def _lowpass(numtaps, cutoff=0.33):
+    n = np.arange(numtaps) - (numtaps - 1) / 2
+    return cutoff * np.sinc(cutoff * n) * np.hamming(numtaps)
+
+
+def _assert_roots_close(actual, desired, atol):
+    assert actual.shape == desired.shape
+    # Each root is close to a root of the other set
+    distances = np.abs(actual[:, np.newaxis] - desired)
+    assert distances.min(axis=0).max() < atol
+    assert distances.min(axis=1).max() < atol
+
+
+@pytest.mark.parametrize(
+    "num",
+    [
+        _lowpass(41),
+        _lowpass(40),
+        np.convolve(_lowpass(39), [1, 0, -1]),
+        np.convolve(_lowpass(39), [1, -1]),
+        [1, -2.5, 1],
+        [1, 1],
+    ],
+)
+def test_roots_linear_phase(num):
+    _assert_roots_close(roots(num, 'linear_phase'), np.roots(num), 1e-9)
+
+
+def test_roots_linear_phase_unit_circle():
+    num = _lowpass(801)
+    found = roots(num)
+    assert found.size == 800
+    assert np.count_nonzero(np.abs(np.abs(found) - 1) < 1e-12) > 500
+    # Evaluate inside the unit circle, where the polynomial does not overflow
+    inside = found[np.abs(found) <= 1]
+    assert np.abs(np.polyval(num, inside)).max() < 1e-14
+
+
+def test_roots_aberth():
+    rng = np.random.default_rng(0)
+    num = rng.standard_normal(301)
+    _assert_roots_close(roots(num, 'aberth'), np.roots(num), 1e-10)
+
+
+def test_roots_aberth_magnitudes():
+    # Roots spanning many orders of magnitude
+    desired = np.array([1e-6, 1e-3, 0.5 + 0.5j, 0.5 - 0.5j, 10, 1e4])
+    _assert_roots_close(
+        roots(np.poly(desired), 'aberth'), desired, 1e-12 * np.abs(desired).max()
+    )
+
+
+def test_roots_zeros():
+    found = roots([0, 1, -3, 2, 0, 0], 'aberth')
+    _assert_roots_close(found, np.array([1, 2, 0, 0]), 1e-12)
+    assert roots([0, 0]).size == 0
+    assert roots([2]).size == 0
+
+
+def test_roots_errors():
+    with pytest.raises(ValueError, match="not a valid value for method"):
+        roots([1, 2, 3], 'qr')
+    with pytest.raises(ValueError, match="requires real symmetric"):
+        roots([1, 2, 3], 'linear_phase')
+
+
+@check_figures_equal(extensions=["png"])
+def test_zplane_tf_method(fig_test, fig_ref):
+    num = _lowpass(41)
+    zplane_tf(num, ax=fig_test.subplots(), method='linear_phase')
+    zplane_tf(num, ax=fig_ref.subplots(), method='eig')
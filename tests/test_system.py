@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+# Copyright (c) Oscar Gustafsson.
+# Distributed under the terms of the Modified BSD License.
+
+
+import numpy as np
+import pytest
+from matplotlib.testing.decorators import check_figures_equal
+from mplsignal import DiscreteSystem, _roots, freqz, zplane
+from mplsignal._utils import freqz_sos, freqz_ss, freqz_tf, freqz_zpk
+
+NUM = np.array([0.2, 0.3, 0.2])
+DEN = np.array([1.0, -1.1, 0.8, -0.2])
+
+
+def test_system_conversions():
+    w = np.linspace(0, np.pi, 64)
+    system = DiscreteSystem(num=NUM, den=DEN)
+    h = freqz_tf(NUM, DEN, w)
+    zeros, poles, gain = system.zpk
+    # The shorter numerator adds a zero at the origin
+    assert zeros.size == poles.size == 3
+    np.testing.assert_allclose(freqz_zpk(zeros, poles, gain, w), h)
+    np.testing.assert_allclose(freqz_sos(system.sos, w), h)
+    assert system.sos.shape == (2, 6)
+    np.testing.assert_allclose(freqz_ss(*system.ss, w)[0, 0], h)
+
+
+@pytest.mark.parametrize("representation", ['zpk', 'sos', 'ss'])
+def test_system_to_tf(representation):
+    w = np.linspace(0, np.pi, 64)
+    system = DiscreteSystem(num=NUM, den=DEN)
+    if representation == 'zpk':
+        zeros, poles, gain = system.zpk
+        converted = DiscreteSystem(zeros=zeros, poles=poles, gain=gain)
+    else:
+        converted = DiscreteSystem(**{representation: getattr(system, representation)})
+    np.testing.assert_allclose(freqz_tf(*converted.tf, w), freqz_tf(NUM, DEN, w))
+    # Second-order sections of odd order have a pole and a zero at the origin
+    poles = converted.zpk[1]
+    np.testing.assert_allclose(
+        np.sort_complex(poles[poles != 0]), np.sort_complex(system.zpk[1])
+    )
+
+
+def test_system_cached(monkeypatch):
+    calls = []
+
+    def roots(coeffs, method='auto'):
+        calls.append(method)
+        return np.roots(coeffs)
+
+    monkeypatch.setattr(_roots, 'roots', roots)
+    system = DiscreteSystem(num=NUM, den=DEN)
+    assert system.zpk is system.zpk
+    zplane(system)
+    assert len(calls) == 2
+    styles = ('stacked', 'magnitude', 'phase', 'group_delay', 'tristacked')
+    for style in styles:
+        freqz(system, style=style)
+    misses = system.cache.misses
+    for style in styles:
+        freqz(system, style=style)
+    assert system.cache.misses == misses
+    with pytest.raises(ValueError, match="read-only"):
+        system.tf[0][0] = 1
+
+
+@check_figures_equal(extensions=["png"])
+def test_freqz_system(fig_test, fig_ref):
+    freqz(DiscreteSystem(num=NUM, den=DEN), ax=fig_test.subplots(2), style='stacked')
+    freqz(NUM, DEN, ax=fig_ref.subplots(2), style='stacked')
+
+
+@check_figures_equal(extensions=["png"])
+def test_zplane_system(fig_test, fig_ref):
+    zeros = [0.5 + 0.5j, 0.5 - 0.5j]
+    poles = [0.8, -0.3, 0]
+    zplane(DiscreteSystem(zeros=zeros, poles=poles), ax=fig_test.subplots())
+    zplane(zeros, poles, ax=fig_ref.subplots())
+
+
+def test_system_errors():
+    with pytest.raises(ValueError, match="Exactly one of"):
+        DiscreteSystem(num=NUM, den=DEN, sos=[[1, 0, 0, 1, 0, 0]])
+    with pytest.raises(ValueError, match="must be provided together"):
+        DiscreteSystem(num=NUM)
+    with pytest.raises(ValueError, match="shape"):
+        DiscreteSystem(sos=[1, 2, 3])
+    with pytest.raises(ValueError, match="single input and output"):
+        DiscreteSystem(ss=(np.eye(2), np.eye(2), np.eye(2), 0)).tf
+    with pytest.raises(ValueError, match="complex-conjugate pairs"):
+        DiscreteSystem(zeros=[1j], poles=[0.5]).sos
+    with pytest.raises(ValueError, match="cannot be combined"):
+        freqz(DiscreteSystem(num=NUM, den=DEN), DEN)
+    with pytest.raises(ValueError, match="cannot be combined"):
+        zplane(DiscreteSystem(num=NUM, den=DEN), [0.5])
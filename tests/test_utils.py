@@ -0,0 +1,741 @@
+#!/usr/bin/env python
+
+# Copyright (c) Oscar Gustafsson.
+# Distributed under the terms of the Modified BSD License.
+
+
+import numpy as np
+import pytest
+from mplsignal import _utils
+
+
+def _freqz_tf_direct(num, den, w):
+    wexp = np.exp(-1j * np.asarray(w))
+    return np.polynomial.polynomial.polyval(
+        wexp, num
+    ) / np.polynomial.polynomial.polyval(wexp, den)
+
+
+@pytest.mark.parametrize(
+    'w,period',
+    [
+        (np.linspace(0, np.pi, 512, endpoint=False), 1024),
+        (np.linspace(0, np.pi, 513), 1024),
+        (np.linspace(0, 2 * np.pi, 300, endpoint=False), 300),
+        (np.linspace(0, 0.3, 100), None),
+        (np.linspace(0.1, np.pi, 100), None),
+        (np.array([0.0]), None),
+    ],
+)
+def test_uniform_grid_period(w, period):
+    assert _utils._uniform_grid_period(w) == period
+
+
+@pytest.mark.parametrize(
+    'w',
+    [
+        np.linspace(0, np.pi, 512, endpoint=False),
+        np.linspace(0, np.pi, 33),
+        np.linspace(0, 2 * np.pi, 64, endpoint=False),
+        np.linspace(0, 0.3, 50),
+    ],
+)
+@pytest.mark.parametrize('length', [3, 100])
+def test_freqz_tf_fft(w, length):
+    rng = np.random.default_rng(1)
+    num = rng.standard_normal(length)
+    den = [1, -1.2, 0.5]
+    np.testing.assert_allclose(
+        _utils.freqz_tf(num, den, w), _freqz_tf_direct(num, den, w), atol=1e-10
+    )
+
+
+def test_freqz_tf_fft_complex():
+    w = np.linspace(0, np.pi, 65)
+    num = [1, 1j, 0.5 - 0.5j]
+    den = [1, 0.5j]
+    np.testing.assert_allclose(
+        _utils.freqz_tf(num, den, w), _freqz_tf_direct(num, den, w), atol=1e-12
+    )
+
+
+@pytest.mark.parametrize(
+    'w', [np.linspace(0, np.pi, 64, endpoint=False), np.linspace(0, 0.3, 50)]
+)
+def test_freqz_tf_batched(w):
+    rng = np.random.default_rng(2)
+    num = rng.standard_normal((5, 7))
+    den = np.column_stack((np.ones(5), 0.5 * rng.uniform(-1, 1, (5, 2))))
+    h = _utils.freqz_tf(num, den, w)
+    assert h.shape == (5, len(w))
+    for k in range(5):
+        np.testing.assert_allclose(h[k], _utils.freqz_tf(num[k], den[k], w))
+
+
+def test_freqz_zpk_batched():
+    rng = np.random.default_rng(3)
+    w = np.linspace(0, np.pi, 100)
+    zeros = rng.standard_normal((4, 3)) + 1j * rng.standard_normal((4, 3))
+    poles = 0.9 * np.exp(1j * rng.uniform(0, np.pi, (4, 2)))
+    gain = np.array([1.0, 2.0, 0.5, 3.0])
+    h = _utils.freqz_zpk(zeros, poles, gain, w)
+    assert h.shape == (4, len(w))
+    for k in range(4):
+        np.testing.assert_allclose(
+            h[k], _utils.freqz_zpk(zeros[k], poles[k], gain[k], w)
+        )
+
+
+@pytest.mark.parametrize(
+    'w', [np.linspace(0, np.pi, 256, endpoint=False), np.linspace(0.1, 0.3, 77)]
+)
+def test_group_delay(w):
+    # Group delay of a single pole at 0.9 in closed form
+    pole = 0.9
+    expected = (pole * np.cos(w) - pole**2) / (1 - 2 * pole * np.cos(w) + pole**2)
+    np.testing.assert_allclose(_utils.group_delay([1], [1, -pole], w), expected)
+    np.testing.assert_allclose(_utils.group_delay_zpk([0], [pole], w), expected)
+    np.testing.assert_allclose(_utils.group_delay_zpk([], [pole], w), expected + 1)
+
+
+def test_group_delay_tf_zpk():
+    w = np.linspace(0, np.pi, 100)
+    zeros = [0.5 + 0.5j, 0.5 - 0.5j, -1.2]
+    poles = [0.8j, -0.8j, 0.3]
+    gd_tf = _utils.group_delay(np.poly(zeros), np.poly(poles), w)
+    gd_zpk = _utils.group_delay_zpk(zeros, poles, w)
+    np.testing.assert_allclose(gd_tf, gd_zpk, atol=1e-12)
+
+
+def test_group_delay_zero_on_unit_circle():
+    w = np.linspace(0, np.pi, 5)
+    gd = _utils.group_delay([1, 2, 1], [1], w)
+    np.testing.assert_allclose(gd, [1, 1, 1, 1, np.nan])
+
+
+_SOS = np.array(
+    [
+        [1.0, 2.0, 1.0, 1.0, -1.2, 0.5],
+        [1.0, -0.5, 0.25, 1.0, 0.3, 0.8],
+    ]
+)
+
+
+@pytest.mark.parametrize(
+    'w', [np.linspace(0, np.pi, 64, endpoint=False), np.linspace(0.1, 0.3, 50)]
+)
+def test_freqz_sos(w):
+    num = np.convolve(_SOS[0, :3], _SOS[1, :3])
+    den = np.convolve(_SOS[0, 3:], _SOS[1, 3:])
+    h = _utils.freqz_tf(num, den, w)
+    np.testing.assert_allclose(_utils.freqz_sos(_SOS, w), h)
+    np.testing.assert_allclose(_utils.freqz_sos_db(_SOS, w), 20 * np.log10(np.abs(h)))
+    np.testing.assert_allclose(
+        _utils.group_delay_sos(_SOS, w), _utils.group_delay(num, den, w)
+    )
+
+
+def test_freqz_sos_db_high_order():
+    # 400 sections with a gain of 100 each would overflow as a product
+    sos = np.tile([100.0, 0.0, 0.0, 1.0, 0.0, 0.0], (400, 1))
+    w = np.linspace(0, np.pi, 8)
+    np.testing.assert_allclose(_utils.freqz_sos_db(sos, w), 16000)
+
+
+def test_freqz_sos_shape_error():
+    with pytest.raises(ValueError, match="'sos' must have shape"):
+        _utils.freqz_sos([[1, 2, 3, 4, 5]], [0.1])
+
+
+@pytest.mark.parametrize(
+    'n,expected', [(1, 1), (6, 6), (7, 8), (11, 12), (97, 100), (1025, 1080)]
+)
+def test_next_fast_len(n, expected):
+    assert _utils._next_fast_len(n) == expected
+
+
+@pytest.mark.parametrize(
+    'w,expected',
+    [
+        (np.linspace(0.2, 0.4, 11), (0.2, 0.02)),
+        (np.linspace(0, np.pi, 5), (0.0, np.pi / 4)),
+        (np.array([0.1, 0.2, 0.4]), None),
+        (np.linspace(0.4, 0.2, 11), None),
+    ],
+)
+def test_uniform_grid(w, expected):
+    grid = _utils._uniform_grid(w)
+    if expected is None:
+        assert grid is None
+    else:
+        np.testing.assert_allclose(grid, expected)
+
+
+@pytest.mark.parametrize('shape', [(300,), (2, 300)])
+def test_polyval_czt(shape):
+    rng = np.random.default_rng(4)
+    coeffs = rng.standard_normal(shape) + 1j * rng.standard_normal(shape)
+    w = np.linspace(0.2, 0.25, 500)
+    np.testing.assert_allclose(
+        _utils._polyval_czt(coeffs, 0.2, 0.05 / 499, 500),
+        _utils._polyval(np.exp(-1j * w), coeffs),
+        atol=1e-11,
+    )
+
+
+def test_freqz_tf_czt():
+    rng = np.random.default_rng(5)
+    num = rng.standard_normal(2000)
+    den = [1, -1.2, 0.5]
+    w = np.linspace(1.0, 1.1, 1000)
+    np.testing.assert_allclose(
+        _utils.freqz_tf(num, den, w), _freqz_tf_direct(num, den, w), atol=1e-10
+    )
+    np.testing.assert_allclose(
+        _utils.group_delay(num, den, w),
+        _utils.group_delay(num, den, np.concatenate((w, [3.0])))[:-1],
+    )
+
+
+def test_adaptive_grid():
+    # Narrow resonance between the points of the initial grid
+    poles = 0.999 * np.exp([0.71j, -0.71j])
+
+    def response(w):
+        return _utils.freqz_zpk([], poles, 1, w)
+
+    w, h = _utils.adaptive_grid(response, 0, np.pi, 1000, tol=1e-2)
+    assert w.size < 1000
+    assert np.all(np.diff(w) > 0)
+    np.testing.assert_allclose(h, response(w))
+    dense = np.linspace(0, np.pi, 100001)
+    magnitude = 20 * np.log10(np.abs(response(dense)))
+    interpolated = np.interp(dense, w, 20 * np.log10(np.abs(h)))
+    assert np.abs(interpolated - magnitude).max() < 0.2
+
+
+def test_adaptive_grid_roots():
+    # Resonance too narrow to be found without the pole positions
+    poles = 0.99999 * np.exp([1.2345j, -1.2345j])
+
+    def response(w):
+        return _utils.freqz_zpk([], poles, 1, w)
+
+    w, h = _utils.adaptive_grid(response, 0, np.pi, 1000, roots=poles)
+    assert np.abs(h).max() > 0.5 * np.abs(response(1.2345))
+
+
+def test_adaptive_grid_roots_max_points():
+    # More roots close to the unit circle than points
+    poles = 0.999 * np.exp(1j * np.linspace(0.1, 3, 60))
+
+    def response(w):
+        return _utils.freqz_zpk([], poles, 1, w)
+
+    w, h = _utils.adaptive_grid(response, 0, np.pi, 40, roots=poles)
+    assert w.size <= 40
+    np.testing.assert_allclose(h, response(w))
+    # The seeds at the angles of the roots are kept first
+    assert np.isin(np.angle(poles[:7]), w).all()
+
+
+def test_adaptive_grid_log():
+    poles = 0.999 * np.exp([0.01j, -0.01j])
+
+    def response(w):
+        return _utils.freqz_zpk([], poles, 1, w)
+
+    w, h = _utils.adaptive_grid(response, 1e-4, np.pi, 500, log=True)
+    np.testing.assert_allclose(w[[0, -1]], [1e-4, np.pi])
+    assert np.all(np.diff(w) > 0)
+    np.testing.assert_allclose(h, response(w))
+    # The initial grid is uniform in the exponents
+    assert np.count_nonzero(w < 1e-2) > np.count_nonzero(w > 1)
+    with pytest.raises(ValueError, match="0 < w0 < w1"):
+        _utils.adaptive_grid(response, 0, np.pi, 500, log=True)
+
+
+def test_adaptive_grid_max_points():
+    def response(w):
+        return _utils.freqz_tf(np.hanning(100), [1], w)
+
+    w, h = _utils.adaptive_grid(response, 0, np.pi, 100, tol=1e-6)
+    assert w.size == 100
+
+
+@pytest.mark.parametrize(
+    'w',
+    [
+        np.linspace(0, np.pi, 4096, endpoint=False),
+        np.linspace(0.1, 0.2, 5000),
+        np.linspace(0.1, 3, 300) ** 1.01,
+    ],
+)
+def test_single_precision_tf(w):
+    # Elliptic filter with 80 dB stopband attenuation
+    num = [0.0101, 0.0052, 0.0282, 0.0196, 0.0377, 0.0196, 0.0282, 0.0052, 0.0101]
+    den = [1, -4.0146, 8.5633, -11.9347, 11.8057, -8.4094, 4.2045, -1.3522, 0.2165]
+    h = _utils.freqz_tf(num, den, w, dtype=np.complex64)
+    assert h.dtype == np.complex64
+    np.testing.assert_allclose(h, _utils.freqz_tf(num, den, w), rtol=1e-3)
+    gd = _utils.group_delay(num, den, w, dtype=np.complex64)
+    assert gd.dtype == np.float32
+    expected = _utils.group_delay(num, den, w)
+    assert np.abs(gd - expected).max() <= 1e-3 * np.maximum(1, np.abs(expected)).max()
+
+
+def test_single_precision_zpk():
+    zeros = np.exp([0.5j, -0.5j, 1j, -1j])
+    poles = 0.9999 * np.exp([0.3j, -0.3j])
+    w = np.linspace(0, np.pi, 1001)
+    h = _utils.freqz_zpk(zeros, poles, 2, w, dtype=np.complex64)
+    assert h.dtype == np.complex64
+    expected = _utils.freqz_zpk(zeros, poles, 2, w)
+    np.testing.assert_allclose(h, expected, rtol=1e-3, atol=1e-12)
+    gd = _utils.group_delay_zpk(zeros, poles, w, dtype=np.complex64)
+    assert gd.dtype == np.float32
+    expected = _utils.group_delay_zpk(zeros, poles, w)
+    finite = np.isfinite(expected)
+    np.testing.assert_array_equal(np.isfinite(gd), finite)
+    np.testing.assert_allclose(
+        gd[finite], expected[finite], atol=1e-3 * np.abs(expected[finite]).max()
+    )
+
+
+def test_single_precision_guard():
+    # Close to w = 0, the value is far below the rounding errors of the coefficients
+    den = np.poly([0.95] * 6)
+    w = np.linspace(0.001, 3, 200)
+    values, error = _utils._polyval_grid_error(den, w, single=True)
+    expected = (1 - 0.95 * np.exp(-1j * w)) ** 6
+    assert np.abs(values / expected - 1).max() > 1e-2
+    assert (error > _utils._SINGLE_RTOL).any()
+    h = _utils.freqz_tf([1], den, w, dtype=np.complex64)
+    assert h.dtype == np.complex64
+    np.testing.assert_allclose(h, 1 / expected, rtol=1e-3)
+
+
+def test_single_precision_sos():
+    sos = [[1, 2, 1, 1, -1.2, 0.5], [1, 0, -1, 1, 0.3, 0.6]]
+    w = np.linspace(0, np.pi, 100)
+    h = _utils.freqz_sos(sos, w, dtype=np.complex64)
+    assert h.dtype == np.complex64
+    np.testing.assert_allclose(h, _utils.freqz_sos(sos, w), rtol=1e-3)
+    db = _utils.freqz_sos_db(sos, w, dtype=np.complex64)
+    assert db.dtype == np.float32
+    np.testing.assert_allclose(db, _utils.freqz_sos_db(sos, w), atol=1e-3)
+
+
+def test_unsupported_dtype():
+    with pytest.raises(ValueError, match="Unsupported dtype"):
+        _utils.freqz_tf([1, 1], [1], [0.1], dtype=np.float16)
+
+
+def test_minmax_reduce():
+    values = np.array([[3.0, 1, 2, 5, 4, 0, np.nan, np.nan, 7]])
+    np.testing.assert_array_equal(
+        _utils.minmax_reduce(values, 3),
+        [[3, 1, 5, 0, 7, 7]],
+    )
+    # Extrema are kept in the order they occur; the last bin is shorter
+    np.testing.assert_array_equal(
+        _utils.minmax_reduce(values[0, :8], 2), [3, 1, 2, 5, 4, 0, np.nan, np.nan]
+    )
+    np.testing.assert_array_equal(
+        _utils.minmax_reduce(np.arange(5.0), 2, extrema=False), [0, 1, 2, 3, 4, 4]
+    )
+    np.testing.assert_array_equal(_utils.minmax_reduce(values, 1), values)
+
+
+def test_linear_grid():
+    for n, endpoint in [(512, False), (513, True), (1, True)]:
+        expected = np.linspace(0.1, np.pi, n, endpoint=endpoint)
+        np.testing.assert_array_equal(
+            _utils.linear_grid(0.1, np.pi, n, endpoint, 0, n), expected
+        )
+        np.testing.assert_array_equal(
+            _utils.linear_grid(0.1, np.pi, n, endpoint, n // 2, n), expected[n // 2 :]
+        )
+
+
+def test_unwrap_continued():
+    phase = np.angle(np.exp(-1j * np.linspace(0, 40, 1000)))
+    phase = np.stack((phase, -phase))
+    blocks = np.split(phase, [10, 400, 401], axis=-1)
+    unwrapped = [_utils.unwrap_continued(blocks[0])]
+    for block in blocks[1:]:
+        unwrapped.append(_utils.unwrap_continued(block, unwrapped[-1][..., -1]))
+    np.testing.assert_allclose(np.concatenate(unwrapped, axis=-1), np.unwrap(phase))
+
+
+@pytest.mark.parametrize('max_memory', [2**12, 2**16, 2**30])
+def test_evaluate_blocks(max_memory):
+    n = 10000
+    w = np.linspace(0, np.pi, n)
+    num = np.array([[1, 2, 1], [1, -1, 0.5]])
+
+    def evaluate(w):
+        return {'magnitude': np.abs(_utils.freqz_tf(num, [1, -0.5], w))}
+
+    reduced = _utils.evaluate_blocks(
+        lambda start, stop: w[start:stop], n, evaluate, max_memory, 2, n_bins=100
+    )
+    np.testing.assert_array_equal(
+        reduced['w'], _utils.minmax_reduce(w, 100, extrema=False)
+    )
+    np.testing.assert_allclose(
+        reduced['magnitude'], _utils.minmax_reduce(evaluate(w)['magnitude'], 100)
+    )
+
+
+def test_freqz_zpk_db():
+    zeros = np.array([[-1, 0.5j, -0.5j], [0.9, 0.2, -0.3]])
+    poles = [0.8 * np.exp(0.3j), 0.8 * np.exp(-0.3j), 0.1]
+    gain = [2, -0.5]
+    w = np.linspace(0, np.pi, 200, endpoint=False)
+    with np.errstate(divide='ignore'):
+        expected = 20 * np.log10(np.abs(_utils.freqz_zpk(zeros, poles, gain, w)))
+    np.testing.assert_allclose(_utils.freqz_zpk_db(zeros, poles, gain, w), expected)
+    magnitude = _utils.freqz_zpk_db(zeros, poles, gain, w, dtype=np.complex64)
+    assert magnitude.dtype == np.float32
+    np.testing.assert_allclose(magnitude, expected, atol=1e-3)
+
+
+def test_freqz_zpk_db_high_order():
+    # The products of the distances overflow
+    zeros = np.full(2000, -0.5)
+    poles = np.full(2000, 0.5)
+    w = np.linspace(0, np.pi, 50)
+    x = np.exp(1j * w)
+    expected = 2000 * 20 * np.log10(np.abs(x + 0.5) / np.abs(x - 0.5))
+    np.testing.assert_allclose(_utils.freqz_zpk_db(zeros, poles, 1, w), expected)
+
+
+@pytest.mark.parametrize('dtype', [None, np.complex64])
+def test_workers_bit_identical(dtype):
+    num = [0.0101, 0.0052, 0.0282, 0.0196, 0.0377, 0.0196, 0.0282, 0.0052, 0.0101]
+    den = [1, -4.0146, 8.5633, -11.9347, 11.8057, -8.4094, 4.2045, -1.3522, 0.2165]
+    zeros = np.roots(num)
+    poles = np.roots(den)
+    batch = np.stack([np.hanning(64), np.hamming(64), np.ones(64)])
+    w = np.sort(np.random.default_rng(0).uniform(0, np.pi, 20000))
+    uniform = np.linspace(0, np.pi, 20000, endpoint=False)
+    for function, args in [
+        (_utils.freqz_tf, (num, den, w)),
+        (_utils.freqz_tf, (batch, [1], uniform)),
+        (_utils.group_delay, (num, den, w)),
+        (_utils.freqz_zpk, (zeros, poles, 0.0101, w)),
+        (_utils.freqz_zpk_db, (zeros, poles, 0.0101, w)),
+        (_utils.group_delay_zpk, (zeros, poles, w)),
+    ]:
+        np.testing.assert_array_equal(
+            function(*args, dtype=dtype, workers=4), function(*args, dtype=dtype)
+        )
+
+
+def test_map_chunks():
+    calls = []
+
+    def function(x):
+        calls.append(x.size)
+        return 2 * x
+
+    x = np.arange(10000.0)
+    np.testing.assert_array_equal(
+        _utils._map_chunks(function, x, 3, min_size=1000), 2 * x
+    )
+    assert sorted(calls) == [3333, 3333, 3334]
+    calls.clear()
+    _utils._map_chunks(function, x, 8)
+    # At least 4096 points per chunk
+    assert calls == [5000, 5000]
+
+
+def test_group_delay_from_phase():
+    w = np.linspace(0, np.pi, 11)
+    np.testing.assert_allclose(_utils.group_delay_from_phase(w, -2.5 * w), 2.5)
+    phase = -w.copy()
+    phase[5:] -= 2 * np.pi
+    gd = _utils.group_delay_from_phase(w, phase)
+    np.testing.assert_allclose(gd, 1)
+    assert np.all(np.isnan(_utils.group_delay_from_phase(w[:1], phase[:1])))
+
+
+def test_freqs():
+    w = _utils.log_grid(1e-2, 1e2, 10)
+    s = 1j * w
+    h = _utils.freqs_tf([1, 0], [1, 3, 2], w)
+    np.testing.assert_allclose(h, s / ((s + 1) * (s + 2)))
+    np.testing.assert_allclose(_utils.freqs_zpk([0], [-1, -2], 1, w), h)
+    np.testing.assert_allclose(
+        _utils.freqs_zpk_db([0], [-1, -2], 1, w), 20 * np.log10(np.abs(h))
+    )
+    # -d/dw of pi/2 - arctan(w) - arctan(w/2)
+    gd = 1 / (1 + w**2) + 2 / (4 + w**2)
+    np.testing.assert_allclose(_utils.group_delay_s([1, 0], [1, 3, 2], w), gd)
+    np.testing.assert_allclose(_utils.group_delay_zpk_s([0], [-1, -2], w), gd)
+    np.testing.assert_array_equal(_utils.group_delay_s([2], [1], w), 0)
+
+
+def test_freqs_high_order_db():
+    poles = -np.ones(200)
+    w = np.array([1e-3, 1e3])
+    np.testing.assert_allclose(
+        _utils.freqs_zpk_db([], poles, 1, w),
+        -200 * 10 * np.log10(1 + w**2),
+    )
+
+
+def test_log_grid():
+    w = _utils.log_grid(0.1, 1000, 25)
+    assert w.size == 101
+    assert w[0] == 0.1
+    assert w[-1] == 1000
+    np.testing.assert_allclose(np.diff(np.log10(w)), 1 / 25)
+    assert _utils.log_grid(1, 1.01, 5).size == 2
+    with pytest.raises(ValueError, match="0 < w0 < w1"):
+        _utils.log_grid(0, 1, 10)
+
+
+def test_decade_range():
+    assert _utils.decade_range([-3, 0, -250 + 1j]) == (0.1, 1e4)
+    assert _utils.decade_range([0]) == (0.1, 10.0)
+    assert _utils.decade_range([-50], margin=2) == (0.1, 1e4)
+
+
+def test_envelope_indices():
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 1, 10000)
+    values = rng.standard_normal((2, x.size))
+    values[0, 5000] = 100
+    values[1, 7000:7005] = np.nan
+    values[1, 8000] = -np.inf
+    indices = _utils.envelope_indices(x, values, (0, 1), 100)
+    assert indices.size < 4 * 100 * 2 + 20
+    assert np.all(np.diff(indices) > 0)
+    assert {5000, 6999, 7000, 7004, 7005, 7999, 8000, 8001} <= set(indices)
+    # Extrema of each column are kept
+    column = np.minimum(np.floor(x * 100), 99)
+    for i in (0, 37, 99):
+        kept = indices[column[indices] == i]
+        np.testing.assert_equal(values[0, kept].max(), values[0, column == i].max())
+        np.testing.assert_equal(values[0, kept].min(), values[0, column == i].min())
+    assert _utils.envelope_indices(x, values, (0, 1), 5000) is None
+    assert _utils.envelope_indices(x[::-1], values, (0, 1), 100) is None
+
+
+def test_envelope_indices_log():
+    x = np.logspace(-3, 3, 60000)
+    values = np.sin(x)
+    indices = _utils.envelope_indices(x, values, (1e-3, 1e3), 100, log=True)
+    # Each decade of the log axis gets the same number of columns
+    counts = np.histogram(np.log10(x[indices]), bins=6, range=(-3, 3))[0]
+    assert counts.max() <= 4 * 100 // 6 + 8
+
+
+@pytest.mark.parametrize(
+    ('length', 'kind'), [(7, 1), (1, 1), (8, 2), (2, 2), (9, 3), (6, 4)]
+)
+def test_fir_linear_phase(length, kind):
+    rng = np.random.default_rng(length)
+    num = rng.standard_normal((2, length))
+    num = num + num[..., ::-1] if kind in (1, 2) else num - num[..., ::-1]
+    assert _utils.fir_linear_phase_type(num) == kind
+    # Arbitrary grid using the series and uniform grid using the FFT
+    for w in (np.sort(rng.uniform(0, 2 * np.pi, 40)), np.linspace(0, np.pi, 64)):
+        amplitude = _utils.fir_amplitude(num, kind, w)
+        assert amplitude.shape == (2, w.size)
+        assert np.isrealobj(amplitude)
+        phase = _utils.fir_phase(num, kind, w, amplitude)
+        np.testing.assert_allclose(
+            np.abs(amplitude) * np.exp(1j * phase),
+            _utils.freqz_tf(num, [1], w),
+            atol=1e-13,
+        )
+
+
+def test_fir_linear_phase_type():
+    assert _utils.fir_linear_phase_type([1, 2, 3]) is None
+    assert _utils.fir_linear_phase_type([1, 2, 3], 1) == 1
+    with pytest.raises(ValueError, match="neither symmetric nor antisymmetric"):
+        _utils.fir_linear_phase_type([1, 2, 3], True)
+    with pytest.raises(ValueError, match="odd number of taps"):
+        _utils.fir_linear_phase_type([1, 1], 1)
+    with pytest.raises(ValueError, match="Unknown linear-phase type"):
+        _utils.fir_linear_phase_type([1, 1], 5)
+
+
+def test_freqz_tf_power():
+    num = np.array([[1, 2, 1], [1, 0, -1]])
+    den = [1, -1.2, 0.5]
+    rng = np.random.default_rng(3)
+    w = np.sort(rng.uniform(0, np.pi, 100))
+    np.testing.assert_allclose(
+        _utils.freqz_tf_power(num, den, w),
+        np.abs(_utils.freqz_tf(num, den, w)) ** 2,
+        rtol=1e-9,
+    )
+    # Deep in the stopband, the power is recomputed from the complex response
+    num = np.convolve(np.hanning(41)[1:-1], np.hanning(41)[1:-1])
+    power = _utils.freqz_tf_power(num, [1], w)
+    np.testing.assert_allclose(
+        power, np.abs(_utils.freqz_tf(num, [1], w)) ** 2, rtol=_utils._POWER_RTOL
+    )
+    assert power.min() < 1e-18
+
+
+def test_freqz_tf_power_transform(monkeypatch):
+    def fir_amplitude(*args, **kwargs):
+        raise AssertionError("The cosine series is not used on FFT grids.")
+
+    # The default grid is evaluated as the squared magnitude of the FFTs
+    monkeypatch.setattr(_utils, 'fir_amplitude', fir_amplitude)
+    num = [1, 2, 1]
+    den = [1, -1.2, 0.5]
+    w = np.linspace(0, np.pi, 512, endpoint=False)
+    np.testing.assert_allclose(
+        _utils.freqz_tf_power(num, den, w),
+        np.abs(_utils.freqz_tf(num, den, w)) ** 2,
+        rtol=1e-12,
+    )
+
+
+def test_autocorrelation():
+    rng = np.random.default_rng(4)
+    for length in (5, 100):
+        coeffs = rng.standard_normal(length)
+        np.testing.assert_allclose(
+            _utils._autocorrelation(coeffs),
+            np.correlate(coeffs, coeffs, 'full')[length - 1 :],
+            atol=1e-12,
+        )
+
+
+def test_freqz_ss():
+    rng = np.random.default_rng(5)
+    A = 0.3 * rng.standard_normal((5, 5))
+    B = rng.standard_normal((5, 2))
+    C = rng.standard_normal((3, 5))
+    D = rng.standard_normal((3, 2))
+    w = np.linspace(0, np.pi, 50)
+    z = np.exp(1j * w)
+    expected = np.stack(
+        [C @ np.linalg.solve(zk * np.eye(5) - A, B) + D for zk in z], axis=-1
+    )
+    h = _utils.freqz_ss(A, B, C, D, w)
+    assert h.shape == (3, 2, 50)
+    np.testing.assert_allclose(h, expected, rtol=1e-10)
+    np.testing.assert_array_equal(_utils.freqz_ss(A, B, C, D, w, workers=2), h)
+    # Group delay as the derivative of the unwrapped phase
+    w = np.linspace(0.5, 0.5 + 1e-6, 2)
+    phase = np.unwrap(np.angle(_utils.freqz_ss(A, B, C, D, w)), axis=-1)
+    np.testing.assert_allclose(
+        _utils.group_delay_ss(A, B, C, D, w)[..., 0],
+        -np.diff(phase, axis=-1)[..., 0] / 1e-6,
+        rtol=1e-4,
+    )
+
+
+def test_freqz_ss_defective():
+    # A Jordan block is not diagonalizable, so the state equations are solved
+    A = [[0.5, 1], [0, 0.5]]
+    w = np.linspace(0, np.pi, 20)
+    z = np.exp(1j * w)
+    h = _utils.freqz_ss(A, [0, 1], [1, 0], 0, w)
+    np.testing.assert_allclose(h[0, 0], 1 / (z - 0.5) ** 2)
+    np.testing.assert_allclose(
+        _utils.group_delay_ss(A, [0, 1], [1, 0], 0, w)[0, 0],
+        2 * _utils.group_delay_zpk([], [0.5], w),
+    )
+    with pytest.raises(ValueError, match="must have shapes"):
+        _utils.freqz_ss(A, [0, 1, 2], [1, 0], 0, w)
+
+
+@pytest.mark.parametrize(
+    'w',
+    [
+        np.linspace(0, np.pi, 64, endpoint=False),  # FFT of the folded taps
+        np.linspace(0.1, 0.3, 50),  # Chirp-z transform
+        np.sort(np.random.default_rng(6).uniform(0, np.pi, 40)),  # Sparse sum
+    ],
+)
+def test_freqz_taps(w):
+    rng = np.random.default_rng(7)
+    indices = np.sort(rng.choice(1000, 12, replace=False))
+    values = rng.standard_normal((2, 12))
+    num = np.zeros((2, 1000))
+    num[:, indices] = values
+    h = _utils.freqz_taps(indices, values, w)
+    np.testing.assert_allclose(h, _utils.freqz_tf(num, [1], w), atol=1e-11)
+    np.testing.assert_array_equal(_utils.freqz_taps(indices, values, w, workers=2), h)
+    np.testing.assert_allclose(
+        _utils.group_delay_taps(indices, values, w),
+        _utils.group_delay(num, [1], w),
+        rtol=1e-8,
+    )
+
+
+def test_freqz_taps_errors():
+    # Repeated indices are summed
+    np.testing.assert_allclose(_utils.freqz_taps([2, 2], [1, 1], [0.0, np.pi]), 2)
+    with pytest.raises(ValueError, match="1-D array of integers"):
+        _utils.freqz_taps([0.5], [1], [0.0])
+    with pytest.raises(ValueError, match="non-negative"):
+        _utils.freqz_taps([-1], [1], [0.0])
+    with pytest.raises(ValueError, match="must have 2 taps"):
+        _utils.freqz_taps([0, 1], [1], [0.0])
+
+
+def test_fir_amplitude_sparse():
+    # Half-band filter with few nonzero taps, summed without Clenshaw's recurrence
+    num = np.zeros(401)
+    num[200] = 0.5
+    num[[199, 201]] = 0.3
+    num[[149, 251]] = -0.05
+    w = np.sort(np.random.default_rng(8).uniform(0, np.pi, 50))
+    amplitude = _utils.fir_amplitude(num, 1, w)
+    np.testing.assert_allclose(
+        amplitude * np.exp(-200j * w), _utils.freqz_tf(num, [1], w), atol=1e-13
+    )
+
+
+@pytest.mark.parametrize('length', [1, 2, 5, 8])
+def test_dirichlet(length):
+    w = np.concatenate(
+        [np.linspace(-7, 13, 101), [0, np.pi, 2 * np.pi, -2 * np.pi, 4 * np.pi]]
+    )
+    h = _utils.freqz_tf(np.ones(length), [1], w) * np.exp(0.5j * (length - 1) * w)
+    np.testing.assert_allclose(_utils.dirichlet(w, length), h.real, atol=1e-13)
+
+
+def test_cic_amplitude():
+    num = np.ones(1)
+    for _ in range(3):
+        num = np.convolve(num, np.ones(6))
+    w = np.sort(np.random.default_rng(9).uniform(0, 2 * np.pi, 100))
+    h = _utils.freqz_tf(num, [1], w)
+    amplitude = _utils.cic_amplitude(6, 3, w, normalize=False)
+    phase = _utils.delay_phase(w, 7.5, amplitude)
+    np.testing.assert_allclose(np.abs(amplitude) * np.exp(1j * phase), h, atol=1e-12)
+    np.testing.assert_allclose(
+        _utils.cic_magnitude_db(6, 3, w), 20 * np.log10(np.abs(h) / 6**3), atol=1e-6
+    )
+    # No underflow for high orders
+    assert np.isfinite(_utils.cic_magnitude_db(6, 200, [0.5])).all()
+
+
+@pytest.mark.parametrize('feedback', [False, True])
+def test_freqz_comb(feedback):
+    w = np.linspace(0, np.pi, 50)
+    polynomial = np.zeros(8)
+    polynomial[0] = 1
+    polynomial[7] = -0.6 if feedback else 0.6
+    num, den = ([1], polynomial) if feedback else (polynomial, [1])
+    np.testing.assert_allclose(
+        _utils.freqz_comb(7, 0.6, w, feedback), _utils.freqz_tf(num, den, w)
+    )
+    np.testing.assert_allclose(
+        _utils.group_delay_comb(7, 0.6, w, feedback),
+        _utils.group_delay(num, den, w),
+        atol=1e-12,
+    )